@@ -0,0 +1,7 @@
+"""
+
+Benchmarks.
+
+Standalone performance checks, run as modules from the repository root
+(e.g. python -m benchmarks.startup).
+"""
@@ -0,0 +1,42 @@
+"""
+
+Benchmark comparison.
+
+Lines up two benchmarks.run result files by case and size and prints the
+speedup (old time / new time; above 1 means the new run is faster).
+
+    python -m benchmarks.compare old.json new.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+def compare(old: dict, new: dict) -> list[dict]:
+    """One row per (case, size) present in both runs."""
+    before = {(r["case"], r["size"]): r["seconds"] for r in old["results"]}
+    rows = []
+    for result in new["results"]:
+        key = (result["case"], result["size"])
+        if key in before:
+            rows.append({
+                "case": key[0], "size": key[1], "old": before[key], "new": result["seconds"],
+                "speedup": before[key] / result["seconds"] if result["seconds"] else None,
+            })
+    return rows
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    args = parser.parse_args(argv)
+    old, new = (json.loads(Path(path).read_text(encoding="utf-8")) for path in (args.old, args.new))
+    print(f"old: {old['meta']['commit']}  new: {new['meta']['commit']}")
+    for row in compare(old, new):
+        speedup = "n/a" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+        print(f"{row['case']:>22} {row['size']:>9,} {row['old'] * 1000:10.1f} ms -> {row['new'] * 1000:10.1f} ms  {speedup}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
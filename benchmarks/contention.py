@@ -0,0 +1,118 @@
+"""
+
+Contention benchmark.
+
+Runs N reader threads (full listings through TaskManager.to_dict_list) and
+M writer threads (add, update, delete by id) against one TaskManager for a
+fixed time, and reports reads/sec, writes/sec and writer latency. Every
+read is checked for torn state (a duplicated id). --mode locked makes
+readers hold the store lock for the whole read instead of using snapshots,
+for comparison.
+
+    python -m benchmarks.contention [--readers N] [--writers N] [--tasks N]
+                                    [--seconds S] [--mode snapshot|locked]
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import date
+from task_manager import Task, TaskManager
+from .generate import generate_tasks
+
+MODES = ("snapshot", "locked")
+TODAY = date.today()
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+def run(readers: int = 4, writers: int = 2, size: int = 10_000, seconds: float = 2.0,
+        mode: str = "snapshot", seed: int = 0) -> dict:
+    """Throughput and writer latency of readers and writers sharing one manager."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}.")
+    manager = TaskManager()
+    manager.ingest([generate_tasks(size, seed)])
+    stop = threading.Event()
+    reads, torn = [0] * readers, [0] * readers
+    write_latencies: list[list[float]] = [[] for _ in range(writers)]
+
+    def reader(n: int) -> None:
+        while not stop.is_set():
+            if mode == "locked":
+                with manager.tasks.lock:
+                    rows = manager.tasks.to_dict_list(include_id=True)
+            else:
+                rows = manager.to_dict_list(include_id=True)
+            if len({row["id"] for row in rows}) != len(rows):
+                torn[n] += 1
+            reads[n] += 1
+
+    def writer(n: int) -> None:
+        rng = random.Random(seed + n)
+        owned: list[int] = []
+        latencies = write_latencies[n]
+        while not stop.is_set():
+            op = rng.random()
+            start = time.perf_counter()
+            if op < 0.4 or not owned:
+                with manager.tasks.lock:
+                    manager.add_task(Task.from_trusted(
+                        f"w{n}", TODAY, TODAY, rng.randint(1, 5), "ns", "",
+                    ))
+                    owned.append(manager.tasks.id_at(-1))
+            elif op < 0.8:
+                task_id = rng.choice(owned)
+                manager.update_task_by_id(task_id, Task.from_trusted(f"w{n}", TODAY, TODAY, 1, "c", ""))
+            else:
+                manager.delete_task_by_id(owned.pop(rng.randrange(len(owned))))
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    latencies = sorted(latency for client in write_latencies for latency in client)
+    return {
+        "mode": mode, "readers": readers, "writers": writers, "tasks": size, "seconds": wall,
+        "reads_per_sec": sum(reads) / wall,
+        "writes_per_sec": len(latencies) / wall,
+        "write_p50_ms": _percentile(latencies, 0.50) * 1000,
+        "write_p99_ms": _percentile(latencies, 0.99) * 1000,
+        "write_max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        "torn_reads": sum(torn),
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Readers vs writers on one TaskManager.")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+    modes = MODES if args.mode == "both" else (args.mode,)
+    results = [run(args.readers, args.writers, args.tasks, args.seconds, mode, args.seed) for mode in modes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{args.readers} readers, {args.writers} writers, {args.tasks:,} tasks, {args.seconds:g} s")
+        print(f"{'mode':<10}{'reads/s':>10}{'writes/s':>12}{'write p50 ms':>14}{'write p99 ms':>14}{'max ms':>10}{'torn':>6}")
+        for r in results:
+            print(f"{r['mode']:<10}{r['reads_per_sec']:>10.1f}{r['writes_per_sec']:>12.0f}{r['write_p50_ms']:>14.3f}"
+                  f"{r['write_p99_ms']:>14.3f}{r['write_max_ms']:>10.2f}{r['torn_reads']:>6}")
+    return 1 if any(r["torn_reads"] for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
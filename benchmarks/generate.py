@@ -0,0 +1,60 @@
+"""
+
+Synthetic task lists.
+
+Seeded generator of Task.to_dict-shaped records with realistic spreads:
+most tasks are medium priority, about half not started, start dates over
+the last six months and durations skewed towards days rather than months
+(a few are overdue, as in real lists).
+
+    python -m benchmarks.generate 10000 tasks.json [--seed N]
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from task_manager.fileio import FileIO, csv_io, json_io, jsonl_io
+
+PRIORITIES = (1, 2, 3, 4, 5)
+PRIORITY_WEIGHTS = (5, 20, 45, 20, 10)
+STATUSES = ("ns", "inp", "c")
+STATUS_WEIGHTS = (50, 30, 20)
+WORDS = (
+    "review", "write", "fix", "plan", "call", "email", "update", "test", "deploy", "design",
+    "report", "budget", "meeting", "client", "release", "docs", "invoice", "backup", "draft", "sprint",
+)
+
+def generate_tasks(n: int, seed: int = 0, today: date | None = None) -> list[dict]:
+    """n records, identical for the same seed and today."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    priorities = rng.choices(PRIORITIES, PRIORITY_WEIGHTS, k=n)
+    statuses = rng.choices(STATUSES, STATUS_WEIGHTS, k=n)
+    records = []
+    for i in range(n):
+        start = today - timedelta(days=rng.randrange(180))
+        duration = min(int(rng.expovariate(1 / 14)), 365) # mostly days, sometimes months
+        title = " ".join(rng.sample(WORDS, rng.randint(1, 4))).capitalize()
+        records.append({
+            "title": f"{title} #{i + 1}",
+            "period_start_date": start.isoformat(),
+            "period_end_date": (start + timedelta(days=duration)).isoformat(),
+            "priority": priorities[i],
+            "status": statuses[i],
+            "description": "" if rng.random() < 0.4 else " ".join(rng.choices(WORDS, k=rng.randint(3, 20))),
+        })
+    return records
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic task list to a file.")
+    parser.add_argument("n", type=int)
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(FileIO.export(Path(args.path).suffix, generate_tasks(args.n, args.seed), args.path))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+
+HTTP load test.
+
+Drives the serve mode (ui.http.server) with many concurrent clients, each on
+its own keep-alive connection, and reports requests/sec and latency
+percentiles per endpoint. Without --url it starts a server in-process on a
+free port, preloaded with a generated task list.
+
+    python -m benchmarks.load_test [--url http://host:port] [--clients N]
+                                   [--requests N] [--tasks N] [--mix read|write|mixed]
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+from task_manager import TaskManager
+from .generate import generate_tasks
+
+# (weight, method, path or path template) per mix; {id} is a task id the client owns or a random one
+MIXES = {
+    "read": [(6, "GET", "/tasks?offset={offset}&limit=20"), (4, "GET", "/tasks/{id}")],
+    "write": [(5, "POST", "/tasks"), (4, "PUT", "/tasks/{id}"), (1, "DELETE", "/tasks/{own}")],
+    "mixed": [
+        (5, "GET", "/tasks?offset={offset}&limit=20"), (3, "GET", "/tasks/{id}"),
+        (1, "POST", "/tasks"), (1, "PUT", "/tasks/{id}"),
+    ],
+}
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+def _endpoint(method: str, path: str) -> str:
+    """"GET /tasks/<id>" for "GET /tasks/12", query strings dropped."""
+    parts = path.split("?")[0].split("/")
+    return f"{method} {'/'.join('<id>' if part.isdigit() else part for part in parts)}"
+
+def _client(host: str, port: int, requests: int, mix: list, size: int, seed: int, out: list, errors: list) -> None:
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    weights = [weight for weight, *_ in mix]
+    owned: list[int] = [] # ids this client added, so its deletes don't race other clients'
+    try:
+        for _ in range(requests):
+            _, method, path = rng.choices(mix, weights)[0]
+            if "{own}" in path and not owned:
+                method, path = "POST", "/tasks"
+            path = path.format(
+                offset=rng.randrange(max(1, size)), id=rng.randrange(1, max(2, size + 1)),
+                own=owned.pop() if "{own}" in path else "",
+            )
+            body = None
+            if method in ("POST", "PUT"):
+                body = json.dumps({"title": f"load {rng.randrange(10**6)}", "period_end_date": "2999-01-01",
+                                   "priority": rng.randint(1, 5)})
+            start = time.perf_counter()
+            conn.request(method, path, body, {"Content-Type": "application/json"} if body else {})
+            response = conn.getresponse()
+            data = response.read()
+            elapsed = time.perf_counter() - start
+            out.append((_endpoint(method, path), elapsed))
+            if response.status >= 500 or (response.status >= 400 and method != "GET"):
+                errors.append(f"{method} {path}: {response.status} {data[:200]!r}")
+            elif method == "POST":
+                owned.append(json.loads(data)["id"])
+    finally:
+        conn.close()
+
+def run(url: str, clients: int = 16, requests: int = 200, mix: str = "mixed", size: int = 1000, seed: int = 0) -> dict:
+    """Run the clients against url; returns throughput, latency percentiles (ms) and errors."""
+    parts = urlsplit(url)
+    per_client: list[list] = [[] for _ in range(clients)]
+    errors: list[str] = []
+    threads = [
+        threading.Thread(
+            target=_client, args=(parts.hostname, parts.port, requests, MIXES[mix], size, seed + i, per_client[i], errors),
+        )
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    samples = [sample for client in per_client for sample in client]
+    by_endpoint: dict[str, list[float]] = {}
+    for endpoint, elapsed in samples:
+        by_endpoint.setdefault(endpoint, []).append(elapsed)
+    def summary(latencies: list[float]) -> dict:
+        ordered = sorted(latencies)
+        return {
+            "requests": len(ordered),
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "p99_ms": _percentile(ordered, 0.99) * 1000,
+            "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+        }
+    return {
+        "clients": clients,
+        "seconds": wall,
+        "requests_per_sec": len(samples) / wall if wall else 0.0,
+        "overall": summary([elapsed for _, elapsed in samples]),
+        "endpoints": {endpoint: summary(latencies) for endpoint, latencies in sorted(by_endpoint.items())},
+        "errors": errors,
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the Task Manager HTTP service.")
+    parser.add_argument("--url", help="a running server (default: start one in-process)")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--tasks", type=int, default=1000, help="generated tasks for the in-process server")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    args = parser.parse_args(argv)
+    server = None
+    if args.url is None:
+        from ui.http.server import make_server
+        manager = TaskManager()
+        manager.ingest([generate_tasks(args.tasks, args.seed)])
+        server = make_server(manager, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+    else:
+        url = args.url
+    try:
+        result = run(url, args.clients, args.requests, args.mix, args.tasks, args.seed)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['clients']} clients, {result['overall']['requests']} requests in {result['seconds']:.2f} s: "
+              f"{result['requests_per_sec']:.0f} req/s")
+        print(f"{'endpoint':<22}{'requests':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for endpoint, s in [("all", result["overall"]), *result["endpoints"].items()]:
+            print(f"{endpoint:<22}{s['requests']:>10}{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}"
+                  f"{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+        for error in result["errors"][:10]:
+            print(f"error: {error}")
+    return 1 if result["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+
+Benchmark runner.
+
+Times the hot paths (Task construction and from_dict, TaskManager CRUD,
+full and paged view, FileIO export/import for CSV and JSON, the three reports) on
+generated task lists of each size, and writes the results as JSON so runs
+can be compared across commits (see benchmarks.compare).
+
+    python -m benchmarks.run [--sizes 1000 10000 ...] [--cases name ...]
+                             [--repeat N] [--seed N] [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from task_manager import Task, TaskManager
+from task_manager.fileio import FileIO, csv_io, json_io
+from .generate import generate_tasks
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DELETES = 100 # delete_task is timed per call, not per list size
+
+# Each case builds (setup, run): setup() -> state is not timed, run(state) -> rows is
+Case = Callable[[list[dict], Path], tuple[Callable[[], object], Callable[[object], int]]]
+CASES: dict[str, Case] = {}
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+    return register
+
+def _manager(records: list[dict]) -> TaskManager:
+    m = TaskManager()
+    m.ingest([records])
+    return m
+
+# ---- Cases ----
+
+@case("task_init")
+def _task_init(records, workdir):
+    args = [
+        (r["title"], r["period_end_date"], r["period_start_date"], r["priority"], r["status"], r["description"])
+        for r in records
+    ]
+    return lambda: args, lambda args: len([Task(*a) for a in args])
+
+@case("task_from_dict")
+def _task_from_dict(records, workdir):
+    return lambda: records, lambda records: len([Task.from_dict(r) for r in records])
+
+@case("add_task")
+def _add_task(records, workdir):
+    def setup():
+        return TaskManager(), Task.from_dicts(records)
+    def run(state):
+        m, tasks = state
+        for task in tasks:
+            m.add_task(task)
+        return len(tasks)
+    return setup, run
+
+@case("delete_task")
+def _delete_task(records, workdir):
+    def run(m):
+        count = min(DELETES, len(m.tasks))
+        for _ in range(count):
+            m.delete_task(len(m.tasks) // 2 + 1)
+        return count
+    return lambda: _manager(records), run
+
+@case("delete_tasks")
+def _delete_tasks(records, workdir): # as many tasks as delete_task, spread over the list, in one batch
+    def run(m):
+        count = min(DELETES, len(m.tasks))
+        numbers = range(1, len(m.tasks) + 1, max(1, len(m.tasks) // count))[:count]
+        m.delete_tasks(numbers)
+        return len(numbers)
+    return lambda: _manager(records), run
+
+@case("set_status")
+def _set_status(records, workdir):
+    def run(m):
+        numbers = range(1, len(m.tasks) + 1)
+        m.set_status(numbers, "c")
+        return len(numbers)
+    return lambda: _manager(records), run
+
+@case("view_tasks")
+def _view_tasks(records, workdir):
+    return lambda: _manager(records), lambda m: sum(1 for _ in m.view_tasks())
+
+@case("view_tasks_cached")
+def _view_tasks_cached(records, workdir): # second view of unchanged tasks: rendered strings are reused
+    def setup():
+        m = _manager(records)
+        for _ in m.view_tasks():
+            pass
+        return m
+    return setup, lambda m: sum(1 for _ in m.view_tasks())
+
+@case("view_page")
+def _view_page(records, workdir): # one screen from the middle: should not grow with the list
+    return lambda: _manager(records), lambda m: sum(1 for _ in m.view_tasks(len(m.tasks) // 2, 20))
+
+def _export(ext: str) -> Case:
+    def factory(records, workdir):
+        path = str(workdir / f"export{ext}")
+        def run(m):
+            FileIO.export(ext, m.iter_dicts(include_id=True), path)
+            return len(m.tasks)
+        return lambda: _manager(records), run
+    return factory
+
+def _import(ext: str) -> Case:
+    def factory(records, workdir):
+        path = str(workdir / f"import_{len(records)}{ext}")
+        def setup():
+            if not Path(path).exists():
+                FileIO.export(ext, records, path)
+            return path
+        return setup, lambda path: len(FileIO.import_(ext, path))
+    return factory
+
+def _report(name: str) -> Case:
+    def factory(records, workdir):
+        from task_manager import reports
+        def run(m): # a fresh manager per repeat, so this times a cold (uncached) report
+            try:
+                return len(getattr(reports, name)(m))
+            except ValueError: # no matching rows
+                return 0
+        return lambda: _manager(records), run
+    return factory
+
+for _ext in (".csv", ".json"):
+    CASES[f"export{_ext.replace('.', '_')}"] = _export(_ext)
+    CASES[f"import{_ext.replace('.', '_')}"] = _import(_ext)
+@case("import_csv_parallel")
+def _import_csv_parallel(records, workdir):
+    setup, _ = _import(".csv")(records, workdir)
+    return setup, lambda path: len(csv_io.import_csv(path, min_bytes=0)) # one range set per CPU
+
+for _name in ("get_overdue_report", "get_priority_report", "get_remaining_report"):
+    CASES[_name] = _report(_name)
+
+# ---- Runner ----
+
+def run(sizes=SIZES, cases=None, repeat: int = 3, seed: int = 0, progress=None) -> dict:
+    """Best-of-repeat seconds for each case at each size, plus run metadata."""
+    names = list(CASES) if not cases else list(cases)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}.")
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            records = generate_tasks(size, seed)
+            for name in names:
+                setup, body = CASES[name](records, Path(workdir))
+                best, rows = None, 0
+                for _ in range(repeat):
+                    state = setup()
+                    start = time.perf_counter()
+                    rows = body(state)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                result = {
+                    "case": name, "size": size, "rows": rows, "seconds": best,
+                    "us_per_row": best / rows * 1e6 if rows else None,
+                }
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return {"meta": _meta(seed, repeat), "results": results}
+
+def _meta(seed: int, repeat: int) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the Task Manager hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), metavar="CASE")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args(argv)
+    def progress(result: dict) -> None:
+        print(f"{result['case']:>22} {result['size']:>9,} {result['seconds'] * 1000:10.1f} ms", flush=True)
+    report = run(args.sizes, args.cases, args.repeat, args.seed, progress)
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+
+Startup benchmark.
+
+Cold-starts main.py with an empty stdin, so it exits at the first prompt,
+and checks the wall time against a budget. The -X importtime breakdown names
+the slowest imports, and heavy modules that should only load on
+demand (pandas for reports) must not appear at all.
+
+    python -m benchmarks.startup [--budget-ms N] [--runs N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_MS = 500
+LAZY_MODULES = ("pandas", "numpy")
+
+def measure(runs: int = 3) -> dict:
+    """Best-of-runs cold start: wall time in ms and import times (ms, cumulative)."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(ROOT / "main.py")],
+            input="", capture_output=True, text=True, cwd=ROOT,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if best is None or wall_ms < best["wall_ms"]:
+            best = {
+                "wall_ms": wall_ms,
+                "imports": _imports(result.stderr),
+                "prompted": "(Create) a List or (Open)" in result.stdout,
+            }
+    return best
+
+def _imports(stderr: str) -> dict[str, float]:
+    """Module -> cumulative import time (ms) for every module in the importtime log."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = int(cumulative) / 1000
+    return imports
+
+def check(result: dict, budget_ms: float | None = BUDGET_MS) -> list[str]:
+    """Problems with a measure() result; empty when startup is within budget (None skips the timing)."""
+    problems = [] if result["prompted"] else ["main.py never reached the first prompt"]
+    problems += [f"{name} is imported at startup" for name in LAZY_MODULES if name in result["imports"]]
+    if budget_ms is not None and result["wall_ms"] > budget_ms:
+        problems.append(f"cold start took {result['wall_ms']:.0f} ms (budget {budget_ms:.0f} ms)")
+    return problems
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+    result = measure(args.runs)
+    print(f"cold start to first prompt: {result['wall_ms']:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    top = sorted(result["imports"].items(), key=lambda item: item[1], reverse=True)[:10]
+    for name, ms in top:
+        print(f"  {ms:8.1f} ms  {name}")
+    problems = check(result, args.budget_ms)
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,54 @@
 Task Manager CLI entry point.
 
 Runs the menu loop, routes actions to TaskManager and FileIO, and manages the
-current working file path.
+current working file path. With --wal, every change is journaled next to the
+data file and compacted into it on exit (see task_manager.wal). With
+--autosave, a background thread saves the current file shortly after edits.
+Opening a .sqlite/.db file works on the database directly instead of loading
+it into memory. The stats command shows call counts and latencies of the hot
+paths; with --profile, each command also writes a cProfile dump to profiles/.
+`main.py serve` runs the HTTP/JSON service (ui.http.server) instead of the menu,
+and `main.py run script.txt` runs a script of commands (ui.cli.script).
 """
 
-from task_manager import TaskManager, Task, reports
-from task_manager.fileio import FileIO, csv_io, json_io
+from task_manager import TaskManager, Task
+from task_manager.fileio import FileIO, csv_io, json_io, jsonl_io, npz_io, sqlite_io, tmb_io
+from task_manager.sqlite_store import SQLiteTaskStore
+from task_manager.wal import WriteAheadLog
+from task_manager.autosave import AutoSaver
+from task_manager import stats
+from contextlib import contextmanager, nullcontext
+from functools import partial
 from pathlib import Path
 from ui.cli.input_task import InputTask 
+from ui.cli.numbers import parse_numbers
+import sqlite3
 import sys
 
+SQLITE_SUFFIXES = (".sqlite", ".db")
+PAGE_SIZE = 20 # tasks per screen in view
+
 manager = TaskManager()
+use_wal = False
+journal: WriteAheadLog | None = None
+autosaver: AutoSaver | None = None
+profile_dir: Path | None = None
+profile_count = 0
 
-def main():
+def main(argv: list[str] | None = None):
     """Run the Task Manager CLI loop (create/open and handle user choices)."""
+    global use_wal, autosaver, profile_dir
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        from ui.http.server import main as serve # http.server only loads in serve mode
+        sys.exit(serve(argv[1:], manager))
+    if argv[:1] == ["run"]:
+        from ui.cli.script import main as run_script
+        # A script works on an in-memory copy, so a failing line leaves a database untouched too
+        sys.exit(run_script(argv[1:], manager, partial(load_tasks, in_place=False), save_tasks))
+    use_wal = "--wal" in argv
+    if "--profile" in argv:
+        profile_dir = Path("profiles")
 
     print("\n" + "*"*10 + " Welcome to Task-Manager " + "*"*10 + "\n")
     print("(...) are keywords that can be used in CLI.\n")
@@ -29,34 +64,41 @@ def main():
         path = input("Please enter the file path you wish to open: ")
         print("\n" +"*"*10)
         try:
-            data = FileIO.import_(Path(path).suffix, path)
+            count = load_tasks(manager, path)
         except (FileNotFoundError, ValueError):
+            manager.tasks.clear()
             print("Error: No such file exists.")
             path = ""
         else:
-            for item in data:
-                print(manager.add_task(Task.from_dict(item)))
+            manager.mark_saved(path)
+            print(f"{count} task(s) loaded.")
             print("File imported successfully")
             if input("Do you wish to see the content of the file(y/n): ").strip().lower() in ("yes", "y"):
-                for task in manager.view_tasks():
-                    print(task)
+                page_tasks(manager)
         print("*"*10) 
 
+    # A database opened in place is already on disk: nothing to autosave
+    if "--autosave" in argv and not isinstance(manager.tasks, SQLiteTaskStore):
+        autosaver = AutoSaver(manager)
+        autosaver.start()
+
     while True:
+        if autosaver is not None:
+            autosaver.path = path
         choice = input_other_choices()
-        path = other_choices(choice, manager, path)
+        with profiled(choice) if profile_dir is not None else nullcontext():
+            path = other_choices(choice, manager, path)
 
 
 def other_choices(choice: str, manager: TaskManager, path: str) -> str:        
     match choice:
     # ---- Save and Exit Options ----
-        # TODO auto-save feature
         # Save Option:
         case "save" | "s":
             if not path:
                 path = input("Please enter a file path where you want to save: ")
             try:
-                print(FileIO.export(Path(path).suffix, manager.to_dict_list(), path))
+                print(save_tasks(manager, path))
             except (FileNotFoundError, ValueError):
                 print("\nError: No such path or file exists.")
             return path
@@ -65,7 +107,7 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
         case "save_as" | "sa":
             new_path = input("Please enter a file path where you want to save: ")
             try:               
-                print(FileIO.export(Path(new_path).suffix, manager.to_dict_list(), new_path))
+                print(save_tasks(manager, new_path))
                 return new_path
             except (FileNotFoundError, ValueError):
                 print("Error: No such path or file exists.")
@@ -75,7 +117,7 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
         case "save_copy" | "sc":
             copy_path = input("Please enter a file path where you want to save a copy: ")
             try:
-                print(FileIO.export(Path(copy_path).suffix, manager.to_dict_list(), copy_path))
+                print(FileIO.export(Path(copy_path).suffix, manager.iter_dicts(include_id=True), copy_path))
             except (FileNotFoundError, ValueError):
                 print("Error: No such path or file exists.")
             return path  
@@ -85,7 +127,8 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
             if not path:
                 path = input("Please enter a file path where you want to save: ")
             try:               
-                print(FileIO.export(Path(path).suffix, manager.to_dict_list(), path))
+                print(save_tasks(manager, path))
+                shutdown()
                 print("Thank You, see you soon")
                 sys.exit(0)
             except (FileNotFoundError, ValueError):
@@ -96,6 +139,7 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
         # Exit Option:
         case "exit" | "q":
             if input("Why don't you stay a little longer(y/n): ").strip().lower() in ("no", "n"):
+                shutdown()
                 print("Haa, Haa, Haa, how was it, see you soon")
                 sys.exit(0)
             else:
@@ -111,11 +155,12 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
         
         #Delete Task Option:
         case "delete" | "del":
-            number = update_delete_helper("Which task number do you want to delete? ")
-            if number is None:
+            numbers = numbers_helper("Which task number(s) do you want to delete (e.g. 3 or 3-40,55)? ", manager)
+            if numbers is None:
                 return path
-            if input(f"Are you sure you want to delete task no. {number} (y/n): ").strip().lower() in ("yes", "y"):
-                print(manager.delete_task(number))
+            what = f"task no. {numbers[0]}" if len(numbers) == 1 else f"{len(numbers)} tasks"
+            if input(f"Are you sure you want to delete {what} (y/n): ").strip().lower() in ("yes", "y"):
+                print(manager.delete_task(numbers[0]) if len(numbers) == 1 else manager.delete_tasks(numbers))
             return path
         
         # Edit Task Option:
@@ -129,59 +174,165 @@ def other_choices(choice: str, manager: TaskManager, path: str) -> str:
         
         #Update Status Option:
         case "update_status" | "u":
-            number = update_delete_helper("Which task number would you like to update? ")
-            if number is None:
+            numbers = numbers_helper("Which task number(s) would you like to update (e.g. 3 or 3-40,55)? ", manager)
+            if numbers is None:
                 return path
             while True:
                 value = input("what is the current status(c/ns/inp): ").strip().lower()
                 if value in Task.STATUS_MAP:
                     break
                 print("Please enter a valid input.")
-            match value:
-                case "completed" | "c":
-                    manager.tasks[number-1].marked_complete()
-                    print(manager.update_task(number, manager.tasks[number-1]))
-                case "ns":
-                    manager.tasks[number-1].marked_not_started()
-                    print(manager.update_task(number, manager.tasks[number-1]))
-                case "inp":
-                    manager.tasks[number-1].mark_in_progress()
-                    print(manager.update_task(number, manager.tasks[number-1]))
+            print(manager.set_status(numbers, value)) # one write, for one number or many
             return path
         
         #View Task Option:
         case "view" | "v":
-            try:
-                for task in manager.view_tasks():
-                    print(task)
-            except ValueError as e:
-                print(e)
+            page_tasks(manager)
             return path
         
     # ---- Report View options ---- 
 
+        case "stats" | "st":
+            print(stats.format_table())
+            return path
+
         case "overdue" | "d":
-            try:
-                df = reports.get_overdue_report(manager.to_dict_list())
-                print(df.to_string(index=False))
-            except ValueError as e:
-                print(e)
+            print_report("get_overdue_report", manager)
             return path
         case "priority" | "p":
-            try:
-                df = reports.get_priority_report(manager.to_dict_list())
-                print(df.to_string(index=False))
-            except ValueError as e:
-                print(e)
+            print_report("get_priority_report", manager)
             return path
         case "remaining" | "r":
-            try:
-                df = reports.get_remaining_report(manager.to_dict_list())
-                print(df.to_string(index=False))
-            except ValueError as e:
-                print(e)
+            print_report("get_remaining_report", manager)
             return path
         
+def page_tasks(manager: TaskManager, page_size: int = PAGE_SIZE, input_fn=input) -> None:
+    """Show the tasks one page at a time: (n)ext, (p)rev, a page number to jump, (q)uit."""
+    page = 0
+    while True:
+        total = len(manager.tasks)
+        pages = max(1, -(-total // page_size))
+        page = min(page, pages - 1) # the list may have shrunk
+        try:
+            for task in manager.view_tasks(page * page_size, page_size):
+                print(task)
+        except ValueError as e:
+            print(e)
+            return
+        if pages == 1:
+            return
+        print(f"-- page {page + 1} of {pages} ({total} tasks) --")
+        while True:
+            choice = input_fn("(n)ext, (p)rev, page number or (q)uit [Enter: next]: ").strip().lower()
+            if choice == "":
+                choice = "n" if page + 1 < pages else "q"
+            if choice in ("q", "quit"):
+                return
+            if choice in ("n", "next") and page + 1 < pages:
+                page += 1
+                break
+            if choice in ("p", "prev") and page > 0:
+                page -= 1
+                break
+            if choice.isdigit() and 1 <= int(choice) <= pages:
+                page = int(choice) - 1
+                break
+            print(f"Please enter n, p, q or a page number between 1 and {pages}.")
+
+@contextmanager
+def profiled(command: str):
+    """Profile the with-block and dump it to profile_dir as <n>-<command>.pstats."""
+    global profile_count
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally: # also when the command exits the program
+        profiler.disable()
+        profile_count += 1
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(profile_dir / f"{profile_count:03d}-{command}.pstats")
+
+def print_report(name: str, manager: TaskManager) -> None:
+    """Print one of the reports.* tables. pandas is imported on the first report, not at startup."""
+    from task_manager import reports
+    try:
+        df = getattr(reports, name)(manager)
+        print(df.to_string(index=False))
+    except ValueError as e:
+        print(e)
+
+def save_tasks(manager: TaskManager, path: str) -> str:
+    """Save to path, appending only the new rows when the format supports it.
+
+    In WAL mode a save just syncs the journal; saving to a new path starts a
+    journal there.
+    """
+    global journal
+    if isinstance(manager.tasks, SQLiteTaskStore) and manager.tasks.path == str(path):
+        return manager.tasks.commit() # Already on disk
+    if journal is not None and journal.path == str(path):
+        return journal.sync()
+    if use_wal:
+        close_journal()
+        journal = WriteAheadLog(manager, path)
+        message = journal.compact()
+        journal.start()
+        return message
+    ext = Path(path).suffix
+    # Don't race the autosave thread on the same file
+    with autosaver.lock if autosaver is not None else nullcontext():
+        rows = manager.unsaved_appends(path, include_id=True)
+        if rows is not None and FileIO.can_append(ext) and Path(path).exists():
+            message = FileIO.append(ext, rows, path)
+        else:
+            message = FileIO.export(ext, manager.iter_dicts(include_id=True), path)
+        manager.mark_saved(path)
+    return message
+
+def load_tasks(manager: TaskManager, path: str, in_place: bool = True) -> int:
+    """Load the file at path into manager and return the task count.
+
+    SQLite files are worked on in place (in_place=False reads their rows into
+    memory instead, and save_tasks writes them back); in WAL mode the journal
+    is replayed and started.
+    """
+    global journal
+    if Path(path).suffix in SQLITE_SUFFIXES and in_place:
+        open_database(manager, path)
+        return len(manager.tasks)
+    if use_wal:
+        journal = WriteAheadLog.open(manager, path)
+        return len(manager.tasks)
+    if Path(path).suffix == ".npz":
+        return manager.ingest_columns(npz_io.load_columns(path))
+    return manager.ingest(FileIO.iter_import(Path(path).suffix, path))
+
+def open_database(manager: TaskManager, path: str) -> None:
+    """Switch manager to work directly against the task database at path."""
+    if not Path(path).exists(): # sqlite3 would silently create it
+        raise FileNotFoundError(path)
+    try:
+        store = SQLiteTaskStore(path)
+        len(store) # Fails here if it isn't a database
+    except sqlite3.DatabaseError as e:
+        raise ValueError(f"Not a task database: {e}")
+    manager.tasks = store
+
+def shutdown() -> None:
+    """Flush autosave and the WAL before exiting."""
+    if autosaver is not None:
+        autosaver.stop()
+    close_journal()
+
+def close_journal() -> None:
+    """Compact and close the WAL, if one is open."""
+    global journal
+    if journal is not None:
+        journal.close()
+        journal = None
+
 def update_delete_helper(prompt: str,mgr: TaskManager = manager, input_fn=input) -> int | None:
     """Prompt until a valid task number is entered. Returns None if no tasks."""
     if not mgr.tasks:
@@ -197,17 +348,30 @@ def update_delete_helper(prompt: str,mgr: TaskManager = manager, input_fn=input)
                 return None
             print(e) 
         
+def numbers_helper(prompt: str, mgr: TaskManager = manager, input_fn=input) -> list[int] | None:
+    """Prompt until valid task numbers or ranges are entered. Returns None if no tasks."""
+    if not mgr.tasks:
+        print(TaskManager.EMPTY_MESSAGE)
+        return None
+    while True:
+        try:
+            return mgr.validate_indexes(parse_numbers(input_fn(prompt), len(mgr.tasks)))
+        except ValueError as e:
+            print(e)
+            if str(e) == TaskManager.EMPTY_MESSAGE:
+                return None
+
 def input_other_choices(input_fn=input) -> str:
     """Prompt the user for an action (add, update, delete, etc.) and return the normalized keyword."""
     choices = ["add", "a", "edit", "e", "update_status", "u", "delete", "del" , "view", "v", 
-               "overdue", "d", "priority", "p", "remaining", "r", 
+               "overdue", "d", "priority", "p", "remaining", "r", "stats", "st",
                "save", "s", "save_as", "sa","save_copy", "sc", "save_exit", "se","exit","q"]
     print()
     print("*"*10)
     print("What do you want to do now? Options Are:")
     print("(Add) more task, (edit) task, (update) status of the task, (delete) task, (view) all tasks,")
-    print("view (overdue) tasks, sort by (priority), sort by least time (remaining).")
-    print("(save) to csv or json, save to new location (save_as),save as a copy (save_copy), save and exit(save_exit), (exit)")
+    print("view (overdue) tasks, sort by (priority), sort by least time (remaining), timing (stats).")
+    print("(save) to csv, json, jsonl, npz, tmb or sqlite, save to new location (save_as),save as a copy (save_copy), save and exit(save_exit), (exit)")
     print("*"*10)
 
     while True:
@@ -216,7 +380,7 @@ def input_other_choices(input_fn=input) -> str:
             return choice
         print("Please enter a valid option:\n " \
             "add(a), edit(e), update_status(u), delete(del), view(v),\n" \
-            "overdue(d), priority(p), remaining(r),\n" \
+            "overdue(d), priority(p), remaining(r), stats(st),\n" \
             "save(s), save_as(sa), save_exit(se), exit(q): ")
 
 def input_create_open(input_fn=input) -> str:
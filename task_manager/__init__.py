@@ -3,51 +3,279 @@
 Task manager core.
 
 Provides TaskManager: in-memory CRUD for Task objects, list/view helpers, 
-and simple serialization for FileIO.
+and simple serialization for FileIO. Tasks are kept in a columnar TaskStore,
+optionally with secondary indexes on status, priority and end date, or in a
+SQLiteTaskStore that works directly against a database file. Every task gets
+a stable id for O(1) lookup, update and delete.
+
+Safe to share between threads: changes are serialized by the store's lock
+(check-then-act steps like "validate the number, then delete" hold it
+throughout), while listings, exports and reports read an immutable store
+snapshot and never block writers or each other.
 """
 
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator
+from datetime import date
+from functools import wraps
+from time import perf_counter
 from .task import Task
+from .store import TaskStore
+from .stats import measure, record, timed
+
+def _settles(method: Callable) -> Callable:
+    """Run the manager's after_change hooks once method has returned (or raised)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            for hook in self.after_change:
+                hook()
+    return wrapper
 
 class TaskManager:
     """Represents a Task Manager."""
     EMPTY_MESSAGE = "There is no task. Please add a task."
 
-    def __init__(self):
-        self.tasks: list[Task] = []
-        
+    def __init__(self, indexed: bool = False, store: TaskStore | None = None):
+        self.tasks: TaskStore = TaskStore(indexed=indexed) if store is None else store
+        # (path, save_point()) of the last save, for append-only saves and dirty tracking
+        self._saved: tuple[str, tuple[int, int, int]] | None = None
+        # Called with no arguments after each change method returns, once the
+        # store operation is complete (listeners run in the middle of one)
+        self.after_change: list[Callable[[], None]] = []
 
-    def add_task(self, task: Task) -> str:
-        """Adds a task in the tasks list."""
+    @_settles
+    @timed("TaskManager.add_task")
+    def add_task(self, task: Task, task_id: int | None = None) -> str:
+        """Adds a task in the tasks list (keeping task_id when given, e.g. from a file)."""
         if task is None:
             raise ValueError("Task object can't be None.")
-        self.tasks.append(task)
+        if task_id is not None and task_id != "": # CSV gives "" for a missing id
+            task_id = self.validate_id(task_id, must_exist=False)
+        else:
+            task_id = None
+        self.tasks.append(task, task_id)
         return f"Task '{task.title}' has been added successfully."
 
+    @_settles
+    @timed("TaskManager.ingest", rows=int)
+    def ingest(self, batches: Iterable[list[dict]]) -> int:
+        """Append batches of exported records (e.g. from FileIO.iter_import); return the count."""
+        return sum(self.tasks.extend_records(batch) for batch in batches)
+
+    async def aingest(self, batches: AsyncIterable[list[dict]] | Iterable[list[dict]]) -> int:
+        """ingest() for asyncio callers, e.g. of FileIO.aiter_import; yields to the loop after each batch."""
+        import asyncio # not at module level: keeps CLI startup fast
+        count = 0
+        if isinstance(batches, AsyncIterable):
+            async for batch in batches:
+                count += self.tasks.extend_records(batch)
+                await asyncio.sleep(0)
+        else:
+            for batch in batches:
+                count += self.tasks.extend_records(batch)
+                await asyncio.sleep(0)
+        for hook in self.after_change:
+            hook()
+        return count
+
+    @_settles
+    @timed("TaskManager.ingest_columns", rows=int)
+    def ingest_columns(self, columns: dict) -> int:
+        """Append rows given column by column (e.g. from npz_io.load_columns); return the count."""
+        return self.tasks.extend_columns(columns)
+
+    @_settles
+    @timed("TaskManager.delete_task")
     def delete_task(self, number: int) -> str:
         """Delete a task by its number."""
-        number = self.validate_index(number)
-        delete = self.tasks.pop(number-1)
+        with self.tasks.lock:
+            number = self.validate_index(number)
+            delete = self.tasks.pop(number-1)
         return f"Task '{delete.title}' has been deleted successfully."
     
+    @_settles
+    @timed("TaskManager.update_task")
     def update_task(self, number: int, task: Task) -> str:
         """Updates a particular task by its number"""
         if task is None:
             raise ValueError("Task object can't be None.")
-        number = self.validate_index(number)
-        self.tasks[number-1] = task
+        with self.tasks.lock:
+            number = self.validate_index(number)
+            self.tasks[number-1] = task
         return f"Task '{task.title}' updated successfully."
     
+    @timed("TaskManager.get_task")
+    def get_task(self, task_id: int) -> Task:
+        """Return the task with this id."""
+        with self.tasks.lock:
+            return self.tasks.get(self.validate_id(task_id))
+
+    @_settles
+    @timed("TaskManager.delete_task_by_id")
+    def delete_task_by_id(self, task_id: int) -> str:
+        """Delete a task by its stable id."""
+        with self.tasks.lock:
+            delete = self.tasks.remove(self.validate_id(task_id))
+        return f"Task '{delete.title}' has been deleted successfully."
+
+    @_settles
+    @timed("TaskManager.update_task_by_id")
+    def update_task_by_id(self, task_id: int, task: Task) -> str:
+        """Updates a particular task by its stable id."""
+        if task is None:
+            raise ValueError("Task object can't be None.")
+        with self.tasks.lock:
+            self.tasks.replace(self.validate_id(task_id), task)
+        return f"Task '{task.title}' updated successfully."
+
+# ---- Batch changes ----
+# Each validates everything first and applies all-or-nothing in one pass over the list
+
+    @_settles
+    def add_tasks(self, tasks: Iterable[Task]) -> str:
+        """Add many tasks at once."""
+        tasks = list(tasks)
+        if any(task is None for task in tasks):
+            raise ValueError("Task object can't be None.")
+        with measure("TaskManager.add_tasks") as m:
+            m.rows = len(self.tasks.extend(tasks))
+        return f"{m.rows} task(s) have been added successfully."
+
+    @_settles
+    def delete_tasks(self, numbers: Iterable[int]) -> str:
+        """Delete the tasks with these numbers (numbers as shown before the delete)."""
+        with self.tasks.lock, measure("TaskManager.delete_tasks") as m:
+            numbers = self.validate_indexes(numbers)
+            m.rows = len(self.tasks.delete_positions(number - 1 for number in numbers))
+        return f"{m.rows} task(s) have been deleted successfully."
+
+    @_settles
+    def update_tasks(self, tasks: dict[int, Task]) -> str:
+        """Replace the tasks with these numbers ({number: Task})."""
+        if any(task is None for task in tasks.values()):
+            raise ValueError("Task object can't be None.")
+        with self.tasks.lock, measure("TaskManager.update_tasks") as m:
+            numbers = self.validate_indexes(tasks)
+            self.tasks.replace_positions({number - 1: tasks[number] for number in numbers})
+            m.rows = len(numbers)
+        return f"{m.rows} task(s) updated successfully."
+
+    @_settles
+    def set_status(self, numbers: Iterable[int], status: str) -> str:
+        """Set the status (c/ns/inp) of the tasks with these numbers."""
+        status = Task.validate_status(status)
+        with self.tasks.lock, measure("TaskManager.set_status") as m:
+            numbers = self.validate_indexes(numbers)
+            self.tasks.set_status((number - 1 for number in numbers), status)
+            m.rows = len(numbers)
+        return f"{m.rows} task(s) marked {Task.STATUS_MAP[status]}."
+
+    def task_id(self, number: int) -> int:
+        """Return the stable id of the task at this number."""
+        with self.tasks.lock:
+            return self.tasks.id_at(self.validate_index(number) - 1)
+
     # TODO improve ui design with 'rich' or 'tabulate' in next version. 
-    def view_tasks(self):
-        """View all the tasks in a file."""
-        if not self.tasks:
+    def view_tasks(self, offset: int = 0, limit: int | None = None):
+        """View all the tasks in a file, or the page of up to limit tasks after the first offset.
+
+        Lines keep their task numbers; only the page's tasks are rendered, and
+        tasks rendered before and unchanged since cost a lookup. The listing is
+        as of the first line: later changes don't show.
+        """
+        tasks = self.tasks.snapshot()
+        if not tasks:
             raise ValueError(self.EMPTY_MESSAGE)
-        for i, task in enumerate(self.tasks):
-            yield f"{i + 1}. {task}"
+        if offset < 0 or (limit is not None and limit < 1):
+            raise ValueError("Offset must be at least 0 and limit at least 1.")
+        stop = None if limit is None else offset + limit
+        # Time only the rendering, not the caller's pauses between lines (e.g. a paging prompt)
+        lines, rendered, elapsed = tasks.render(offset, stop), 0, 0.0
+        try:
+            while True:
+                start = perf_counter()
+                text = next(lines, None)
+                elapsed += perf_counter() - start
+                if text is None:
+                    return
+                rendered += 1
+                yield f"{offset + rendered}. {text}"
+        finally: # one call, even if the caller stops early
+            record("TaskManager.view_tasks", elapsed, rendered)
 
-    def to_dict_list(self) -> list[dict]:
+    def to_dict_list(self, include_id: bool = False) -> list[dict]:
         """Convert the list of Task objects to a list of dictionaries."""
-        return [task.to_dict() for task in self.tasks]
+        return self.tasks.snapshot().to_dict_list(include_id)
+
+    def iter_dicts(self, include_id: bool = False) -> Iterator[dict]:
+        """Yield each task as a dictionary, for streaming to FileIO.export (from a snapshot)."""
+        return self.tasks.snapshot().iter_records(include_id)
+
+# ---- Save tracking ----
+
+    def subscribe(self, listener) -> None:
+        """Call listener(op, task_id, record) after every change (see TaskStore)."""
+        self.tasks.listeners.append(listener)
+
+    def unsubscribe(self, listener) -> None:
+        if listener in self.tasks.listeners:
+            self.tasks.listeners.remove(listener)
+
+    @property
+    def version(self) -> int:
+        """Change counter: moves whenever any task is added, updated or deleted."""
+        return self.tasks.version
+
+    @property
+    def dirty(self) -> bool:
+        """True if anything changed since the last save (or since creation)."""
+        saved_version = 0 if self._saved is None else self._saved[1][2]
+        return self.tasks.version != saved_version
+
+    def save_point(self) -> tuple[int, int, int]:
+        """Opaque marker of the current state, for mark_saved."""
+        return (self.tasks.slots, self.tasks.rewrites, self.tasks.version)
+
+    def snapshot(self, include_id: bool = False) -> tuple[list[dict], tuple[int, int, int]]:
+        """Consistent copy of all rows plus its save point (safe to call from another thread)."""
+        with self.tasks.lock: # only to pair the snapshot with its save point
+            tasks, point = self.tasks.snapshot(), self.save_point()
+        return tasks.to_dict_list(include_id), point
+
+    def mark_saved(self, path: str, point: tuple[int, int, int] | None = None) -> None:
+        """Record that path now holds the tasks as of point (default: now)."""
+        point = self.save_point() if point is None else point
+        if self._saved is not None and self._saved[0] == str(path) and self._saved[1][2] > point[2]:
+            return # A newer save of the same file already finished
+        self._saved = (str(path), point)
+
+    def unsaved_appends(self, path: str, include_id: bool = False) -> Iterator[dict] | None:
+        """Rows added since the last save to path, or None if that save can't just be appended to."""
+        if self._saved is None:
+            return None
+        saved_path, (saved_slots, saved_rewrites, _) = self._saved
+        if saved_path != str(path) or saved_rewrites != self.tasks.rewrites:
+            return None
+        return self.tasks.iter_records(include_id, start=saved_slots)
+
+# ---- Queries ----
+
+    def find_tasks(self, status: str | None = None, priority: int | None = None) -> list[int]:
+        """Task numbers matching status and/or priority, in list order."""
+        if status is not None:
+            status = Task.validate_status(status)
+        if priority is not None:
+            priority = Task.validate_priority(priority)
+        with self.tasks.lock:
+            return [row + 1 for row in self.tasks.find(status, priority)]
+
+    def tasks_ending_between(self, first: str | date, last: str | date) -> list[int]:
+        """Task numbers whose end date is in [first, last], soonest first."""
+        first, last = Task.validate_date(first), Task.validate_date(last)
+        with self.tasks.lock:
+            return [row + 1 for row in self.tasks.ending_between(first, last)]
 
 # ---- Validations ----
 
@@ -62,4 +290,22 @@ class TaskManager:
         if not(1 <= number <= len(self.tasks)):
             raise ValueError(f"Please enter a number between 1 and {len(self.tasks)}.")
         return number
-        
\ No newline at end of file
+
+    def validate_indexes(self, numbers: Iterable[int]) -> list[int]:
+        """Validate task numbers; return them as distinct ints in list order."""
+        numbers = list(numbers)
+        if not numbers:
+            raise ValueError("Please enter at least one task number.")
+        return sorted({self.validate_index(number) for number in numbers})
+
+    def validate_id(self, task_id: int, must_exist: bool = True) -> int:
+        """Validate a task id and return it as int."""
+        try:
+            task_id = int(task_id)
+        except (TypeError, ValueError):
+            raise ValueError("Please enter a valid task id.")
+        if task_id < 1:
+            raise ValueError("Task ids start at 1.")
+        if must_exist and not self.tasks.has_id(task_id):
+            raise ValueError(f"No task with id {task_id}.")
+        return task_id
@@ -0,0 +1,75 @@
+"""
+
+Background autosave.
+
+A worker thread watches TaskManager.version and, once edits have settled for
+a short delay, writes a snapshot through FileIO.export. The interactive
+thread never waits on disk, and nothing is written while nothing changed.
+"""
+
+import threading
+import time
+from pathlib import Path
+from . import TaskManager
+from .fileio import FileIO
+
+class AutoSaver:
+    """Debounced autosave of a TaskManager to a file path."""
+    DELAY = 2.0     # seconds without edits before saving
+    INTERVAL = 0.25 # how often the worker checks for edits
+
+    def __init__(self, manager: TaskManager, path: str = "", delay: float = DELAY, interval: float = INTERVAL):
+        self.manager = manager
+        self.path = str(path) # may be set later, e.g. after the first manual save
+        self.delay = delay
+        self.interval = interval
+        self.saves = 0
+        self.last_error: Exception | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.lock = threading.Lock() # held while writing; manual saves take it too
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the worker, saving pending edits first unless flush is False."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.save_now()
+
+    def save_now(self) -> bool:
+        """Save immediately if there are unsaved edits. Returns True if it wrote."""
+        with self.lock:
+            if not self.path or not self.manager.dirty:
+                return False
+            rows, point = self.manager.snapshot(include_id=True)
+            if not rows and Path(self.path).suffix.lower() == ".csv": # CSV can't hold zero rows
+                return False
+            try:
+                FileIO.export(Path(self.path).suffix, rows, self.path)
+            except (OSError, ValueError) as e:
+                self.last_error = e
+                return False
+            self.manager.mark_saved(self.path, point)
+            self.last_error = None
+            self.saves += 1
+            return True
+
+    def _run(self) -> None:
+        seen_version = self.manager.version
+        changed_at = time.monotonic()
+        while not self._stop.wait(self.interval):
+            version = self.manager.version
+            now = time.monotonic()
+            if version != seen_version: # still editing: restart the debounce window
+                seen_version, changed_at = version, now
+                continue
+            if self.manager.dirty and now - changed_at >= self.delay:
+                self.save_now()
@@ -3,19 +3,49 @@
 File I/O registry.
 
 Registers exporters/importers by file extension (e.g., ".csv", ".json") and
-dispatches export/import calls to the right handler.
+dispatches export/import calls to the right handler. Exporters consume any
+iterable of rows and write them incrementally to a temp file that is
+atomically renamed over the target; streaming importers yield
+records lazily so iter_import can hand them out in bounded batches.
+import_many parses and validates many files in a process pool. The a*
+variants run the blocking work in an executor for asyncio callers.
 """
 
+import os
+import stat
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
+from itertools import islice
+from pathlib import Path
 from typing import Callable
 from os import PathLike
+from ..task import Task
+from ..stats import measure
 
-Exporter = Callable[[list[dict], str], str]
+Exporter = Callable[[Iterable[dict], str], str]
 Importer = Callable[[str], list[dict]]
+StreamImporter = Callable[[str], Iterable[dict]]
+Appender = Callable[[Iterable[dict], str], str]
 
 class FileIO:
     """Imports and Exports Task lists to files."""
     exporters: dict[str, Exporter] = {}
     importers: dict[str, Importer] = {}
+    stream_importers: dict[str, StreamImporter] = {}
+    appenders: dict[str, Appender] = {}
+    CHUNK_SIZE = 10_000
+
+    @staticmethod
+    def _create_temp(target: Path) -> Path:
+        """Create an empty, uniquely named file next to target, mode 0666 less the umask."""
+        import secrets # not at module level: keeps CLI startup fast
+        while True:
+            temp = target.with_name(f".{target.stem}.{secrets.token_hex(4)}.tmp{target.suffix}")
+            try:
+                os.close(os.open(temp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            except FileExistsError:
+                continue
+            return temp
 
     @staticmethod
     def _extension(ext: str) -> str:
@@ -35,8 +65,23 @@ class FileIO:
         cls.importers[cls._extension(ext)] = func
 
     @classmethod
-    def export(cls, ext: str, data: list[dict], path: str | PathLike[str]) -> str:
-        """Export data using the registered exporter for ext."""
+    def register_stream_importer(cls, ext: str, func: StreamImporter) -> None:
+        """Register an importer that yields records lazily for the given extension."""
+        cls.stream_importers[cls._extension(ext)] = func
+
+    @classmethod
+    def register_appender(cls, ext: str, func: Appender) -> None:
+        """Register a handler that adds rows to the end of an existing file."""
+        cls.appenders[cls._extension(ext)] = func
+
+    @classmethod
+    def can_append(cls, ext: str) -> bool:
+        """True if rows can be appended to files of this extension."""
+        return cls._extension(ext) in cls.appenders
+
+    @classmethod
+    def export(cls, ext: str, data: Iterable[dict | Task], path: str | PathLike[str]) -> str:
+        """Export rows (dicts or Tasks, any iterable) using the registered exporter for ext."""
         if not path:
             raise ValueError("Please provide a valid file path.")
         if data is None:
@@ -44,7 +89,32 @@ class FileIO:
         extension = cls._extension(ext)
         if extension not in cls.exporters:
             raise ValueError(f"No exporter registered for {extension}.")
-        return cls.exporters[extension](data, str(path))
+        # Write next to the target, then swap it in: a crash mid-write never loses the old file
+        target = Path(path)
+        temp = cls._create_temp(target)
+        try:
+            with measure("FileIO.export") as m:
+                message = cls.exporters[extension](cls._rows(data, m), str(temp))
+            if target.exists(): # keep the target's mode
+                os.chmod(temp, stat.S_IMODE(target.stat().st_mode))
+            os.replace(temp, target)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        return message
+
+    @classmethod
+    def append(cls, ext: str, data: Iterable[dict | Task], path: str | PathLike[str]) -> str:
+        """Append rows to an existing file using the registered appender for ext."""
+        if not path:
+            raise ValueError("Please provide a valid file path.")
+        if data is None:
+            raise ValueError("No data to export.")
+        extension = cls._extension(ext)
+        if extension not in cls.appenders:
+            raise ValueError(f"No appender registered for {extension}.")
+        with measure("FileIO.append") as m:
+            return cls.appenders[extension](cls._rows(data, m), str(path))
 
     @classmethod
     def import_(cls, ext: str, path: str | PathLike[str]) -> list[dict]:
@@ -54,5 +124,128 @@ class FileIO:
         extension = cls._extension(ext)
         if extension not in cls.importers:
             raise ValueError(f"No importer registered for {extension}.")
-        return cls.importers[extension](str(path))
-    
\ No newline at end of file
+        with measure("FileIO.import_") as m:
+            records = cls.importers[extension](str(path))
+            m.rows = len(records)
+        return records
+
+    @classmethod
+    def import_many(
+            cls, paths: Sequence[str | PathLike[str]], workers: int | None = None,
+        ) -> tuple[list[dict], dict[str, str]]:
+        """Import and validate several files concurrently, one worker process per file at a time.
+
+        Returns (records, errors): the valid files' records merged in the order
+        of paths (ids dropped, since files number their tasks independently),
+        and {path: message} for each file that couldn't be read or has an
+        invalid task. Bad files don't stop the others. Feed the records to
+        TaskManager.ingest([records]).
+        """
+        paths = [str(path) for path in paths]
+        jobs, importers, errors = [], [], {}
+        for path in paths:
+            extension = Path(path).suffix.lower()
+            if extension not in cls.importers:
+                errors[path] = f"No importer registered for {extension or 'files without an extension'}."
+            else:
+                jobs.append(path)
+                importers.append(cls.importers[extension])
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with measure("FileIO.import_many") as m:
+            if workers == 1:
+                results = list(map(_load_and_validate, importers, jobs))
+            else:
+                from concurrent.futures import ProcessPoolExecutor # loads multiprocessing: only when needed
+                with ProcessPoolExecutor(workers) as pool:
+                    results = list(pool.map(_load_and_validate, importers, jobs))
+            records = []
+            for path, (file_records, error) in zip(jobs, results):
+                if error is not None:
+                    errors[path] = error
+                else:
+                    records.extend(file_records)
+            m.rows = len(records)
+        return records, {path: errors[path] for path in paths if path in errors}
+
+    @classmethod
+    def iter_import(cls, ext: str, path: str | PathLike[str], chunk_size: int = CHUNK_SIZE) -> Iterator[list[dict]]:
+        """Import data as batches of at most chunk_size records.
+
+        Uses the streaming importer for ext when one is registered, otherwise
+        falls back to slicing the result of the regular importer.
+        """
+        if not path:
+            raise ValueError("Please provide a valid file path.")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        extension = cls._extension(ext)
+        if extension in cls.stream_importers:
+            records = cls.stream_importers[extension](str(path))
+        elif extension in cls.importers:
+            records = cls.importers[extension](str(path))
+        else:
+            raise ValueError(f"No importer registered for {extension}.")
+        return cls._batches(iter(records), chunk_size)
+
+# ---- asyncio ----
+
+    @classmethod
+    async def aexport(
+            cls, ext: str, data: Iterable[dict | Task], path: str | PathLike[str], executor: Executor | None = None,
+        ) -> str:
+        """export() in an executor (default: the loop's thread pool).
+
+        data is consumed on the executor's thread, so pass a copy, e.g. the rows
+        of TaskManager.snapshot(), if coroutines may edit the tasks meanwhile.
+        """
+        loop = _running_loop()
+        return await loop.run_in_executor(executor, cls.export, ext, data, path)
+
+    @classmethod
+    async def aimport(cls, ext: str, path: str | PathLike[str], executor: Executor | None = None) -> list[dict]:
+        """import_() in an executor (default: the loop's thread pool)."""
+        loop = _running_loop()
+        return await loop.run_in_executor(executor, cls.import_, ext, path)
+
+    @classmethod
+    async def aiter_import(
+            cls, ext: str, path: str | PathLike[str], chunk_size: int = CHUNK_SIZE, executor: Executor | None = None,
+        ) -> AsyncIterator[list[dict]]:
+        """iter_import() with each batch read and parsed in an executor; the loop runs between batches."""
+        loop = _running_loop()
+        batches = await loop.run_in_executor(executor, cls.iter_import, ext, path, chunk_size)
+        while batch := await loop.run_in_executor(executor, next, batches, None):
+            yield batch
+
+    @staticmethod
+    def _rows(data: Iterable[dict | Task], measurement=None) -> Iterator[dict]:
+        """Lazily turn Tasks into Task.to_dict rows; dicts pass through. Counts rows into measurement."""
+        for row in data:
+            if measurement is not None:
+                measurement.rows += 1
+            yield row.to_dict() if isinstance(row, Task) else row
+
+    @staticmethod
+    def _batches(records: Iterator[dict], chunk_size: int) -> Iterator[list[dict]]:
+        while batch := list(islice(records, chunk_size)):
+            yield batch
+
+def _load_and_validate(importer: Importer, path: str) -> tuple[list[dict] | None, str | None]:
+    """Worker for import_many: (validated Task.to_dict rows, None) or (None, error message)."""
+    try:
+        records = importer(path)
+    except FileNotFoundError:
+        return None, "No such file exists."
+    except Exception as e: # Any importer failure is this file's error, not the batch's
+        return None, f"Could not read file: {e}"
+    rows = []
+    for number, record in enumerate(records, start=1):
+        try:
+            rows.append(Task.from_dict(record).to_dict())
+        except (KeyError, TypeError, ValueError) as e:
+            return None, f"Invalid task #{number}: {e}"
+    return rows, None
+
+def _running_loop():
+    import asyncio # not at module level: keeps CLI startup fast
+    return asyncio.get_running_loop()
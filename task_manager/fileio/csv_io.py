@@ -2,29 +2,135 @@
 
 CSV handlers.
 
-Export/import a list of dicts to/from CSV. 
+Export/import rows to/from CSV, streaming them one at a time. 
+Large files are imported in parallel: the file is cut into byte ranges that
+start on record boundaries (a newline outside quotes, so quoted newlines in a
+description never split a record), worker processes parse the ranges, and
+the rows are joined back in file order.
 Registers CSV handlers with FileIO on import.
 """
 
 import csv
+import io
+import os
+from collections.abc import Iterable, Iterator
+from ..task import Task
 from . import FileIO
 
-def export_csv(data: list[dict], path: str) -> str:
-    """Write list of dicts to CSV."""
-    # CSV needs at least one row to infer headers.
-    if not data:
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024 # smaller files parse faster than a pool starts
+BLOCK_SIZE = 1024 * 1024
+
+def export_csv(data: Iterable[dict], path: str) -> str:
+    """Write rows to CSV as they are produced.
+
+    Columns are Task.FIELDS, led by "id" when the first row carries ids. A
+    missing field is written empty; a key outside the schema is a ValueError.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
         raise ValueError("No data to export.")
+    fieldnames = ("id", *Task.FIELDS) if "id" in first else Task.FIELDS
     with open(path, "w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames = data[0].keys())
+        writer = csv.DictWriter(file, fieldnames=fieldnames, restval="", extrasaction="raise")
         writer.writeheader()
-        writer.writerows(data)
+        writer.writerow(first)
+        writer.writerows(rows)
     return "Exported Successfully."
 
-def import_csv(path: str) -> list[dict]:
-    """Read list of dicts from CSV."""
+def import_csv(path: str, workers: int | None = None, min_bytes: int = PARALLEL_MIN_BYTES) -> list[dict]:
+    """Read list of dicts from CSV, in parallel when the file is at least min_bytes.
+
+    workers defaults to the number of CPUs. Rows are the same as csv.DictReader's.
+    Expects quotes as csv.writer writes them (a field containing a quote is quoted).
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and os.path.getsize(path) >= min_bytes:
+        return _import_parallel(path, workers)
     with open(path, "r", newline="", encoding="utf-8") as file:
         reader = csv.DictReader(file)
         return list(reader)
 
+def iter_csv(path: str) -> Iterator[dict]:
+    """Yield CSV rows as dicts, one at a time."""
+    with open(path, "r", newline="", encoding="utf-8") as file:
+        yield from csv.DictReader(file)
+
+# ---- Parallel import ----
+
+def _import_parallel(path: str, workers: int) -> list[dict]:
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        header_end = _record_end(file, 0, 0)
+        file.seek(0)
+        header = file.read(header_end).decode("utf-8")
+        fieldnames = next(csv.reader(io.StringIO(header, newline="")), None)
+        if fieldnames is None:
+            return []
+        ranges = _split(file, header_end, size, workers * 4) # a few ranges per worker evens out the load
+    from concurrent.futures import ProcessPoolExecutor # loads multiprocessing: only when needed
+    rows = []
+    with ProcessPoolExecutor(workers) as pool:
+        for part in pool.map(_parse_range, [path] * len(ranges), *zip(*ranges), [fieldnames] * len(ranges)):
+            rows.extend(part)
+    return rows
+
+def _split(file, start: int, size: int, parts: int) -> list[tuple[int, int]]:
+    """Cut [start, size) into about parts byte ranges, each starting on a record boundary."""
+    step = max((size - start) // parts, 1)
+    bounds, parity, counted = [start], 0, start
+    for target in range(start + step, size, step):
+        if target <= bounds[-1]:
+            continue
+        # Quotes before target tell whether target falls inside a quoted field
+        parity = (parity + _count_quotes(file, counted, target)) % 2
+        counted = target
+        end = _record_end(file, target, parity)
+        if end < size and end > bounds[-1]:
+            bounds.append(end)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+def _count_quotes(file, start: int, end: int) -> int:
+    file.seek(start)
+    count, left = 0, end - start
+    while left > 0:
+        block = file.read(min(BLOCK_SIZE, left))
+        if not block:
+            break
+        count += block.count(b'"')
+        left -= len(block)
+    return count
+
+def _record_end(file, offset: int, parity: int) -> int:
+    """Offset just past the first newline at or after offset that is outside quotes.
+
+    parity is the number of quotes before offset, mod 2 (1 = inside a quoted field).
+    """
+    file.seek(offset)
+    position = offset
+    while block := file.read(BLOCK_SIZE):
+        at = 0
+        while True:
+            newline = block.find(b"\n", at)
+            stop = len(block) if newline < 0 else newline
+            parity = (parity + block.count(b'"', at, stop)) % 2
+            if newline < 0:
+                break
+            if parity == 0:
+                return position + newline + 1
+            at = newline + 1
+        position += len(block)
+    return position
+
+def _parse_range(path: str, start: int, end: int, fieldnames: list[str]) -> list[dict]:
+    """Worker: parse the records in [start, end) of path."""
+    with open(path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+    return list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+
+
 FileIO.register_exporter(".csv", export_csv)
-FileIO.register_importer(".csv", import_csv)
\ No newline at end of file
+FileIO.register_importer(".csv", import_csv)
+FileIO.register_stream_importer(".csv", iter_csv)
\ No newline at end of file
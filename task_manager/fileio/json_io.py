@@ -2,19 +2,30 @@
 
 JSON handlers.
 
-Export/import a list of dicts to/from JSON. 
+Export/import rows to/from JSON, streaming the items of the top-level
+array one at a time. 
 Registers JSON handlers with FileIO on import.
 """
 
 import json
+import re
+from collections.abc import Iterable, Iterator
 from . import FileIO
 
-def export_json(data: list[dict], path: str) -> str:
-    """Write list of dicts to JSON."""
+BLOCK_SIZE = 1 << 16
+_NON_SPACE = re.compile(r"\S")
+
+def export_json(data: Iterable[dict], path: str) -> str:
+    """Write rows to a JSON array one item at a time (same layout as indent=2)."""
     if data is None:
         raise ValueError("No data to export.")
     with open(path, "w", encoding="utf-8") as file:
-        json.dump(data, file,ensure_ascii=False, indent=2)
+        separator = "[\n  "
+        for row in data:
+            file.write(separator)
+            file.write(json.dumps(row, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            separator = ",\n  "
+        file.write("[]" if separator.startswith("[") else "\n]")
     return "Exported Successfully."
 
 def import_json(path: str) -> list[dict]:
@@ -22,6 +33,53 @@ def import_json(path: str) -> list[dict]:
     with open(path, "r", encoding="utf-8") as file:
         return json.load(file)
 
+def iter_json(path: str, block_size: int = BLOCK_SIZE) -> Iterator[dict]:
+    """Yield the items of a top-level JSON array, reading the file in blocks."""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as file:
+        buffer, pos, eof = "", 0, False
+
+        def skip_space() -> str:
+            """Advance past whitespace (reading more if needed); return next char or ''."""
+            nonlocal buffer, pos, eof
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return buffer[pos] if pos < len(buffer) else ""
+                buffer, pos = file.read(block_size), 0
+                eof = not buffer
+
+        if skip_space() != "[":
+            raise json.JSONDecodeError("Expecting '['", buffer, pos)
+        pos += 1
+        if skip_space() == "]":
+            return
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # Need the following ',' or ']' in the buffer to trust the item
+                complete = eof or _NON_SPACE.search(buffer, end) is not None
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                more = file.read(block_size)
+                eof = not more
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            pos = end
+            yield item
+            char = skip_space()
+            if char == "]":
+                return
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            skip_space()
+
 
 FileIO.register_exporter(".json", export_json)
-FileIO.register_importer(".json", import_json)
\ No newline at end of file
+FileIO.register_importer(".json", import_json)
+FileIO.register_stream_importer(".json", iter_json)
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+
+JSON Lines handlers.
+
+Export/import rows to/from JSON Lines (one JSON object per line), and
+append rows to an existing file without rewriting it.
+Registers JSONL handlers with FileIO on import.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from . import FileIO
+
+def export_jsonl(data: Iterable[dict], path: str) -> str:
+    """Write rows to JSON Lines, one line per row."""
+    if data is None:
+        raise ValueError("No data to export.")
+    with open(path, "w", encoding="utf-8") as file:
+        _write_lines(file, data)
+    return "Exported Successfully."
+
+def append_jsonl(data: Iterable[dict], path: str) -> str:
+    """Append rows to an existing JSON Lines file; cost is proportional to the rows."""
+    if data is None:
+        raise ValueError("No data to export.")
+    with open(path, "a", encoding="utf-8") as file:
+        _write_lines(file, data)
+    return "Appended Successfully."
+
+def import_jsonl(path: str) -> list[dict]:
+    """Read list of dicts from JSON Lines."""
+    return list(iter_jsonl(path))
+
+def iter_jsonl(path: str) -> Iterator[dict]:
+    """Yield one dict per non-blank line."""
+    loads = json.loads
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield loads(line)
+
+def _write_lines(file, data: Iterable[dict]) -> None:
+    dumps = json.dumps
+    file.writelines(dumps(row, ensure_ascii=False) + "\n" for row in data)
+
+
+FileIO.register_exporter(".jsonl", export_jsonl)
+FileIO.register_importer(".jsonl", import_jsonl)
+FileIO.register_stream_importer(".jsonl", iter_jsonl)
+FileIO.register_appender(".jsonl", append_jsonl)
@@ -0,0 +1,132 @@
+"""
+
+NumPy (.npz) handlers.
+
+Export/import rows as a columnar snapshot: one typed array per Task field,
+with dates as int32 day ordinals and priority/status as int8 (status as a
+code into STATUS_CODES, which is saved alongside). Titles and descriptions
+are each one UTF-8 string heap plus int64 character offsets, so a single
+long string doesn't widen every row the way a fixed-width numpy string
+column would. load_columns hands the
+columns to TaskManager.ingest_columns without building a dict per row.
+numpy is imported on first use, so registering the format costs nothing.
+Registers NPZ handlers with FileIO on import.
+"""
+
+import zipfile
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import date
+from ..store import TaskStore
+from . import FileIO
+
+STATUS_CODES = TaskStore.STATUS_CODES
+STATUS_INDEX = TaskStore.STATUS_INDEX
+COLUMNS = TaskStore.COLUMNS
+STRING_COLUMNS = ("title", "description")
+
+def export_npz(data: Iterable[dict], path: str) -> str:
+    """Write rows as typed columns (ids are 0 for rows without one)."""
+    import numpy as np
+    if data is None:
+        raise ValueError("No data to export.")
+    from_iso = date.fromisoformat
+    ids, priorities, statuses = array("q"), array("b"), array("b")
+    start_days, end_days = array("i"), array("i")
+    titles, descriptions = [], []
+    try:
+        for row in data:
+            task_id = row.get("id")
+            ids.append(0 if task_id in (None, "") else int(task_id))
+            titles.append(row["title"])
+            start_days.append(from_iso(str(row["period_start_date"])).toordinal())
+            end_days.append(from_iso(str(row["period_end_date"])).toordinal())
+            priorities.append(int(row["priority"]))
+            statuses.append(STATUS_INDEX[row["status"]])
+            descriptions.append(row.get("description") or "")
+    except KeyError as e:
+        raise ValueError(f"Missing or invalid field in row: {e}.")
+    with open(path, "wb") as file: # a file object, so numpy doesn't append ".npz" to the name
+        np.savez(
+            file,
+            id=np.asarray(ids, dtype=np.int64),
+            period_start_date=np.asarray(start_days, dtype=np.int32),
+            period_end_date=np.asarray(end_days, dtype=np.int32),
+            priority=np.asarray(priorities, dtype=np.int8),
+            status=np.asarray(statuses, dtype=np.int8),
+            status_codes=np.array(STATUS_CODES, dtype=str),
+            **_heap("title", titles),
+            **_heap("description", descriptions),
+        )
+    return "Exported Successfully."
+
+def _heap(name: str, strings: list[str]) -> dict:
+    """<name>_heap (UTF-8 bytes of all strings joined) and <name>_offsets (len(strings) + 1 character offsets)."""
+    import numpy as np
+    offsets = array("q", [0])
+    total = 0
+    for text in strings:
+        total += len(text)
+        offsets.append(total)
+    heap = "".join(strings).encode("utf-8")
+    return {
+        f"{name}_heap": np.frombuffer(heap, dtype=np.uint8),
+        f"{name}_offsets": np.asarray(offsets, dtype=np.int64),
+    }
+
+def _strings(file, name: str) -> list[str]:
+    """The strings of a <name>_heap/<name>_offsets pair (or of a plain string column)."""
+    if name in file.files: # fixed-width column, as older snapshots stored it
+        return file[name].tolist()
+    text = file[f"{name}_heap"].tobytes().decode("utf-8")
+    offsets = file[f"{name}_offsets"].tolist()
+    if not offsets or offsets[0] != 0 or offsets[-1] != len(text) or any(map(int.__gt__, offsets, offsets[1:])):
+        raise ValueError(f"Not a task .npz file: bad {name} offsets.")
+    return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+def load_columns(path: str) -> dict[str, list]:
+    """Read the columns as plain lists (dates as ordinals, status as codes into STATUS_CODES)."""
+    import numpy as np
+    try:
+        with np.load(path, allow_pickle=False) as file:
+            arrays = {name: file[name] for name in (*COLUMNS, "status_codes") if name not in STRING_COLUMNS}
+            strings = {name: _strings(file, name) for name in STRING_COLUMNS}
+        saved_codes = arrays.pop("status_codes").tolist()
+        if tuple(saved_codes) != STATUS_CODES: # Written with another status list: remap by name
+            arrays["status"] = np.asarray([STATUS_INDEX[code] for code in saved_codes], dtype=np.int8)[arrays["status"]]
+    except KeyError as e:
+        raise ValueError(f"Not a task .npz file: missing or unknown {e}.")
+    except (EOFError, zipfile.BadZipFile, UnicodeDecodeError) as e: # empty, truncated or garbled
+        raise ValueError(f"Not a task .npz file: {e}")
+    columns = {name: column.tolist() for name, column in arrays.items()}
+    return {name: strings[name] if name in strings else columns[name] for name in COLUMNS}
+
+def import_npz(path: str) -> list[dict]:
+    """Read list of dicts from a .npz snapshot."""
+    return list(iter_npz(path))
+
+def iter_npz(path: str) -> Iterator[dict]:
+    """Yield Task.to_dict-shaped rows (with "id" when one was saved)."""
+    columns = load_columns(path)
+    iso: dict[int, str] = {} # Many tasks share dates; format each once
+    def to_iso(ordinal: int) -> str:
+        text = iso.get(ordinal)
+        if text is None:
+            text = iso[ordinal] = date.fromordinal(ordinal).isoformat()
+        return text
+    for task_id, title, start, end, priority, status, description in zip(*(columns[name] for name in COLUMNS)):
+        record = {"id": task_id} if task_id else {}
+        record.update(
+            title=title,
+            period_start_date=to_iso(start),
+            period_end_date=to_iso(end),
+            priority=priority,
+            status=STATUS_CODES[status],
+            description=description,
+        )
+        yield record
+
+
+FileIO.register_exporter(".npz", export_npz)
+FileIO.register_importer(".npz", import_npz)
+FileIO.register_stream_importer(".npz", iter_npz)
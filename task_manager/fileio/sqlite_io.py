@@ -0,0 +1,79 @@
+"""
+
+SQLite handlers.
+
+Export/import rows to/from a SQLite database (stdlib sqlite3) with one
+"tasks" table indexed on status, priority and period_end_date.
+Registers SQLite handlers with FileIO on import (".sqlite" and ".db").
+"""
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from . import FileIO
+
+COLUMNS = ("title", "period_start_date", "period_end_date", "priority", "status", "description")
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    period_start_date TEXT NOT NULL,
+    period_end_date TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority, period_end_date);
+CREATE INDEX IF NOT EXISTS tasks_end_date ON tasks (period_end_date);
+"""
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (creating if needed) a task database."""
+    connection = sqlite3.connect(path, check_same_thread=False) # SQLiteTaskStore shares it behind its lock
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+    return connection
+
+def export_sqlite(data: Iterable[dict], path: str) -> str:
+    """Write rows into a fresh tasks table (ids are kept when rows have them)."""
+    if data is None:
+        raise ValueError("No data to export.")
+    connection = connect(path)
+    try:
+        with connection:
+            connection.execute("DELETE FROM tasks")
+            connection.executemany(
+                f"INSERT INTO tasks (id, {', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (row.get("id") or None, *(row.get(column, "") for column in COLUMNS))
+                    for row in data
+                ),
+            )
+    finally:
+        connection.close()
+    return "Exported Successfully."
+
+def import_sqlite(path: str) -> list[dict]:
+    """Read list of dicts from a task database."""
+    return list(iter_sqlite(path))
+
+def iter_sqlite(path: str) -> Iterator[dict]:
+    """Yield rows (with their id) in id order."""
+    if not os.path.exists(path): # sqlite3 would silently create it
+        raise FileNotFoundError(path)
+    try:
+        connection = connect(path)
+        try:
+            for row in connection.execute(f"SELECT id, {', '.join(COLUMNS)} FROM tasks ORDER BY id"):
+                yield dict(row)
+        finally:
+            connection.close()
+    except sqlite3.DatabaseError as e:
+        raise ValueError(f"Not a task database: {e}")
+
+
+for _ext in (".sqlite", ".db"):
+    FileIO.register_exporter(_ext, export_sqlite)
+    FileIO.register_importer(_ext, import_sqlite)
+    FileIO.register_stream_importer(_ext, iter_sqlite)
@@ -0,0 +1,178 @@
+"""
+
+Task binary (.tmb) handlers.
+
+A compact memory-mapped format: a fixed-width header, one fixed-width record
+per task (id, priority, status code, start/end day ordinals and offsets into
+a UTF-8 string heap for title and description), an end-date index sorted by
+end day, then the heap. TmbFile maps the file and decodes only the records
+it is asked for, so opening a large file is cheap, and random access or an
+end-date range scan touches only the pages it needs.
+Registers TMB handlers with FileIO on import.
+"""
+
+import mmap
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from ..store import TaskStore
+from . import FileIO
+
+MAGIC = b"TMB1"
+HEADER = struct.Struct("<4sQQQ") # magic, count, index offset, heap offset
+RECORD = struct.Struct("<qbbxxiiQIQI") # id, priority, status, start, end, title off/len, description off/len
+INDEX = struct.Struct("<iI") # end day, record number
+STATUS_CODES = TaskStore.STATUS_CODES
+STATUS_INDEX = TaskStore.STATUS_INDEX
+
+class TmbFile(Sequence):
+    """Read-only view of a .tmb file; items are record dicts (with "id" when one was saved)."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError: # empty file
+                raise ValueError("Not a task binary file.")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError("Not a task binary file.")
+        magic, self._count, self._index, self._heap = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Not a task binary file.")
+        # The sections must follow each other exactly, with the heap inside the file
+        if (
+            self._index != HEADER.size + self._count * RECORD.size
+            or self._heap != self._index + self._count * INDEX.size
+            or self._heap > len(self._map)
+        ):
+            self.close()
+            raise ValueError("Corrupt .tmb file")
+        self._end_days = _EndDays(self)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not (0 <= index < self._count):
+            raise IndexError("Task index out of range.")
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(self._count):
+            yield self._record(i)
+
+    def __enter__(self) -> "TmbFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def ending_between(self, first: date, last: date) -> Iterator[dict]:
+        """Records whose end date is in [first, last], soonest first (binary search on the index)."""
+        low = bisect_left(self._end_days, first.toordinal())
+        high = bisect_right(self._end_days, last.toordinal(), lo=low)
+        for k in range(low, high):
+            _, number = INDEX.unpack_from(self._map, self._index + k * INDEX.size)
+            if number >= self._count:
+                raise ValueError("Corrupt .tmb file")
+            yield self._record(number)
+
+    def _record(self, number: int) -> dict:
+        task_id, priority, status, start, end, title_at, title_len, text_at, text_len = RECORD.unpack_from(
+            self._map, HEADER.size + number * RECORD.size
+        )
+        record = {"id": task_id} if task_id else {}
+        try: # records are checked as they are decoded, so opening stays O(1)
+            record.update(
+                title=self._text(title_at, title_len),
+                period_start_date=date.fromordinal(start).isoformat(),
+                period_end_date=date.fromordinal(end).isoformat(),
+                priority=priority,
+                status=STATUS_CODES[status],
+                description=self._text(text_at, text_len),
+            )
+        except (ValueError, IndexError, OverflowError):
+            raise ValueError("Corrupt .tmb file")
+        return record
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._heap + offset
+        if start + length > len(self._map):
+            raise ValueError("Corrupt .tmb file")
+        return self._map[start:start + length].decode("utf-8")
+
+class _EndDays(Sequence):
+    """The index's end days as a sequence, for bisect."""
+
+    def __init__(self, file: TmbFile):
+        self._file = file
+
+    def __len__(self) -> int:
+        return self._file._count
+
+    def __getitem__(self, k: int) -> int:
+        return INDEX.unpack_from(self._file._map, self._file._index + k * INDEX.size)[0]
+
+def export_tmb(data: Iterable[dict], path: str) -> str:
+    """Write rows as fixed-width records; the string heap is spooled and copied in after them."""
+    if data is None:
+        raise ValueError("No data to export.")
+    end_days = array("i")
+    with open(path, "wb") as file, tempfile.TemporaryFile() as heap:
+        file.write(bytes(HEADER.size))
+        heap_size = 0
+        for row in data:
+            title = str(row["title"]).encode("utf-8")
+            text = str(row.get("description") or "").encode("utf-8")
+            end = date.fromisoformat(str(row["period_end_date"])).toordinal()
+            task_id = row.get("id")
+            if row["status"] not in STATUS_INDEX:
+                raise ValueError(f"Invalid status {row['status']!r} in row.")
+            file.write(RECORD.pack(
+                int(task_id) if task_id not in (None, "") else 0,
+                int(row["priority"]),
+                STATUS_INDEX[row["status"]],
+                date.fromisoformat(str(row["period_start_date"])).toordinal(),
+                end,
+                heap_size, len(title), heap_size + len(title), len(text),
+            ))
+            heap.write(title)
+            heap.write(text)
+            heap_size += len(title) + len(text)
+            end_days.append(end)
+        index_at = file.tell()
+        for number in sorted(range(len(end_days)), key=end_days.__getitem__):
+            file.write(INDEX.pack(end_days[number], number))
+        heap_at = file.tell()
+        heap.seek(0)
+        while chunk := heap.read(1 << 20):
+            file.write(chunk)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, len(end_days), index_at, heap_at))
+    return "Exported Successfully."
+
+def import_tmb(path: str) -> list[dict]:
+    """Read list of dicts from a .tmb file."""
+    return list(iter_tmb(path))
+
+def iter_tmb(path: str) -> Iterator[dict]:
+    """Yield records in file order, decoding one at a time from the mapping."""
+    with TmbFile(path) as file:
+        yield from file
+
+
+FileIO.register_exporter(".tmb", export_tmb)
+FileIO.register_importer(".tmb", import_tmb)
+FileIO.register_stream_importer(".tmb", iter_tmb)
@@ -0,0 +1,103 @@
+"""
+
+Secondary task indexes.
+
+Hash buckets on status and priority, and a sorted index on end date (day
+ordinal). Entries are keyed by a row key supplied by the owning store.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from heapq import merge
+from operator import itemgetter
+
+class TaskIndex:
+    """Maintained lookups on status, priority and period_end_date."""
+
+    def __init__(self):
+        self.by_status: dict[int, set[int]] = {}
+        self.by_priority: dict[int, set[int]] = {}
+        # Sorted end-date index kept as two parallel arrays (ordinal, key)
+        self.end_days = array("i")
+        self.end_keys = array("q")
+
+    def add(self, key: int, status: int, priority: int, end_day: int) -> None:
+        """Index a row."""
+        self.by_status.setdefault(status, set()).add(key)
+        self.by_priority.setdefault(priority, set()).add(key)
+        position = bisect_right(self.end_days, end_day)
+        self.end_days.insert(position, end_day)
+        self.end_keys.insert(position, key)
+
+    def remove(self, key: int, status: int, priority: int, end_day: int) -> None:
+        """Drop a row from every index."""
+        self.by_status[status].discard(key)
+        self.by_priority[priority].discard(key)
+        lo = bisect_left(self.end_days, end_day)
+        hi = bisect_right(self.end_days, end_day, lo)
+        for position in range(lo, hi):
+            if self.end_keys[position] == key:
+                del self.end_days[position]
+                del self.end_keys[position]
+                return
+
+    def add_many(self, rows: Iterable[tuple[int, int, int, int]]) -> None:
+        """Index (key, status, priority, end_day) rows: one merge into the end-date index, not an insert each."""
+        ends = []
+        for key, status, priority, end_day in rows:
+            self.by_status.setdefault(status, set()).add(key)
+            self.by_priority.setdefault(priority, set()).add(key)
+            ends.append((end_day, key))
+        if not ends:
+            return
+        ends.sort()
+        # Existing entries first on equal days, as add() would place them
+        merged = list(merge(zip(self.end_days, self.end_keys), ends, key=itemgetter(0)))
+        self.end_days = array("i", (end_day for end_day, _ in merged))
+        self.end_keys = array("q", (key for _, key in merged))
+
+    def remove_many(self, rows: Iterable[tuple[int, int, int, int]]) -> None:
+        """Drop (key, status, priority, end_day) rows with one pass over the end-date index."""
+        keys = set()
+        for key, status, priority, _ in rows:
+            self.by_status[status].discard(key)
+            self.by_priority[priority].discard(key)
+            keys.add(key)
+        if not keys:
+            return
+        kept = [(end_day, key) for end_day, key in zip(self.end_days, self.end_keys) if key not in keys]
+        self.end_days = array("i", (end_day for end_day, _ in kept))
+        self.end_keys = array("q", (key for _, key in kept))
+
+    def restatus(self, key: int, old: int, new: int) -> None:
+        """Move a row to another status bucket."""
+        self.by_status[old].discard(key)
+        self.by_status.setdefault(new, set()).add(key)
+
+    def rebuild(self, rows: Iterable[tuple[int, int, int, int]]) -> None:
+        """Rebuild from (key, status, priority, end_day) rows in one pass."""
+        self.by_status.clear()
+        self.by_priority.clear()
+        ends = []
+        for key, status, priority, end_day in rows:
+            self.by_status.setdefault(status, set()).add(key)
+            self.by_priority.setdefault(priority, set()).add(key)
+            ends.append((end_day, key))
+        ends.sort()
+        self.end_days = array("i", (end_day for end_day, _ in ends))
+        self.end_keys = array("q", (key for _, key in ends))
+
+# ---- Lookups ----
+
+    def status(self, status: int) -> set[int]:
+        return self.by_status.get(status, set())
+
+    def priority(self, priority: int) -> set[int]:
+        return self.by_priority.get(priority, set())
+
+    def ending_between(self, first_day: int, last_day: int) -> list[int]:
+        """Keys whose end day is in [first_day, last_day], in end-date order."""
+        lo = bisect_left(self.end_days, first_day)
+        hi = bisect_right(self.end_days, last_day, lo)
+        return self.end_keys[lo:hi].tolist()
@@ -2,50 +2,120 @@
 
 Report module.
 
-Generates pandas reports from in-memory task records (list[dict]).
+Generates pandas reports from in-memory task records (list[dict]) or from a
+TaskManager. For an in-memory manager the base DataFrame is built straight
+from the store's typed columns and cached until the manager's version or the
+as-of date changes, so repeated report views only filter and sort. When the
+manager works against a SQLite database, filtering and sorting run as indexed
+SQL queries and only the report rows reach pandas.
 """
 
+from datetime import date
+from weakref import WeakKeyDictionary
 import pandas as pd
 from . import TaskManager
+from .store import TaskStore
+from .stats import timed
 
-def remaining_days(df: pd.DataFrame) -> pd.Series:
+# manager -> (store, version, as_of, base frame, {report name: report frame})
+_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+def remaining_days(df: pd.DataFrame, as_of: date | None = None) -> pd.Series:
     """Return days remaining until end date (negative if overdue)."""
     end_date = pd.to_datetime(df["period_end_date"])
-    today = pd.Timestamp.today().normalize()
-    return (end_date - today).dt.days 
+    today = pd.Timestamp.today().normalize() if as_of is None else pd.Timestamp(as_of)
+    return (end_date - today).dt.days
 
-def get_overdue_report(records: list[dict]) -> pd.DataFrame:
-    """Overdue tasks (remaining_days < 0), sorted by how overdue they are."""
-    df = pd.DataFrame(records)
-    if df.empty:
+def frame_from_columns(columns: dict, as_of: date | None = None) -> pd.DataFrame:
+    """Frame from TaskStore.columns()/npz_io.load_columns()-shaped columns, without building dicts.
+
+    Dates come out as ISO strings (each distinct date is formatted once) and
+    remaining_days is computed from the day ordinals.
+    """
+    def to_iso(ordinals: pd.Series) -> pd.Series:
+        return ordinals.map({day: date.fromordinal(day).isoformat() for day in ordinals.unique()})
+    end_days = pd.Series(columns["period_end_date"], dtype="int64")
+    return pd.DataFrame({
+        "title": pd.Series(columns["title"], dtype=object),
+        "period_start_date": to_iso(pd.Series(columns["period_start_date"], dtype="int64")),
+        "period_end_date": to_iso(end_days),
+        "priority": pd.Series(columns["priority"], dtype="int64"),
+        "status": pd.Categorical.from_codes(
+            pd.Series(columns["status"], dtype="int64"), categories=TaskStore.STATUS_CODES
+        ).astype(object),
+        "description": pd.Series(columns["description"], dtype=object),
+        "remaining_days": end_days - (as_of or date.today()).toordinal(),
+    })
+
+def base_frame(source: list[dict] | TaskManager, as_of: date | None = None) -> pd.DataFrame:
+    """Every task plus remaining_days as of as_of (default today). Treat it as read-only.
+
+    For a TaskManager the frame is cached until its version or as_of changes.
+    """
+    return _entry(source, as_of)[3]
+
+def _entry(source: list[dict] | TaskManager, as_of: date | None) -> tuple:
+    as_of = as_of or date.today()
+    if not isinstance(source, TaskManager):
+        df = pd.DataFrame(source)
+        if not df.empty:
+            df["remaining_days"] = remaining_days(df, as_of)
+        return (None, None, as_of, df, {})
+    cached = _cache.get(source)
+    if cached is not None and cached[0] is source.tasks and cached[1] == source.version and cached[2] == as_of:
+        return cached
+    tasks = source.tasks.snapshot() # no lock: writers carry on while the frame is built
+    entry = _cache[source] = (source.tasks, tasks.version, as_of, frame_from_columns(tasks.columns(), as_of), {})
+    return entry
+
+def _report(source: list[dict] | TaskManager, kind: str, as_of: date | None, build) -> pd.DataFrame:
+    """SQL report for a SQLite store; otherwise build(base frame), memoized with the base frame."""
+    if isinstance(source, TaskManager) and hasattr(source.tasks, "report_rows"):
+        if not source.tasks:
+            raise ValueError(TaskManager.EMPTY_MESSAGE)
+        rows = source.tasks.report_rows(kind, as_of)
+        if not rows:
+            raise ValueError("Not enough data to report.")
+        return pd.DataFrame(rows)
+    *_, base, results = _entry(source, as_of)
+    if base.empty:
         raise ValueError(TaskManager.EMPTY_MESSAGE)
-    df["remaining_days"] = remaining_days(df)
+    if kind not in results:
+        results[kind] = build(base)
+    return results[kind].copy() # callers may modify their report
+
+def _shape(df: pd.DataFrame, *drop: str) -> pd.DataFrame:
+    """Drop non-report columns."""
+    return df.drop(columns=["description", *drop], errors="ignore").reset_index(drop=True)
+
+def _overdue(df: pd.DataFrame) -> pd.DataFrame:
     df = df[df["remaining_days"] < 0].sort_values(["remaining_days", "title"], ascending=[True, True])
     if df.empty:
         raise ValueError("Not enough data to report.")
-    df = df.drop(columns=["description"], errors="ignore") # Drop non-report columns
-    return df.reset_index(drop=True) 
+    return _shape(df)
 
-def get_priority_report(records: list[dict]) -> pd.DataFrame:
-    """Tasks sorted by priority (high first), then by nearest end date."""
-    df = pd.DataFrame(records)
-    if df.empty:
-        raise ValueError(TaskManager.EMPTY_MESSAGE)
-    df["period_end_date"] = pd.to_datetime(df["period_end_date"])
+def _priority(df: pd.DataFrame) -> pd.DataFrame:
+    # ISO dates sort like dates
     df = df.sort_values(["priority","period_end_date", "title"], ascending=[True, True, True])
-    df = df.drop(columns=["description"], errors="ignore") # Drop non-report columns
-    df["period_end_date"] = df["period_end_date"].dt.strftime("%Y-%m-%d")
-    return df.reset_index(drop=True)
+    return _shape(df, "remaining_days")
 
-def get_remaining_report(records: list[dict]) -> pd.DataFrame:
-    """Non-overdue tasks with remaining_days >= 0, sorted soonest first."""
-    df = pd.DataFrame(records)
-    if df.empty:
-        raise ValueError(TaskManager.EMPTY_MESSAGE)
-    df["remaining_days"] = remaining_days(df)
+def _remaining(df: pd.DataFrame) -> pd.DataFrame:
     df = df[df["remaining_days"] >= 0].sort_values(["remaining_days", "title"], ascending=[True, True])
     if df.empty:
         raise ValueError("Not enough data to report.")
-    df = df.drop(columns=["description"], errors="ignore") # Drop non-report columns
-    return df.reset_index(drop=True)
- 
\ No newline at end of file
+    return _shape(df)
+
+@timed("reports.get_overdue_report", rows=len)
+def get_overdue_report(records: list[dict] | TaskManager, as_of: date | None = None) -> pd.DataFrame:
+    """Overdue tasks (remaining_days < 0), sorted by how overdue they are."""
+    return _report(records, "overdue", as_of, _overdue)
+
+@timed("reports.get_priority_report", rows=len)
+def get_priority_report(records: list[dict] | TaskManager, as_of: date | None = None) -> pd.DataFrame:
+    """Tasks sorted by priority (high first), then by nearest end date."""
+    return _report(records, "priority", as_of, _priority)
+
+@timed("reports.get_remaining_report", rows=len)
+def get_remaining_report(records: list[dict] | TaskManager, as_of: date | None = None) -> pd.DataFrame:
+    """Non-overdue tasks with remaining_days >= 0, sorted soonest first."""
+    return _report(records, "remaining", as_of, _remaining)
@@ -0,0 +1,433 @@
+"""
+
+SQLite-backed task store.
+
+Drop-in replacement for TaskStore that keeps rows in a SQLite database
+instead of memory, so TaskManager can work on lists larger than RAM. Task
+numbers are ranks in id order; ids are the table's INTEGER PRIMARY KEY.
+Lookups and the three reports run as indexed SQL queries.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date
+from functools import partial
+from threading import RLock
+from .fileio.sqlite_io import COLUMNS, connect
+from .task import Task
+
+COLUMNS_WITH_ID = ("id", *COLUMNS)
+
+class SQLiteTaskStore(Sequence):
+    """Stores tasks in a SQLite "tasks" table; every change is committed right away."""
+    _SELECT = f"SELECT id, {', '.join(COLUMNS)} FROM tasks"
+    _INSERT = f"INSERT INTO tasks (id, {', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    _UPDATE = f"UPDATE tasks SET {', '.join(f'{column} = ?' for column in COLUMNS)} WHERE id = ?"
+    _REPORT_COLUMNS = "title, period_start_date, period_end_date, priority, status"
+    _REMAINING = "CAST(julianday(period_end_date) - julianday(?) AS INTEGER) AS remaining_days"
+    FETCH_SIZE = 1000 # rows per lock hold when streaming
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self.connection = connect(self.path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.version = 0
+        self.rewrites = 0
+        self.lock = RLock()
+        self.listeners: list[Callable[[str, int | None, dict | None], None]] = []
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return self._read("SELECT COUNT(*) FROM tasks")[0][0]
+
+    def __getitem__(self, index: int | slice) -> Task | list[Task]:
+        """Build the Task (or list of Tasks) at a position."""
+        with self.lock: # the position and the row it names must come from the same state
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self))
+                if step != 1:
+                    return [self[i] for i in range(start, stop, step)]
+                rows = self._read(f"{self._SELECT} ORDER BY id LIMIT ? OFFSET ?", (max(stop - start, 0), start))
+                return [self._build(row) for row in rows]
+            return self._build(self._row(self.id_at(index)))
+
+    def __setitem__(self, index: int, task: Task) -> None:
+        with self.lock:
+            self.replace(self.id_at(index), task)
+
+    def __delitem__(self, index: int) -> None:
+        with self.lock:
+            self.remove(self.id_at(index))
+
+    def __iter__(self) -> Iterator[Task]:
+        for row in self._stream(f"{self._SELECT} ORDER BY id"):
+            yield self._build(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    @property
+    def slots(self) -> int:
+        """Same contract as TaskStore.slots: ids only grow, so rows past this are new."""
+        return len(self)
+
+    def append(self, task: Task, task_id: int | None = None) -> int:
+        """Insert task as a new row and return its id."""
+        with self.lock:
+            if task_id is not None and self.has_id(task_id):
+                raise ValueError(f"Duplicate task id {task_id}.")
+            with self.connection:
+                cursor = self.connection.execute(self._INSERT, (task_id, *self._values(task)))
+            task_id = cursor.lastrowid
+            self.version += 1
+            self._emit("add", task_id)
+            return task_id
+
+    def extend_records(self, records: Iterable[dict], trusted: bool = False) -> int:
+        """Insert exported dicts in one transaction, validated like TaskStore.extend_records.
+
+        trusted=True skips the normalization for rows this package wrote itself.
+        """
+        validate = Task.validate_record
+        rows = []
+        for number, data in enumerate(records, start=1):
+            try:
+                task_id = data.get("id")
+                task_id = None if task_id in (None, "") else int(task_id)
+                if trusted:
+                    if data["status"] not in Task.STATUS_MAP:
+                        raise ValueError(f"Invalid status {data['status']!r}.")
+                    title, description = data["title"], data.get("description") or ""
+                    start = date.fromisoformat(data["period_start_date"])
+                    end = date.fromisoformat(data["period_end_date"])
+                    priority, status = int(data["priority"]), data["status"]
+                else:
+                    title, start, end, priority, status, description = validate(data)
+            except KeyError as e:
+                raise ValueError(f"Missing or invalid field in record #{number}: {e}.")
+            except (TypeError, AttributeError, ValueError) as e:
+                raise ValueError(f"Invalid value in record #{number}: {e}")
+            if task_id is not None and not (1 <= task_id < 2**63):
+                raise ValueError(f"Invalid task id {task_id} in record #{number}.")
+            if not isinstance(title, str) or not title.strip():
+                raise ValueError(f"Title can't be empty (record #{number}).")
+            if priority not in Task.PRIORITY_MAP:
+                raise ValueError(f"Priority must be numeric and between 1 and 5 (record #{number}).")
+            if end < start:
+                raise ValueError(f"End date must be greater than or equal to start date (record #{number}).")
+            rows.append((task_id, title, start.isoformat(), end.isoformat(), priority, status, description))
+        with self.lock:
+            ids = [row[0] for row in rows if row[0] is not None]
+            if len(set(ids)) != len(ids) or any(self.has_id(task_id) for task_id in ids):
+                raise ValueError("Duplicate task id in records.")
+            with self.connection:
+                for row in rows:
+                    task_id = self.connection.execute(self._INSERT, row).lastrowid
+                    if self.listeners:
+                        self._emit("add", task_id)
+            self.version += 1
+            return len(rows)
+
+    def extend_columns(self, columns: dict[str, Sequence]) -> int:
+        """Insert rows given column by column, in the shape TaskStore.columns() returns."""
+        codes = tuple(Task.STATUS_MAP)
+        try:
+            rows = zip(*(columns[name] for name in COLUMNS_WITH_ID))
+        except KeyError as e:
+            raise ValueError(f"Missing column {e}.")
+        try:
+            records = [
+                {
+                    "id": task_id or None, "title": title,
+                    "period_start_date": date.fromordinal(start).isoformat(),
+                    "period_end_date": date.fromordinal(end).isoformat(),
+                    "priority": priority, "status": codes[status], "description": description,
+                }
+                for task_id, title, start, end, priority, status, description in rows
+            ]
+        except (ValueError, IndexError, TypeError, OverflowError) as e:
+            raise ValueError(f"Invalid value in columns: {e}.")
+        return self.extend_records(records) # validated like any other records
+
+# ---- Batch changes ----
+# Same contract as TaskStore's: validated first, then one transaction
+
+    def extend(self, tasks: Iterable[Task]) -> list[int]:
+        """Insert many Tasks; return their new ids."""
+        rows = [(None, *self._values(task)) for task in tasks]
+        with self.lock:
+            with self.connection:
+                ids = [self.connection.execute(self._INSERT, row).lastrowid for row in rows]
+            if rows:
+                self.version += 1
+            for task_id in ids:
+                self._emit("add", task_id)
+            return ids
+
+    def delete_positions(self, positions: Iterable[int]) -> list[Task]:
+        """Delete the rows at these positions and return them as Tasks, in list order."""
+        with self.lock:
+            ids = self._ids_at(positions)
+            removed = [self.get(task_id) for task_id in ids]
+            with self.connection:
+                self.connection.executemany("DELETE FROM tasks WHERE id = ?", ((task_id,) for task_id in ids))
+            if ids:
+                self.rewrites += 1
+                self.version += 1
+            for task_id in ids:
+                self._emit("delete", task_id)
+            return removed
+
+    def replace_positions(self, tasks: dict[int, Task]) -> None:
+        """Overwrite the rows at these positions ({position: Task})."""
+        with self.lock:
+            ids = self._ids_at(tasks)
+            positions = sorted(set(tasks))
+            with self.connection:
+                self.connection.executemany(
+                    self._UPDATE, ((*self._values(tasks[position]), task_id) for position, task_id in zip(positions, ids))
+                )
+            if ids:
+                self.rewrites += 1
+                self.version += 1
+                self._generation += 1
+            for task_id in ids:
+                self._emit("update", task_id)
+
+    def set_status(self, positions: Iterable[int], status: str) -> None:
+        """Set the status of the rows at these positions."""
+        if status not in Task.STATUS_MAP:
+            raise ValueError(f"Invalid status {status!r}.")
+        with self.lock:
+            ids = self._ids_at(positions)
+            with self.connection:
+                self.connection.executemany(
+                    "UPDATE tasks SET status = ? WHERE id = ?", ((status, task_id) for task_id in ids)
+                )
+            if ids:
+                self.rewrites += 1
+                self.version += 1
+                self._generation += 1
+            for task_id in ids:
+                self._emit("update", task_id)
+
+    def pop(self, index: int = -1) -> Task:
+        with self.lock:
+            return self.remove(self.id_at(index))
+
+    def clear(self) -> None:
+        with self.lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM tasks")
+            self.rewrites += 1
+            self.version += 1
+            self._generation += 1
+            self._emit("clear", None)
+
+    def commit(self) -> str:
+        """Changes are committed as they happen; this just checkpoints the SQLite log."""
+        with self.lock:
+            self.connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        return "Saved Successfully."
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def snapshot(self) -> "SQLiteTaskStore":
+        """The store itself, not a frozen copy.
+
+        The connection is shared between threads, so every read holds the
+        store's lock and never sees a half-applied write. A long iteration
+        fetches in batches and may see changes committed between batches.
+        """
+        return self
+
+    def to_dict_list(self, include_id: bool = False) -> list[dict]:
+        return list(self.iter_records(include_id))
+
+    def iter_records(self, include_id: bool = False, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+        """Yield rows in id order (positions start up to stop) as dicts."""
+        limit = -1 if stop is None else max(stop - start, 0)
+        for row in self._stream(f"{self._SELECT} ORDER BY id LIMIT ? OFFSET ?", (limit, start)):
+            record = dict(row)
+            if not include_id:
+                del record["id"]
+            yield record
+
+    def render(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """str(Task) of the rows at positions start up to stop, like StoreSnapshot.render."""
+        limit = -1 if stop is None else max(stop - start, 0)
+        for row in self._stream(f"{self._SELECT} ORDER BY id LIMIT ? OFFSET ?", (limit, start)):
+            yield str(self._build(row))
+
+# ---- Access by id ----
+
+    def get(self, task_id: int) -> Task:
+        return self._build(self._row(task_id))
+
+    def replace(self, task_id: int, task: Task) -> None:
+        with self.lock:
+            self._write(task_id, task)
+            self._generation += 1
+
+    def remove(self, task_id: int) -> Task:
+        with self.lock:
+            task = self.get(task_id)
+            with self.connection:
+                self.connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self.rewrites += 1
+            self.version += 1
+            self._emit("delete", task_id)
+            return task
+
+    def has_id(self, task_id: int) -> bool:
+        return bool(self._read("SELECT 1 FROM tasks WHERE id = ?", (task_id,)))
+
+    def id_at(self, index: int) -> int:
+        """Id of the row at a position."""
+        with self.lock:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not (0 <= index < size):
+                raise IndexError("Task index out of range.")
+            return self._read("SELECT id FROM tasks ORDER BY id LIMIT 1 OFFSET ?", (index,))[0][0]
+
+    def position(self, task_id: int) -> int:
+        with self.lock:
+            self._row(task_id)
+            return self._read("SELECT COUNT(*) FROM tasks WHERE id < ?", (task_id,))[0][0]
+
+    def compact(self) -> None:
+        """Nothing to do: SQLite reuses freed pages itself."""
+
+# ---- Lookups ----
+
+    def find(self, status: str | None = None, priority: int | None = None) -> list[int]:
+        """Positions matching status and/or priority, using the table indexes."""
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if priority is not None:
+            clauses.append("priority = ?")
+            params.append(priority)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock: # ids and their positions from the same state
+            return self._positions(row[0] for row in self._read(f"SELECT id FROM tasks {where} ORDER BY id", params))
+
+    def ending_between(self, first: date, last: date) -> list[int]:
+        with self.lock:
+            rows = self._read(
+                "SELECT id FROM tasks WHERE period_end_date BETWEEN ? AND ? ORDER BY period_end_date, id",
+                (first.isoformat(), last.isoformat()),
+            )
+            return self._positions(row[0] for row in rows)
+
+    def report_rows(self, kind: str, today: date | None = None) -> list[dict]:
+        """Rows for the "overdue", "priority" or "remaining" report, filtered and sorted in SQL."""
+        today = (today or date.today()).isoformat()
+        if kind == "overdue":
+            query = (f"SELECT {self._REPORT_COLUMNS}, {self._REMAINING} FROM tasks "
+                     "WHERE period_end_date < ? ORDER BY period_end_date, title")
+            params = (today, today)
+        elif kind == "remaining":
+            query = (f"SELECT {self._REPORT_COLUMNS}, {self._REMAINING} FROM tasks "
+                     "WHERE period_end_date >= ? ORDER BY period_end_date, title")
+            params = (today, today)
+        elif kind == "priority":
+            query = f"SELECT {self._REPORT_COLUMNS} FROM tasks ORDER BY priority, period_end_date, title"
+            params = ()
+        else:
+            raise ValueError(f"Unknown report {kind!r}.")
+        return [dict(row) for row in self._read(query, params)]
+
+# ---- Helpers ----
+
+    @staticmethod
+    def _values(task: Task) -> tuple:
+        return (
+            task.title, task.period_start_date.isoformat(), task.period_end_date.isoformat(),
+            task.priority, task.status, task.description,
+        )
+
+    def _write(self, task_id: int, task: Task) -> None:
+        with self.lock:
+            with self.connection:
+                cursor = self.connection.execute(self._UPDATE, (*self._values(task), task_id))
+            if cursor.rowcount == 0:
+                raise ValueError(f"No task with id {task_id}.")
+            self.rewrites += 1
+            self.version += 1
+            self._emit("update", task_id)
+
+    def _write_back(self, task_id: int, generation: int, task: Task) -> None:
+        """Change hook for built Tasks; ignored once the row is replaced or deleted."""
+        with self.lock:
+            if generation == self._generation and self.has_id(task_id):
+                self._write(task_id, task)
+
+    def _emit(self, op: str, task_id: int | None) -> None:
+        if not self.listeners:
+            return
+        record = None
+        if op in ("add", "update"):
+            record = dict(self._row(task_id))
+            del record["id"]
+        for listener in self.listeners:
+            listener(op, task_id, record)
+
+    def _positions(self, ids: Iterable[int]) -> list[int]:
+        """Map ids to positions with one scan of the primary key."""
+        ids = list(ids)
+        if not ids:
+            return []
+        all_ids = [row[0] for row in self._read("SELECT id FROM tasks ORDER BY id")]
+        return [bisect_left(all_ids, task_id) for task_id in ids]
+
+    def _ids_at(self, positions: Iterable[int]) -> list[int]:
+        """Ids at the distinct positions, in list order, with one scan of the primary key."""
+        positions = sorted(set(positions))
+        if not positions:
+            return []
+        all_ids = [row[0] for row in self._read("SELECT id FROM tasks ORDER BY id")]
+        if not (0 <= positions[0] and positions[-1] < len(all_ids)):
+            raise IndexError("Task index out of range.")
+        return [all_ids[position] for position in positions]
+
+    def _row(self, task_id: int):
+        rows = self._read(f"{self._SELECT} WHERE id = ?", (task_id,))
+        if not rows:
+            raise ValueError(f"No task with id {task_id}.")
+        return rows[0]
+
+    def _read(self, query: str, params: Sequence = ()) -> list:
+        """All rows of a query, run under the lock (the connection is shared between threads)."""
+        with self.lock:
+            return self.connection.execute(query, params).fetchall()
+
+    def _stream(self, query: str, params: Sequence = ()) -> Iterator:
+        """Rows of a query, fetched FETCH_SIZE at a time under the lock, so writers can run in between."""
+        with self.lock:
+            cursor = self.connection.execute(query, params)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def _build(self, row) -> Task:
+        task = Task.from_trusted(
+            title=row["title"],
+            period_start_date=date.fromisoformat(row["period_start_date"]),
+            period_end_date=date.fromisoformat(row["period_end_date"]),
+            priority=row["priority"],
+            status=row["status"],
+            description=row["description"],
+        )
+        task._on_change = partial(self._write_back, row["id"], self._generation)
+        return task
@@ -0,0 +1,116 @@
+"""
+
+Hot-path instrumentation.
+
+Counts calls, cumulative time, p50/p99 latency and rows processed for the
+instrumented operations (FileIO export/import, TaskManager CRUD,
+Task.from_dict, the reports). Latency percentiles come from the most recent
+SAMPLES calls of each operation, so memory stays bounded in long sessions.
+Recording costs two perf_counter() calls and a dict lookup.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+SAMPLES = 1024
+
+class Metric:
+    """Running totals for one operation."""
+    __slots__ = ("count", "total", "rows", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.samples: deque[float] = deque(maxlen=SAMPLES)
+
+    def percentile(self, q: float) -> float:
+        """Latency (seconds) at quantile q of the recent samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class Measurement:
+    """Handed out by measure(); set rows before the block ends."""
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+metrics: dict[str, Metric] = {}
+_lock = Lock()
+
+def record(name: str, seconds: float, rows: int = 0) -> None:
+    """Add one call of operation name."""
+    with _lock:
+        metric = metrics.get(name)
+        if metric is None:
+            metric = metrics[name] = Metric()
+        metric.count += 1
+        metric.total += seconds
+        metric.rows += rows
+        metric.samples.append(seconds)
+
+@contextmanager
+def measure(name: str) -> Iterator[Measurement]:
+    """Time the with-block as one call of name (recorded even if it raises)."""
+    measurement = Measurement()
+    start = perf_counter()
+    try:
+        yield measurement
+    finally:
+        record(name, perf_counter() - start, measurement.rows)
+
+def timed(name: str, rows: Callable[[object], int] | None = None) -> Callable:
+    """Decorator: time every call as name; rows(result) gives the rows processed (default 1).
+
+    Like measure(), a call that raises is recorded too, with no rows.
+    """
+    def decorate(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(name, perf_counter() - start)
+                raise
+            record(name, perf_counter() - start, 1 if rows is None else rows(result))
+            return result
+        return wrapper
+    return decorate
+
+def snapshot() -> dict[str, dict]:
+    """Current figures per operation, times in milliseconds."""
+    with _lock:
+        return {
+            name: {
+                "calls": metric.count,
+                "total_ms": metric.total * 1000,
+                "p50_ms": metric.percentile(0.50) * 1000,
+                "p99_ms": metric.percentile(0.99) * 1000,
+                "rows": metric.rows,
+            }
+            for name, metric in sorted(metrics.items())
+        }
+
+def reset() -> None:
+    with _lock:
+        metrics.clear()
+
+def format_table() -> str:
+    """snapshot() as a plain-text table for the CLI."""
+    figures = snapshot()
+    if not figures:
+        return "No operations recorded yet."
+    lines = [f"{'operation':<28}{'calls':>8}{'total ms':>12}{'p50 ms':>10}{'p99 ms':>10}{'rows':>10}"]
+    for name, f in figures.items():
+        lines.append(
+            f"{name:<28}{f['calls']:>8}{f['total_ms']:>12.2f}{f['p50_ms']:>10.3f}{f['p99_ms']:>10.3f}{f['rows']:>10}"
+        )
+    return "\n".join(lines)
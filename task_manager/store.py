@@ -0,0 +1,779 @@
+"""
+
+Columnar task store.
+
+Keeps task fields in parallel arrays (priority, status code, start/end day
+ordinals) plus string tables for title/description. Task objects are only
+built when a caller asks for one; a built Task writes its changes back to
+its row until that row is replaced or deleted. A row's str(Task) is
+memoized in the rendered column until the row changes, so listing
+unchanged tasks builds no Task at all.
+
+Every row has a stable id. Deletes leave a tombstone; access by position
+skips tombstones through a sorted list of them (a binary search), and the
+columns are compacted once tombstones pile up, or before a batch change
+or slice. A snapshot doesn't compact: it keeps the tombstones and skips
+them the same way.
+
+Listeners are called as listener(op, task_id, record) after every change:
+op is "add", "update", "delete" or "clear"; record is the row as a dict
+(None for delete and clear).
+
+Writers are serialized by the store's lock. Readers take a StoreSnapshot:
+an immutable view that shares the columns copy-on-write, so taking one is
+O(1) and reading it needs no lock. Appends never touch rows a snapshot can
+see; the first in-place update or delete after a snapshot copies the
+columns (O(n) memcpy, once per snapshot) before changing them.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import date
+from functools import partial
+from itertools import compress, islice
+from threading import RLock
+from .index import TaskIndex
+from .task import Task
+
+
+def _slot_at(holes: list[int], index: int) -> int:
+    """Slot of the row at position index, given the sorted tombstoned slots."""
+    if not holes or index < holes[0]:
+        return index
+    # The slot is index plus the holes before it: binary search for the
+    # smallest slot with index + 1 live rows at or before it
+    low, high = index, index + len(holes)
+    while low < high:
+        middle = (low + high) // 2
+        if middle + 1 - bisect_right(holes, middle) > index:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+class TaskStore(Sequence):
+    """Stores tasks column by column instead of as a list of Task objects."""
+    # Status codes are stored as their position in this tuple
+    STATUS_CODES: tuple[str, ...] = tuple(Task.STATUS_MAP)
+    STATUS_INDEX: dict[str, int] = {code: i for i, code in enumerate(STATUS_CODES)}
+    _MAX_DAY = date.max.toordinal()
+    # Keys of columns()/extend_columns(), in Task.to_dict order after "id"
+    COLUMNS = ("id", "title", "period_start_date", "period_end_date", "priority", "status", "description")
+    # Compact once tombstones outnumber live rows (and there are at least this many)
+    COMPACT_MIN = 64
+
+    def __init__(self, tasks: Iterable[Task] = (), indexed: bool = False):
+        self.titles: list[str] = []
+        self.descriptions: list[str] = []
+        self.priorities = array("b")
+        self.statuses = array("b")
+        self.start_days = array("i") # date.toordinal()
+        self.end_days = array("i")
+        self.ids = array("q")
+        self.alive = bytearray() # 0 marks a tombstone
+        self.rendered: list[str | None] = [] # str(Task) of the row, None until first shown
+        self.index: TaskIndex | None = TaskIndex() if indexed else None
+        self.next_id = 1
+        self._slots: dict[int, int] = {} # id -> slot in the columns
+        self._holes: list[int] = [] # tombstoned slots, sorted; maps positions to slots
+        # Bumped whenever a row is replaced; detaches previously built Tasks
+        self._generation = 0
+        # Counts updates and deletes: changes an append-only save can't express
+        self.rewrites = 0
+        self.version = 0 # counts every change
+        self.lock = RLock() # serializes writers
+        self._snapshot: StoreSnapshot | None = None
+        self._shared = False # the columns are referenced by _snapshot: copy before writing in place
+        self.listeners: list[Callable[[str, int | None, dict | None], None]] = []
+        for task in tasks:
+            self.append(task)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __getitem__(self, index: int | slice) -> Task | list[Task]:
+        """Build the Task (or list of Tasks) at a position."""
+        if isinstance(index, slice):
+            self.compact()
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+        return self._build(self._position(index))
+
+    def __setitem__(self, index: int, task: Task) -> None:
+        """Overwrite the row at a position with the fields of task."""
+        with self.lock:
+            self._write(self._position(index), task)
+            self._generation += 1
+
+    def __delitem__(self, index: int) -> None:
+        with self.lock:
+            self._kill(self._position(index))
+
+    def __iter__(self) -> Iterator[Task]:
+        alive = self.alive
+        for i in range(len(alive)):
+            if alive[i]:
+                yield self._build(i)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare row by row with another store, list or tuple of Tasks."""
+        if not isinstance(other, (TaskStore, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    @property
+    def slots(self) -> int:
+        """Rows ever written, tombstones included; iter_records(start=slots) yields only newer rows."""
+        return len(self.ids)
+
+    def append(self, task: Task, task_id: int | None = None) -> int:
+        """Append the fields of task as a new row and return its id."""
+        with self.lock:
+            if task_id is None:
+                task_id = self.next_id
+            elif task_id in self._slots:
+                raise ValueError(f"Duplicate task id {task_id}.")
+            self.next_id = max(self.next_id, task_id + 1)
+            slot = len(self.ids)
+            self.titles.append(task.title)
+            self.descriptions.append(task.description)
+            self.priorities.append(task.priority)
+            self.statuses.append(self.STATUS_INDEX[task.status])
+            self.start_days.append(task.period_start_date.toordinal())
+            self.end_days.append(task.period_end_date.toordinal())
+            self.ids.append(task_id)
+            self.alive.append(1)
+            self.rendered.append(task._str_cache)
+            self._slots[task_id] = slot
+            if self.index is not None:
+                self.index.add(task_id, self.statuses[slot], self.priorities[slot], self.end_days[slot])
+            self.version += 1
+            self._emit("add", task_id, slot)
+            return task_id
+
+    def extend_records(self, records: Iterable[dict], trusted: bool = False) -> int:
+        """Append rows straight from exported dicts, without building Tasks.
+
+        Every record is validated as strictly as Task.from_dict (long-form
+        statuses are accepted and normalized). trusted=True is only for rows
+        this package wrote itself, e.g. WAL replay: it skips the normalization
+        but still range-checks priority, title and date order. The whole batch
+        is checked before anything is written, so a bad record raises
+        ValueError and leaves the store unchanged.
+        """
+        from_iso = date.fromisoformat
+        validate = Task.validate_record
+        status_index = self.STATUS_INDEX
+        priorities = Task.PRIORITY_MAP
+        rows = []
+        for number, data in enumerate(records, start=1):
+            try:
+                task_id = data.get("id")
+                task_id = None if task_id in (None, "") else int(task_id)
+                if trusted:
+                    title, description = data["title"], data.get("description") or ""
+                    priority = int(data["priority"]) # CSV gives strings
+                    start_day = from_iso(data["period_start_date"]).toordinal()
+                    end_day = from_iso(data["period_end_date"]).toordinal()
+                    status = status_index[data["status"]]
+                else:
+                    title, start, end, priority, status, description = validate(data)
+                    start_day, end_day = start.toordinal(), end.toordinal()
+                    status = status_index[status]
+            except KeyError as e:
+                raise ValueError(f"Missing or invalid field in record #{number}: {e}.")
+            except (TypeError, AttributeError, ValueError) as e:
+                raise ValueError(f"Invalid value in record #{number}: {e}")
+            if task_id is not None and not (1 <= task_id < 2**63):
+                raise ValueError(f"Invalid task id {task_id} in record #{number}.")
+            if not isinstance(title, str) or not title.strip():
+                raise ValueError(f"Title can't be empty (record #{number}).")
+            if priority not in priorities:
+                raise ValueError(f"Priority must be numeric and between 1 and 5 (record #{number}).")
+            if end_day < start_day:
+                raise ValueError(f"End date must be greater than or equal to start date (record #{number}).")
+            rows.append((task_id, title, data.get("description") or "", priority, status, start_day, end_day))
+        with self.lock: # parse outside the lock, apply inside
+            ids = [row[0] for row in rows if row[0] is not None]
+            if len(set(ids)) != len(ids) or any(task_id in self._slots for task_id in ids):
+                raise ValueError("Duplicate task id in records.")
+            index = self.index
+            self.version += 1
+            for task_id, title, description, priority, status, start_day, end_day in rows:
+                if task_id is None:
+                    task_id = self.next_id
+                self.next_id = max(self.next_id, task_id + 1)
+                self._slots[task_id] = len(self.ids)
+                self.titles.append(title)
+                self.descriptions.append(description)
+                self.priorities.append(priority)
+                self.statuses.append(status)
+                self.start_days.append(start_day)
+                self.end_days.append(end_day)
+                self.ids.append(task_id)
+                self.alive.append(1)
+                self.rendered.append(None)
+                if index is not None:
+                    index.add(task_id, status, priority, end_day)
+                if self.listeners:
+                    self._emit("add", task_id, len(self.ids) - 1)
+            return len(rows)
+
+    def extend_columns(self, columns: dict[str, Sequence]) -> int:
+        """Append rows given column by column, in the shape columns() returns.
+
+        An id of 0 gets the next free id. Much cheaper than extend_records for
+        bulk loads: no dict or date parsing per row. Checked as strictly, a
+        column at a time: priorities 1-5, non-empty titles (stripped), valid
+        day ordinals and no task ending before it starts.
+        """
+        try:
+            ids = columns["id"]
+            values = [columns[name] for name in self.COLUMNS[1:]]
+        except KeyError as e:
+            raise ValueError(f"Missing column {e}.")
+        if any(len(column) != len(ids) for column in values):
+            raise ValueError("Columns have different lengths.")
+        titles, start_days, end_days, priorities, statuses, descriptions = values
+        if statuses and not (0 <= min(statuses) and max(statuses) < len(self.STATUS_CODES)):
+            raise ValueError("Invalid status code in columns.")
+        try: # Convert and check up front, so a bad value leaves the store unchanged
+            priorities, statuses = array("b", priorities), array("b", statuses)
+            start_days, end_days = array("i", start_days), array("i", end_days)
+            titles = list(map(str.strip, titles))
+            descriptions = [description or "" for description in descriptions]
+            if not all(isinstance(description, str) for description in descriptions):
+                raise TypeError("descriptions must be strings")
+        except (OverflowError, TypeError) as e:
+            raise ValueError(f"Invalid value in columns: {e}.")
+        if priorities and not (min(Task.PRIORITY_MAP) <= min(priorities) and max(priorities) <= max(Task.PRIORITY_MAP)):
+            raise ValueError("Priority must be numeric and between 1 and 5.")
+        if "" in titles:
+            raise ValueError("Title can't be empty.")
+        if start_days and not (1 <= min(start_days) and max(end_days) <= self._MAX_DAY):
+            raise ValueError("Invalid date in columns.")
+        if any(map(int.__gt__, start_days, end_days)): # with the bounds above, every date is valid
+            raise ValueError("End date must be greater than or equal to start date.")
+        with self.lock:
+            given = [task_id for task_id in ids if task_id]
+            if len(set(given)) != len(given) or any(task_id in self._slots for task_id in given):
+                raise ValueError("Duplicate task id in columns.")
+            first = len(self.ids)
+            self.version += 1
+            self.titles.extend(titles)
+            self.descriptions.extend(descriptions)
+            self.priorities.extend(priorities)
+            self.statuses.extend(statuses)
+            self.start_days.extend(start_days)
+            self.end_days.extend(end_days)
+            self.next_id = max(self.next_id, max(given, default=0) + 1)
+            for slot, task_id in enumerate(ids, start=first):
+                if not task_id:
+                    task_id = self.next_id
+                    self.next_id += 1
+                self.ids.append(task_id)
+                self._slots[task_id] = slot
+                if self.index is not None:
+                    self.index.add(task_id, self.statuses[slot], self.priorities[slot], self.end_days[slot])
+                if self.listeners:
+                    self._emit("add", task_id, slot)
+            self.alive.extend(b"\x01" * len(ids))
+            self.rendered.extend([None] * len(ids))
+            return len(ids)
+
+    def columns(self) -> dict[str, Sequence]:
+        """Copies of the live columns: dates as day ordinals, status as codes into STATUS_CODES."""
+        with self.lock:
+            self.compact()
+            return dict(zip(self.COLUMNS, (
+                self.ids[:], self.titles[:], self.start_days[:], self.end_days[:],
+                self.priorities[:], self.statuses[:], self.descriptions[:],
+            )))
+
+    def snapshot(self) -> "StoreSnapshot":
+        """Immutable view of the live rows as of now; cached until the next change."""
+        with self.lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self.version:
+                # No compaction: the snapshot shares the slots and maps positions past the holes
+                snapshot = self._snapshot = StoreSnapshot(
+                    dict(zip(self.COLUMNS, (
+                        self.ids, self.titles, self.start_days, self.end_days,
+                        self.priorities, self.statuses, self.descriptions,
+                    ))),
+                    len(self), self.version, self.rendered, self.alive, len(self.ids), self._holes,
+                )
+                self._shared = True
+            return snapshot
+
+# ---- Batch changes ----
+# One locked pass each: validated first, so a bad position or task changes nothing
+
+    def extend(self, tasks: Iterable[Task]) -> list[int]:
+        """Append many Tasks; return their new ids."""
+        tasks = list(tasks)
+        rows = [
+            (task.title, task.description, task.priority, self.STATUS_INDEX[task.status],
+             task.period_start_date.toordinal(), task.period_end_date.toordinal(), task._str_cache)
+            for task in tasks
+        ]
+        with self.lock:
+            if not rows:
+                return []
+            first_id, first_slot = self.next_id, len(self.ids)
+            ids = range(first_id, first_id + len(rows))
+            self.next_id += len(rows)
+            self.version += 1
+            for task_id, (title, description, priority, status, start_day, end_day, rendered) in zip(ids, rows):
+                self._slots[task_id] = len(self.ids)
+                self.titles.append(title)
+                self.descriptions.append(description)
+                self.priorities.append(priority)
+                self.statuses.append(status)
+                self.start_days.append(start_day)
+                self.end_days.append(end_day)
+                self.ids.append(task_id)
+                self.rendered.append(rendered)
+            self.alive.extend(b"\x01" * len(rows))
+            slots = range(first_slot, len(self.ids))
+            if self.index is not None:
+                self.index.add_many(self._index_row(slot) for slot in slots)
+            if self.listeners:
+                for slot in slots:
+                    self._emit("add", self.ids[slot], slot)
+            return list(ids)
+
+    def delete_positions(self, positions: Iterable[int]) -> list[Task]:
+        """Remove the rows at these positions and return them as Tasks, in list order."""
+        with self.lock:
+            slots = self._check_positions(positions)
+            if not slots:
+                return []
+            removed = [self._build(slot) for slot in slots]
+            self._unshare()
+            self.rewrites += 1
+            self.version += 1
+            if self.index is not None:
+                self.index.remove_many([self._index_row(slot) for slot in slots])
+            for slot in slots:
+                self._tombstone(slot)
+            if len(self._holes) > max(self.COMPACT_MIN, len(self)):
+                self.compact()
+            return removed
+
+    def replace_positions(self, tasks: dict[int, Task]) -> None:
+        """Overwrite the rows at these positions ({position: Task})."""
+        with self.lock:
+            slots = self._check_positions(tasks)
+            if not slots:
+                return
+            for task in tasks.values():
+                self.STATUS_INDEX[task.status] # an unknown status fails before anything changes
+            self._unshare()
+            self.rewrites += 1
+            self.version += 1
+            self._generation += 1
+            if self.index is not None:
+                self.index.remove_many([self._index_row(slot) for slot in slots])
+            for slot in slots:
+                self._set_row(slot, tasks[slot])
+            if self.index is not None:
+                self.index.add_many(self._index_row(slot) for slot in slots)
+            for slot in slots: # listeners see the rows fully written and indexed
+                self._emit("update", self.ids[slot], slot)
+
+    def set_status(self, positions: Iterable[int], status: str) -> None:
+        """Set the status of the rows at these positions."""
+        code = self.STATUS_INDEX[status]
+        with self.lock:
+            slots = self._check_positions(positions)
+            if not slots:
+                return
+            self._unshare()
+            self.rewrites += 1
+            self.version += 1
+            self._generation += 1 # built Tasks would write their old status back
+            for slot in slots:
+                if self.index is not None:
+                    self.index.restatus(self.ids[slot], self.statuses[slot], code)
+                self.statuses[slot] = code
+                self.rendered[slot] = None
+                self._emit("update", self.ids[slot], slot)
+
+    def pop(self, index: int = -1) -> Task:
+        """Remove the row at a position and return it as a Task."""
+        with self.lock:
+            slot = self._position(index)
+            task = self._build(slot)
+            self._kill(slot)
+            return task
+
+    def clear(self) -> None:
+        with self.lock:
+            self.rewrites += 1
+            self.version += 1
+            # New columns rather than emptying these, which a snapshot may share
+            self.titles, self.descriptions = [], []
+            self.priorities, self.statuses = array("b"), array("b")
+            self.start_days, self.end_days = array("i"), array("i")
+            self.ids, self.alive, self.rendered = array("q"), bytearray(), []
+            self._shared = False
+            self._slots.clear()
+            self._holes = []
+            self._generation += 1
+            if self.index is not None:
+                self.index.rebuild(())
+            self._emit("clear", None, None)
+
+    def to_dict_list(self, include_id: bool = False) -> list[dict]:
+        """Serialize every row straight from the columns (no Task objects)."""
+        return list(self.iter_records(include_id))
+
+    def iter_records(self, include_id: bool = False, start: int = 0) -> Iterator[dict]:
+        """Yield each row (from slot start on) as a Task.to_dict-shaped dict, "id" first if asked."""
+        iso: dict[int, str] = {} # Many tasks share dates; format each once
+        def to_iso(ordinal: int) -> str:
+            text = iso.get(ordinal)
+            if text is None:
+                text = iso[ordinal] = date.fromordinal(ordinal).isoformat()
+            return text
+        codes = self.STATUS_CODES
+        rows = zip(
+            self.ids, self.alive, self.titles, self.start_days, self.end_days,
+            self.priorities, self.statuses, self.descriptions,
+        )
+        for task_id, live, title, start_day, end_day, priority, status, description in islice(rows, start, None):
+            if not live:
+                continue
+            record = {"id": task_id} if include_id else {}
+            record.update(
+                title=title,
+                period_start_date=to_iso(start_day),
+                period_end_date=to_iso(end_day),
+                priority=priority,
+                status=codes[status],
+                description=description,
+            )
+            yield record
+
+# ---- Access by id ----
+
+    def get(self, task_id: int) -> Task:
+        """Build the Task with this id."""
+        return self._build(self._slot(task_id))
+
+    def replace(self, task_id: int, task: Task) -> None:
+        """Overwrite the row with this id."""
+        with self.lock:
+            self._write(self._slot(task_id), task)
+            self._generation += 1
+
+    def remove(self, task_id: int) -> Task:
+        """Tombstone the row with this id and return it as a Task."""
+        with self.lock:
+            slot = self._slot(task_id)
+            task = self._build(slot)
+            self._kill(slot)
+            return task
+
+    def has_id(self, task_id: int) -> bool:
+        return task_id in self._slots
+
+    def id_at(self, index: int) -> int:
+        """Id of the row at a position."""
+        return self.ids[self._position(index)]
+
+    def position(self, task_id: int) -> int:
+        """Current position of the row with this id."""
+        slot = self._slot(task_id)
+        return slot - bisect_left(self._holes, slot)
+
+    def compact(self) -> None:
+        """Drop tombstoned rows so positions match slots again."""
+        with self.lock:
+            if not self._holes:
+                return
+            keep = [slot for slot, live in enumerate(self.alive) if live]
+            self.titles = [self.titles[slot] for slot in keep]
+            self.descriptions = [self.descriptions[slot] for slot in keep]
+            self.rendered = [self.rendered[slot] for slot in keep]
+            for name in ("priorities", "statuses", "start_days", "end_days", "ids"):
+                column = getattr(self, name)
+                setattr(self, name, array(column.typecode, [column[slot] for slot in keep]))
+            self.alive = bytearray(b"\x01" * len(keep))
+            self._slots = {task_id: slot for slot, task_id in enumerate(self.ids)}
+            self._holes = []
+            self._shared = False # all new columns
+
+# ---- Lookups ----
+
+    def find(self, status: str | None = None, priority: int | None = None) -> list[int]:
+        """Positions matching status and/or priority, in list order."""
+        code = None if status is None else self.STATUS_INDEX[status]
+        with self.lock: # the index sets and slots must not change under the lookup
+            self.compact()
+            if self.index is None:
+                return [
+                    row for row in range(len(self))
+                    if (code is None or self.statuses[row] == code)
+                    and (priority is None or self.priorities[row] == priority)
+                ]
+            buckets = []
+            if code is not None:
+                buckets.append(self.index.status(code))
+            if priority is not None:
+                buckets.append(self.index.priority(priority))
+            if not buckets:
+                return list(range(len(self)))
+            buckets.sort(key=len)
+            return sorted(self._slots[task_id] for task_id in buckets[0].intersection(*buckets[1:]))
+
+    def ending_between(self, first: date, last: date) -> list[int]:
+        """Positions whose end date is in [first, last], ordered by end date."""
+        first_day, last_day = first.toordinal(), last.toordinal()
+        with self.lock:
+            self.compact()
+            if self.index is not None:
+                return [self._slots[task_id] for task_id in self.index.ending_between(first_day, last_day)]
+            rows = [row for row, day in enumerate(self.end_days) if first_day <= day <= last_day]
+            return sorted(rows, key=self.end_days.__getitem__)
+
+# ---- Helpers ----
+
+    def _unshare(self) -> None:
+        """Copy the columns if a snapshot shares them, before changing rows in place."""
+        if self._shared:
+            self.titles, self.descriptions = self.titles[:], self.descriptions[:]
+            for name in ("priorities", "statuses", "start_days", "end_days", "ids"):
+                setattr(self, name, getattr(self, name)[:])
+            self.alive, self.rendered = self.alive[:], self.rendered[:]
+            self._holes = self._holes[:]
+            self._shared = False
+
+    def _write(self, i: int, task: Task) -> None:
+        with self.lock:
+            self._unshare()
+            self.rewrites += 1
+            self.version += 1
+            if self.index is not None:
+                self.index.remove(*self._index_row(i))
+            self._set_row(i, task)
+            if self.index is not None:
+                self.index.add(*self._index_row(i))
+            self._emit("update", self.ids[i], i)
+
+    def _set_row(self, i: int, task: Task) -> None:
+        """Overwrite the fields of slot i (columns already unshared; index and listeners handled by the caller)."""
+        self.titles[i] = task.title
+        self.descriptions[i] = task.description
+        self.priorities[i] = task.priority
+        self.statuses[i] = self.STATUS_INDEX[task.status]
+        self.start_days[i] = task.period_start_date.toordinal()
+        self.end_days[i] = task.period_end_date.toordinal()
+        self.rendered[i] = task._str_cache # a Task's cache always matches its fields
+
+    def _write_back(self, task_id: int, generation: int, task: Task) -> None:
+        """Change hook for built Tasks; ignored once the row is replaced or deleted."""
+        with self.lock:
+            slot = self._slots.get(task_id)
+            if slot is not None and generation == self._generation:
+                self._write(slot, task)
+
+    def _kill(self, slot: int) -> None:
+        """Tombstone a slot, compacting when tombstones outnumber live rows."""
+        with self.lock:
+            self._unshare()
+            self.rewrites += 1
+            self.version += 1
+            if self.index is not None:
+                self.index.remove(*self._index_row(slot))
+            self._tombstone(slot)
+            if len(self._holes) > max(self.COMPACT_MIN, len(self)):
+                self.compact()
+
+    def _tombstone(self, slot: int) -> None:
+        """Mark slot deleted (columns already unshared, index handled by the caller)."""
+        task_id = self.ids[slot]
+        self.alive[slot] = 0
+        # Release the strings now rather than at the next compaction
+        self.titles[slot] = self.descriptions[slot] = ""
+        self.rendered[slot] = None
+        del self._slots[task_id]
+        insort(self._holes, slot)
+        self._emit("delete", task_id, None)
+
+    def _index_row(self, slot: int) -> tuple[int, int, int, int]:
+        """(key, status, priority, end_day) of a slot, as TaskIndex takes them."""
+        return self.ids[slot], self.statuses[slot], self.priorities[slot], self.end_days[slot]
+
+    def _check_positions(self, positions: Iterable[int]) -> list[int]:
+        """Compact, then return the distinct positions sorted; IndexError if any is out of range."""
+        self.compact()
+        positions = sorted(set(positions))
+        if positions and not (0 <= positions[0] and positions[-1] < len(self)):
+            raise IndexError("Task index out of range.")
+        return positions
+
+    def _emit(self, op: str, task_id: int | None, slot: int | None) -> None:
+        if not self.listeners:
+            return
+        record = None if slot is None else self._record(slot)
+        for listener in self.listeners:
+            listener(op, task_id, record)
+
+    def _record(self, slot: int) -> dict:
+        """One row as a Task.to_dict-shaped dict."""
+        return {
+            "title": self.titles[slot],
+            "period_start_date": date.fromordinal(self.start_days[slot]).isoformat(),
+            "period_end_date": date.fromordinal(self.end_days[slot]).isoformat(),
+            "priority": self.priorities[slot],
+            "status": self.STATUS_CODES[self.statuses[slot]],
+            "description": self.descriptions[slot],
+        }
+
+    def _slot(self, task_id: int) -> int:
+        try:
+            return self._slots[task_id]
+        except (KeyError, TypeError):
+            raise ValueError(f"No task with id {task_id}.")
+
+    def _position(self, index: int) -> int:
+        """Slot of a (possibly negative) position, bounds-checked; tombstones are skipped, not compacted."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not (0 <= index < size):
+            raise IndexError("Task index out of range.")
+        return _slot_at(self._holes, index)
+
+    def _build(self, i: int) -> Task:
+        task = Task.from_trusted(
+            title=self.titles[i],
+            period_start_date=date.fromordinal(self.start_days[i]),
+            period_end_date=date.fromordinal(self.end_days[i]),
+            priority=self.priorities[i],
+            status=self.STATUS_CODES[self.statuses[i]],
+            description=self.descriptions[i],
+        )
+        task._str_cache = self.rendered[i]
+        task._on_change = partial(self._write_back, self.ids[i], self._generation)
+        return task
+
+
+class StoreSnapshot(Sequence):
+    """Read-only rows of a TaskStore as of one version (see TaskStore.snapshot).
+
+    Safe to read from any thread without locking. Tasks built from it are
+    detached copies: changing them doesn't change the store.
+    """
+    __slots__ = ("_columns", "_length", "_rendered", "_alive", "_slots", "_holes", "version")
+
+    def __init__(self, columns: dict[str, Sequence], length: int, version: int, rendered: list[str | None],
+                 alive: bytearray, slots: int, holes: list[int]):
+        self._columns = columns # shared with the store; slots [0, slots) never change
+        self._length = length # live rows
+        self._rendered = rendered # also shared: a string rendered here is right for the store too
+        self._alive = alive
+        self._slots = slots
+        self._holes = holes # shared too: the store copies it before its next tombstone
+        self.version = version
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> Task | list[Task]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return [self._build(slot) for slot in self._window(start, stop)]
+            return [self._build(_slot_at(self._holes, i)) for i in range(start, stop, step)]
+        if index < 0:
+            index += self._length
+        if not (0 <= index < self._length):
+            raise IndexError("Task index out of range.")
+        return self._build(_slot_at(self._holes, index))
+
+    def __iter__(self) -> Iterator[Task]:
+        for slot in self._window(0, self._length):
+            yield self._build(slot)
+
+    def render(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """str(Task) of the rows at positions start up to stop; rows shown before cost a lookup."""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        rendered = self._rendered
+        for slot in self._window(start, stop):
+            text = rendered[slot]
+            if text is None:
+                text = rendered[slot] = str(self._build(slot))
+            yield text
+
+    def columns(self) -> dict[str, Sequence]:
+        """Copies of the columns, as TaskStore.columns() returns them."""
+        if not self._holes:
+            return {name: column[:self._length] for name, column in self._columns.items()}
+        alive = self._alive[:self._slots]
+        return {
+            name: (array(column.typecode, compress(column, alive)) if isinstance(column, array)
+                   else list(compress(column, alive)))
+            for name, column in self._columns.items()
+        }
+
+    def to_dict_list(self, include_id: bool = False) -> list[dict]:
+        return list(self.iter_records(include_id))
+
+    def iter_records(self, include_id: bool = False, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+        """Yield the rows at positions start up to stop as Task.to_dict-shaped dicts, "id" first if asked.
+
+        Only that window of the columns is read, so a page costs its size, not the list's.
+        """
+        iso: dict[int, str] = {} # Many tasks share dates; format each once
+        def to_iso(ordinal: int) -> str:
+            text = iso.get(ordinal)
+            if text is None:
+                text = iso[ordinal] = date.fromordinal(ordinal).isoformat()
+            return text
+        codes = TaskStore.STATUS_CODES
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+        # Slots from the window's first row to its last; tombstones in between are skipped
+        first = _slot_at(self._holes, start)
+        last = _slot_at(self._holes, stop - 1) + 1
+        rows = zip(*(self._columns[name][first:last] for name in TaskStore.COLUMNS))
+        if last - first > stop - start:
+            rows = compress(rows, self._alive[first:last])
+        for task_id, title, start_day, end_day, priority, status, description in rows:
+            record = {"id": task_id} if include_id else {}
+            record.update(
+                title=title,
+                period_start_date=to_iso(start_day),
+                period_end_date=to_iso(end_day),
+                priority=priority,
+                status=codes[status],
+                description=description,
+            )
+            yield record
+
+    def _build(self, i: int) -> Task:
+        columns = self._columns
+        task = Task.from_trusted(
+            title=columns["title"][i],
+            period_start_date=date.fromordinal(columns["period_start_date"][i]),
+            period_end_date=date.fromordinal(columns["period_end_date"][i]),
+            priority=columns["priority"][i],
+            status=TaskStore.STATUS_CODES[columns["status"][i]],
+            description=columns["description"][i],
+        )
+        task._str_cache = self._rendered[i]
+        return task
+
+    def _window(self, start: int, stop: int) -> Iterator[int]:
+        """Slots of the live rows at positions start up to stop (0 <= start <= stop <= len)."""
+        if start >= stop:
+            return iter(())
+        first = _slot_at(self._holes, start)
+        last = _slot_at(self._holes, stop - 1) + 1
+        if last - first == stop - start:
+            return iter(range(first, last))
+        return compress(range(first, last), self._alive[first:last])
@@ -4,11 +4,15 @@ Task model.
 
 Stores task data, validates fields (dates, priority, status), and supports:
 - Status helpers (marked_complete, marked_not_started, mark_in_progress)
-- Serialization (to_dict / from_dict)
-- User-friendly formatting (__str__/__repr__)
+- Serialization (to_dict / from_dict, validate_record for bulk imports,
+  trusted bulk path via from_trusted / from_dicts for data we wrote ourselves)
+- User-friendly formatting (__str__/__repr__); __str__ is rendered once and
+  cached until a property setter changes a field
 """
 
+from collections.abc import Iterable
 from datetime import datetime, date 
+from .stats import timed
 
 class Task:
     """
@@ -26,19 +30,30 @@ class Task:
     PRIORITY_MAP = {1: "highest", 2: "high", 3: "medium", 4: "low", 5: "lowest"}
     # Maps short status codes to readable text
     STATUS_MAP = {"c": "completed", "ns":"not started", "inp":"in-progress"}
+    # Export schema: the keys of to_dict, in order
+    FIELDS = ("title", "period_start_date", "period_end_date", "priority", "status", "description")
+
+    __slots__ = (
+        "_title", "_description", "_period_start_date", "_period_end_date",
+        "_priority", "_status", "_on_change", "_str_cache",
+    )
+    # Width of the longest __str__ label ("Description"), for alignment
+    _LABEL_WIDTH = len("Description")
 
     def __init__(
             self, 
             title: str,  
             period_end_date: str | date,
-            period_start_date: str | date = date.today(), 
+            period_start_date: str | date | None = None, 
             priority: int = 3, 
             status: str = "ns",
             description: str = "",   
         ):
+        self._on_change = None
+        self._str_cache = None
         self.title = title
         self.description = description
-        self.period_start_date = period_start_date
+        self.period_start_date = date.today() if period_start_date is None else period_start_date
         self.period_end_date = period_end_date
         self.priority = priority
         self.status = status
@@ -68,21 +83,31 @@ class Task:
         )
     
     def __str__(self) -> str:
-        """Return a user-friendly string with task details."""
+        """Return a user-friendly string with task details (cached until a field changes)."""
+        text = self._str_cache
+        if text is None:
+            text = self._str_cache = self._render()
+        return text
+
+    def _render(self) -> str:
         status_text = type(self).STATUS_MAP.get(self.status, str(self.status)).title()
         priority_text = type(self).PRIORITY_MAP.get(self.priority, str(self.priority)).title()
-        description_text = self.description or "(No Description)"
-        labels = {
-            "Status": status_text,
-            "Priority": priority_text,
-            "Description": description_text
-        }
-        # Find the longest label for alignment
-        max_label_len = max(len(label) for label in labels.keys())
-        # Build the aligned string
-        details = "\n".join(f"{label.ljust(max_label_len)} : {value.title()}" for label, value in labels.items())
-        return f"{self.title} ({self.period_start_date} - {self.period_end_date})\n{details}"
-    
+        description_text = (self.description or "(No Description)").title()
+        width = self._LABEL_WIDTH
+        return (
+            f"{self.title} ({self.period_start_date} - {self.period_end_date})\n"
+            f"{'Status'.ljust(width)} : {status_text}\n"
+            f"{'Priority'.ljust(width)} : {priority_text}\n"
+            f"{'Description'.ljust(width)} : {description_text}"
+        )
+
+    def _changed(self) -> None:
+        """Drop the cached __str__ and tell the owner of this Task (e.g. a TaskStore row) that a field changed."""
+        self._str_cache = None
+        on_change = getattr(self, "_on_change", None)
+        if on_change is not None:
+            on_change(self)
+
     def marked_complete(self) -> None:
         """Mark the task as completed."""
         self.status = "c"
@@ -112,6 +137,7 @@ class Task:
         }
     
     @classmethod
+    @timed("Task.from_dict")
     def from_dict(cls, data: dict) -> "Task":
         """Rebuild Task from a dictionary. Expects ISO date strings"""
         return cls(
@@ -122,6 +148,46 @@ class Task:
             status = data["status"],
             description = data.get("description", ""),
         )
+
+    @classmethod
+    def from_trusted(
+            cls,
+            title: str,
+            period_end_date: date,
+            period_start_date: date | None = None,
+            priority: int = 3,
+            status: str = "ns",
+            description: str = "",
+        ) -> "Task":
+        """Build a Task from already-validated, already-typed values (no setters run)."""
+        task = cls.__new__(cls)
+        task._on_change = None
+        task._str_cache = None
+        task._title = title
+        task._description = description or ""
+        task._period_start_date = date.today() if period_start_date is None else period_start_date
+        task._period_end_date = period_end_date
+        task._priority = priority
+        task._status = status
+        return task
+
+    @classmethod
+    @timed("Task.from_dicts", rows=len)
+    def from_dicts(cls, records: Iterable[dict]) -> list["Task"]:
+        """Bulk rebuild Tasks from dictionaries we exported ourselves. Skips re-validation."""
+        from_iso = date.fromisoformat
+        trusted = cls.from_trusted
+        return [
+            trusted(
+                data["title"],
+                from_iso(data["period_end_date"]),
+                from_iso(data["period_start_date"]),
+                int(data["priority"]), # CSV gives strings
+                data["status"],
+                data.get("description", ""),
+            )
+            for data in records
+        ]
     
 # ---- Validators ----
 
@@ -135,6 +201,8 @@ class Task:
     @staticmethod
     def validate_date(value: str | date) -> date:
         """Accept a date object or a YYYY-MM-DD string and check valid date format: YYYY-MM-DD"""
+        if type(value) is date: # Already typed, nothing to parse
+            return value
         try:
             return datetime.strptime(str(value), "%Y-%m-%d").date()
         except ValueError: 
@@ -163,6 +231,32 @@ class Task:
                 return dict_key # normalize to short form
         raise ValueError ("Use c (Completed), ns (Not Started), or inp (In-progress).") 
 
+    @classmethod
+    def validate_record(cls, data: dict) -> tuple[str, date, date, int, str, str]:
+        """Validate an exported dict as strictly as from_dict, without building a Task.
+
+        Returns (title, start, end, priority, status, description) with the status
+        normalized to its short code. Well-formed ISO dates take a fast path.
+        """
+        dates = []
+        for key in ("period_start_date", "period_end_date"):
+            value = data[key]
+            if type(value) is str and len(value) == 10 and value[4] == value[7] == "-":
+                try:
+                    value = date.fromisoformat(value)
+                except ValueError:
+                    raise ValueError("Please Enter a valid date in YYYY-MM-DD format.")
+            dates.append(cls.validate_date(value))
+        start, end = dates
+        cls.validate_date_order(start, end)
+        status = data["status"]
+        if status not in cls.STATUS_MAP:
+            status = cls.validate_status(status)
+        return (
+            cls.validate_title(data["title"]), start, end,
+            cls.validate_priority(data["priority"]), status, data.get("description") or "",
+        )
+
 # ---- Property and setters ----
 
     @property
@@ -171,6 +265,7 @@ class Task:
     @title.setter
     def title(self, value: str): 
         self._title = self.validate_title(value)
+        self._changed()
 
     @property
     def period_start_date(self): 
@@ -180,6 +275,7 @@ class Task:
         self._period_start_date = self.validate_date(value)
         if hasattr(self, "_period_end_date"):
             self.validate_date_order(self._period_start_date, self.period_end_date)
+        self._changed()
     
     @property
     def period_end_date(self):
@@ -189,6 +285,7 @@ class Task:
         self._period_end_date = self.validate_date(value)
         if hasattr(self, "_period_start_date"):
             self.validate_date_order(self.period_start_date, self._period_end_date)
+        self._changed()
     
     @property
     def priority(self):
@@ -196,6 +293,7 @@ class Task:
     @priority.setter
     def priority(self, value: int):
         self._priority = self.validate_priority(value)
+        self._changed()
         
     @property
     def status(self):
@@ -203,6 +301,7 @@ class Task:
     @status.setter
     def status(self, value: str):
         self._status = self.validate_status(value)
+        self._changed()
     
     @property
     def description(self):
@@ -210,6 +309,7 @@ class Task:
     @description.setter
     def description(self, value):
         self._description = value or ""
+        self._changed()
 
         
 
@@ -0,0 +1,148 @@
+"""
+
+Write-ahead log.
+
+Journals every TaskManager change as one JSON line in "<data file>.wal" and
+periodically compacts the log into an atomically replaced snapshot in the
+data file's own format (CSV/JSON/JSONL via FileIO). Saving then only costs
+the changes made since the last save. An empty list is an empty JSON/JSONL
+snapshot; CSV can't hold zero rows, so an emptied CSV list keeps its last
+snapshot and stays in the log until a task is added again.
+"""
+
+import json
+import os
+from pathlib import Path
+from . import TaskManager
+from .fileio import FileIO
+from .task import Task
+
+class WriteAheadLog:
+    """Journals a TaskManager's changes next to its data file."""
+    SUFFIX = ".wal"
+    COMPACT_EVERY = 1000
+
+    def __init__(self, manager: TaskManager, path: str, compact_every: int = COMPACT_EVERY):
+        if compact_every < 1:
+            raise ValueError("compact_every must be at least 1.")
+        self.manager = manager
+        self.path = str(path)
+        self.wal_path = self.path + self.SUFFIX
+        self.compact_every = compact_every
+        self.pending = 0 # entries in the log since the last snapshot
+        self._file = None
+
+    @classmethod
+    def open(
+            cls, manager: TaskManager, path: str, compact_every: int = COMPACT_EVERY, create: bool = False,
+        ) -> "WriteAheadLog":
+        """Load the snapshot and replay the log into manager, then start journaling.
+
+        Leftover log entries are folded into a fresh snapshot right away.
+        FileNotFoundError if neither the data file nor its log exists, unless
+        create is set.
+        """
+        wal = cls(manager, path, compact_every)
+        if not create and not Path(wal.path).exists() and not Path(wal.wal_path).exists():
+            raise FileNotFoundError(wal.path)
+        if Path(wal.path).exists():
+            manager.ingest(FileIO.iter_import(Path(wal.path).suffix, wal.path))
+        replayed = wal.replay()
+        wal.start()
+        if (replayed or not Path(wal.path).exists()) and wal.can_compact():
+            wal.compact()
+        return wal
+
+    def start(self) -> None:
+        """Begin appending every change of the manager to the log."""
+        if self._file is None:
+            self._file = open(self.wal_path, "a", encoding="utf-8")
+            self.manager.subscribe(self.record)
+            self.manager.after_change.append(self.compact_if_due)
+
+    def record(self, op: str, task_id: int | None, row: dict | None) -> None:
+        """TaskManager listener: append one entry.
+
+        Runs in the middle of a store operation, so it never compacts itself;
+        compact_if_due does once the operation is over.
+        """
+        self._file.write(json.dumps({"op": op, "id": task_id, "task": row}, ensure_ascii=False) + "\n")
+        self._file.flush() # survives a crash of this process; sync() also survives power loss
+        self.pending += 1
+
+    def compact_if_due(self) -> None:
+        """TaskManager after_change hook: compact once compact_every entries are pending."""
+        if self.pending >= self.compact_every and self.can_compact():
+            self.compact()
+
+    def sync(self) -> str:
+        """Force the log to disk. This is what a save costs in WAL mode."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return f"Saved ({self.pending} change(s) journaled)."
+
+    def can_compact(self) -> bool:
+        """False while the list is empty and the data file is CSV, which can't hold zero rows."""
+        return bool(self.manager.tasks) or Path(self.path).suffix.lower() != ".csv"
+
+    def compact(self) -> str:
+        """Write a snapshot atomically, then empty the log."""
+        with self.manager.tasks.lock: # no entry can land between the snapshot and emptying the log
+            if not self.can_compact():
+                raise ValueError("A CSV file can't hold an empty task list; add a task or save as .json/.jsonl.")
+            message = FileIO.export(Path(self.path).suffix, self.manager.iter_dicts(include_id=True), self.path)
+            self.manager.mark_saved(self.path)
+            if self._file is not None:
+                self._file.truncate(0)
+                self._file.flush()
+            elif Path(self.wal_path).exists():
+                os.remove(self.wal_path)
+            self.pending = 0
+            return message
+
+    def close(self) -> str:
+        """Compact one last time (if the list can be snapshotted) and stop journaling."""
+        if self.can_compact():
+            message = self.compact()
+        else: # the deletes stay in the log, so the next open still comes back empty
+            message = "Changes kept in the log (a CSV file can't hold an empty list)."
+        if self._file is not None:
+            self.manager.unsubscribe(self.record)
+            self.manager.after_change.remove(self.compact_if_due)
+            self._file.close()
+            self._file = None
+        return message
+
+    def replay(self) -> int:
+        """Apply log entries to the manager; return how many were applied.
+
+        Replay is idempotent, so a crash between a snapshot and emptying the log
+        is harmless. A torn last line (crash mid-write) is ignored.
+        """
+        if not Path(self.wal_path).exists():
+            return 0
+        with open(self.wal_path, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        store = self.manager.tasks
+        applied = 0
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if number == len(lines):
+                    break
+                raise
+            op, task_id, row = entry["op"], entry["id"], entry["task"]
+            if op == "clear":
+                store.clear()
+            elif op == "delete":
+                if store.has_id(task_id):
+                    store.remove(task_id)
+            elif store.has_id(task_id): # "add" already in the snapshot, or "update"
+                store.replace(task_id, Task.from_dicts([row])[0])
+            else:
+                store.extend_records([dict(row, id=task_id)], trusted=True)
+            applied += 1
+        return applied
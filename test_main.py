@@ -6,7 +6,9 @@ Unit tests for Task Manager CLI entry point: Behavior.
 """
 
 import main
+from functools import partial
 from task_manager import TaskManager, Task
+from task_manager.fileio import FileIO
 
 def test_input_other_choices(capsys):
     inputs = iter([
@@ -58,3 +60,148 @@ def test_update_delete_helper_empty_manager(capsys):
     out = capsys.readouterr().out
     assert result is None
     assert TaskManager.EMPTY_MESSAGE in out
+
+def test_save_tasks_appends_only_new_rows(tmp_path):
+    path = str(tmp_path / "tasks.jsonl")
+    m1 = TaskManager()
+    m1.add_task(Task("First", "2999-01-01"))
+    assert "Exported" in main.save_tasks(m1, path)
+    m1.add_task(Task("Second", "2999-01-01"))
+    assert "Appended" in main.save_tasks(m1, path)
+    assert "Appended" in main.save_tasks(m1, path) # nothing new: appends zero lines
+    m1.delete_task(1)
+    assert "Exported" in main.save_tasks(m1, path) # deletes need a rewrite
+    m2 = TaskManager()
+    m2.ingest(FileIO.iter_import(".jsonl", path))
+    assert m2.to_dict_list(include_id=True) == m1.to_dict_list(include_id=True)
+    # A different path is never appended to
+    other = str(tmp_path / "other.jsonl")
+    assert "Exported" in main.save_tasks(m1, other)
+
+def test_startup_without_pandas():
+    from benchmarks import startup
+    result = startup.measure(runs=1)
+    assert startup.check(result, budget_ms=None) == [] # the time budget: python -m benchmarks.startup
+
+def test_print_report_loads_reports_lazily(capsys):
+    m1 = TaskManager()
+    main.print_report("get_priority_report", m1)
+    assert TaskManager.EMPTY_MESSAGE in capsys.readouterr().out
+
+def test_stats_choice_prints_table(capsys):
+    m1 = TaskManager()
+    m1.add_task(Task("Title", "2999-01-01"))
+    assert main.other_choices("stats", m1, "x.json") == "x.json"
+    assert "TaskManager.add_task" in capsys.readouterr().out
+
+def test_profiled_writes_one_dump_per_command(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "profile_dir", tmp_path / "profiles")
+    monkeypatch.setattr(main, "profile_count", 0)
+    for choice in ("stats", "view"):
+        with main.profiled(choice):
+            main.other_choices(choice, TaskManager(), "")
+    assert sorted(p.name for p in (tmp_path / "profiles").iterdir()) == ["001-stats.pstats", "002-view.pstats"]
+
+def test_page_tasks_next_prev_jump(capsys):
+    m1 = TaskManager()
+    for i in range(1, 8):
+        m1.add_task(Task(f"Task {i}", "2999-01-01"))
+    answers = iter(["", "p", "3", "x", "q"])
+    main.page_tasks(m1, page_size=3, input_fn=lambda prompt: next(answers))
+    out = capsys.readouterr().out
+    shown = [line.split(".")[0] for line in out.splitlines() if line[:1].isdigit()]
+    assert shown == ["1", "2", "3", "4", "5", "6", "1", "2", "3", "7"]
+    assert "page 3 of 3" in out
+    assert "Please enter n, p, q or a page number between 1 and 3." in out
+
+def test_page_tasks_single_page_does_not_prompt(capsys):
+    m1 = TaskManager()
+    m1.add_task(Task("Title", "2999-01-01"))
+    def no_prompt(prompt: str) -> str:
+        raise AssertionError("prompted")
+    main.page_tasks(m1, input_fn=no_prompt)
+    assert "1. " in capsys.readouterr().out
+
+def test_parse_numbers_ranges():
+    assert main.parse_numbers("3-5,55, 7") == [3, 4, 5, 55, 7]
+    assert main.parse_numbers("2") == [2]
+    for bad in ("", "a", "5-3", "1-", "-2"):
+        try:
+            main.parse_numbers(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} was accepted")
+    try:
+        main.parse_numbers(f"1-{10**9}", maximum=10)
+    except ValueError as e:
+        assert "between 1 and 10" in str(e)
+    else:
+        raise AssertionError("range past maximum was accepted")
+
+def test_delete_choice_accepts_ranges(monkeypatch, capsys):
+    m1 = TaskManager()
+    m1.add_tasks(Task(f"Task {i}", "2999-01-01") for i in range(1, 11))
+    answers = iter(["3-5,x", "3-5,9", "y"])
+    fake_input = lambda prompt: next(answers)
+    monkeypatch.setattr("builtins.input", fake_input) # the confirmation
+    monkeypatch.setattr(main, "numbers_helper", partial(main.numbers_helper, input_fn=fake_input))
+    main.other_choices("delete", m1, "")
+    assert [task.title for task in m1.tasks] == [f"Task {i}" for i in (1, 2, 6, 7, 8, 10)]
+    assert "4 task(s) have been deleted successfully." in capsys.readouterr().out
+
+def test_update_status_choice_writes_a_single_task_once(monkeypatch, capsys):
+    m1 = TaskManager()
+    m1.add_tasks(Task(f"Task {i}", "2999-01-01") for i in range(1, 4))
+    version = m1.version
+    answers = iter(["2", "c"])
+    fake_input = lambda prompt: next(answers)
+    monkeypatch.setattr("builtins.input", fake_input) # the status
+    monkeypatch.setattr(main, "numbers_helper", partial(main.numbers_helper, input_fn=fake_input))
+    main.other_choices("update_status", m1, "")
+    assert [task.status for task in m1.tasks] == ["ns", "c", "ns"]
+    assert m1.version == version + 1
+    assert "1 task(s) marked completed." in capsys.readouterr().out
+
+def test_run_script_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "manager", TaskManager())
+    script = tmp_path / "script.txt"
+    target = tmp_path / "tasks.json"
+    script.write_text(f"add One 2999-01-01\nadd Two 2999-01-02\nstatus 1-2 c\nsave {target}\n", encoding="utf-8")
+    try:
+        main.main(["run", str(script)])
+    except SystemExit as e:
+        assert e.code == 0
+    else:
+        raise AssertionError("run mode should exit")
+    assert [row["status"] for row in FileIO.import_(".json", target)] == ["c", "c"]
+
+def test_run_script_leaves_database_untouched_on_error(tmp_path, monkeypatch):
+    database = tmp_path / "tasks.db"
+    FileIO.export(".db", [Task("Keep", "2999-01-01").to_dict()], database)
+    script = tmp_path / "script.txt"
+    def run(text: str) -> list[str]:
+        monkeypatch.setattr(main, "manager", TaskManager())
+        script.write_text(text, encoding="utf-8")
+        try:
+            main.main(["run", str(script), "--file", str(database)])
+        except SystemExit:
+            pass
+        return [row["title"] for row in FileIO.import_(".db", database)]
+    assert run("delete 1\nadd Two 2999-01-02\nstatus 9 c\nsave\n") == ["Keep"] # failed: nothing written
+    assert run("delete 1\nadd Two 2999-01-02\nsave\n") == ["Two"]
+
+def test_autosave_is_not_started_on_a_database_opened_in_place(tmp_path, monkeypatch):
+    database = tmp_path / "tasks.db"
+    FileIO.export(".db", [Task("Keep", "2999-01-01").to_dict()], database)
+    monkeypatch.setattr(main, "manager", TaskManager())
+    monkeypatch.setattr(main, "autosaver", None)
+    answers = iter(["open", str(database), "n", "exit", "n"])
+    fake_input = lambda prompt="": next(answers)
+    monkeypatch.setattr("builtins.input", fake_input)
+    monkeypatch.setattr(main, "input_create_open", partial(main.input_create_open, input_fn=fake_input))
+    monkeypatch.setattr(main, "input_other_choices", partial(main.input_other_choices, input_fn=fake_input))
+    try:
+        main.main(["--autosave"])
+    except SystemExit:
+        pass
+    assert main.autosaver is None
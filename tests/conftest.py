@@ -8,7 +8,7 @@ Shared pytest fixtures for Task tests.
 import pytest
 from datetime import date, timedelta
 from task_manager import Task, TaskManager
-from task_manager.fileio import FileIO, csv_io, json_io
+from task_manager.fileio import FileIO, csv_io, json_io, jsonl_io, npz_io, sqlite_io, tmb_io
 
 TODAY: date = date.today()
 
@@ -46,10 +46,28 @@ def reset_registry():
     """Cleans and Re-registers built-ins."""
     FileIO.exporters.clear()
     FileIO.importers.clear()
+    FileIO.stream_importers.clear()
+    FileIO.appenders.clear()
     FileIO.register_exporter(".csv", csv_io.export_csv)
     FileIO.register_importer(".csv", csv_io.import_csv)
+    FileIO.register_stream_importer(".csv", csv_io.iter_csv)
     FileIO.register_exporter(".json", json_io.export_json)
     FileIO.register_importer(".json", json_io.import_json)
+    FileIO.register_stream_importer(".json", json_io.iter_json)
+    FileIO.register_exporter(".jsonl", jsonl_io.export_jsonl)
+    FileIO.register_importer(".jsonl", jsonl_io.import_jsonl)
+    FileIO.register_stream_importer(".jsonl", jsonl_io.iter_jsonl)
+    FileIO.register_appender(".jsonl", jsonl_io.append_jsonl)
+    FileIO.register_exporter(".npz", npz_io.export_npz)
+    FileIO.register_importer(".npz", npz_io.import_npz)
+    FileIO.register_stream_importer(".npz", npz_io.iter_npz)
+    FileIO.register_exporter(".tmb", tmb_io.export_tmb)
+    FileIO.register_importer(".tmb", tmb_io.import_tmb)
+    FileIO.register_stream_importer(".tmb", tmb_io.iter_tmb)
+    for ext in (".sqlite", ".db"):
+        FileIO.register_exporter(ext, sqlite_io.export_sqlite)
+        FileIO.register_importer(ext, sqlite_io.import_sqlite)
+        FileIO.register_stream_importer(ext, sqlite_io.iter_sqlite)
 
 @pytest.fixture
 def task_list(sample_task: Task, complete_sample_task: Task, overdue_task: Task) -> list[dict]: 
@@ -0,0 +1,44 @@
+"""
+
+Test asyncio API.
+
+Unit tests for FileIO.aexport/aimport/aiter_import and TaskManager.aingest.
+"""
+
+import asyncio
+import pytest
+from task_manager import TaskManager
+from task_manager.fileio import FileIO
+
+def test_aexport_aimport_round_trip(tmp_path, task_list: list[dict]):
+    path = str(tmp_path / "tasks.json")
+    async def scenario():
+        assert "Exported" in await FileIO.aexport(".json", task_list, path)
+        return await FileIO.aimport(".json", path)
+    assert asyncio.run(scenario()) == task_list
+
+def test_aingest_yields_between_batches(tmp_path, task_list: list[dict]):
+    path = str(tmp_path / "tasks.jsonl")
+    FileIO.export(".jsonl", task_list * 10, path)
+    m1 = TaskManager()
+    ticks = []
+    async def ticker():
+        while True:
+            ticks.append(len(m1.tasks))
+            await asyncio.sleep(0)
+    async def scenario():
+        task = asyncio.create_task(ticker())
+        count = await m1.aingest(FileIO.aiter_import(".jsonl", path, chunk_size=5))
+        task.cancel()
+        return count
+    assert asyncio.run(scenario()) == len(task_list) * 10
+    assert m1.to_dict_list() == task_list * 10
+    assert len(set(ticks)) > 2 # the other coroutine ran while batches were loading
+
+def test_aingest_accepts_plain_batches(task_list: list[dict]):
+    m1 = TaskManager()
+    assert asyncio.run(m1.aingest([task_list[:2], task_list[2:]])) == len(task_list)
+
+def test_aimport_errors_propagate(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(FileIO.aimport(".json", str(tmp_path / "missing.json")))
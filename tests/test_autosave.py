@@ -0,0 +1,79 @@
+"""
+
+Test background autosave.
+
+Unit tests for AutoSaver: dirty tracking, debounce, skip when unchanged.
+"""
+
+import time
+from task_manager import TaskManager, Task
+from task_manager.autosave import AutoSaver
+from task_manager.fileio import FileIO
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_version_and_dirty_tracking(sample_task: Task):
+    m1 = TaskManager()
+    assert not m1.dirty
+    m1.add_task(sample_task)
+    version = m1.version
+    assert m1.dirty
+    m1.tasks[0].marked_complete()
+    assert m1.version > version
+    m1.mark_saved("tasks.csv")
+    assert not m1.dirty
+    m1.delete_task(1)
+    assert m1.dirty
+
+def test_autosave_writes_after_edits_settle(tmp_path, sample_task: Task, complete_sample_task: Task):
+    path = tmp_path / "tasks.json"
+    m1 = TaskManager()
+    saver = AutoSaver(m1, str(path), delay=0.05, interval=0.01)
+    saver.start()
+    try:
+        m1.add_task(sample_task)
+        m1.add_task(complete_sample_task)
+        assert wait_for(lambda: not m1.dirty)
+        assert FileIO.import_(".json", str(path)) == m1.to_dict_list(include_id=True)
+        saves = saver.saves
+        time.sleep(0.2) # nothing changed: no further writes
+        assert saver.saves == saves
+    finally:
+        saver.stop()
+
+def test_autosave_stop_flushes_pending_edits(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.csv"
+    m1 = TaskManager()
+    saver = AutoSaver(m1, str(path), delay=60)
+    saver.start()
+    m1.add_task(sample_task)
+    saver.stop()
+    assert not m1.dirty
+    assert FileIO.import_(".csv", str(path))[0]["title"] == sample_task.title
+
+def test_autosave_without_path_or_changes_does_nothing(tmp_path, sample_task: Task):
+    m1 = TaskManager()
+    saver = AutoSaver(m1)
+    m1.add_task(sample_task)
+    assert saver.save_now() is False # no path yet
+    saver.path = str(tmp_path / "tasks.csv")
+    assert saver.save_now() is True
+    assert saver.save_now() is False # nothing changed since
+
+def test_autosave_writes_an_emptied_list_except_to_csv(tmp_path, sample_task: Task):
+    for ext, written in ((".json", True), (".jsonl", True), (".csv", False)):
+        path = tmp_path / f"tasks{ext}"
+        m1 = TaskManager()
+        saver = AutoSaver(m1, str(path))
+        m1.add_task(sample_task)
+        assert saver.save_now() is True
+        m1.delete_task(1)
+        assert saver.save_now() is written
+        assert len(FileIO.import_(ext, str(path))) == (0 if written else 1)
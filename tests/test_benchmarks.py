@@ -0,0 +1,40 @@
+"""
+
+Test benchmarks.
+
+Unit tests for the benchmark generator, runner and comparison (tiny sizes).
+"""
+
+from benchmarks import compare, run
+from benchmarks.generate import generate_tasks
+from task_manager import Task
+from tests.conftest import TODAY
+
+def test_generate_tasks_is_seeded_and_valid():
+    records = generate_tasks(500, seed=7, today=TODAY)
+    assert records == generate_tasks(500, seed=7, today=TODAY)
+    assert records != generate_tasks(500, seed=8, today=TODAY)
+    tasks = [Task.from_dict(record) for record in records] # validates every field
+    assert {task.status for task in tasks} == set(Task.STATUS_MAP)
+    assert {task.priority for task in tasks} == set(Task.PRIORITY_MAP)
+    assert any(task.is_overdue() for task in tasks)
+
+def test_run_times_every_case():
+    report = run.run(sizes=[20], repeat=1)
+    assert {r["case"] for r in report["results"]} == set(run.CASES)
+    assert all(r["seconds"] >= 0 and r["size"] == 20 for r in report["results"])
+    assert {"commit", "python", "seed"} <= set(report["meta"])
+    rows = compare.compare(report, report)
+    assert len(rows) == len(run.CASES)
+
+def test_load_test_against_in_process_server(capsys):
+    from benchmarks import load_test
+    assert load_test.main(["--clients", "4", "--requests", "10", "--tasks", "50"]) == 0
+    assert "req/s" in capsys.readouterr().out
+
+def test_contention_run_has_no_torn_reads():
+    from benchmarks import contention
+    for mode in contention.MODES:
+        result = contention.run(readers=2, writers=2, size=200, seconds=0.2, mode=mode)
+        assert result["torn_reads"] == 0
+        assert result["reads_per_sec"] > 0 and result["writes_per_sec"] > 0
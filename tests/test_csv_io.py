@@ -20,4 +20,57 @@ def test_csv_round_trip(tmp_path, sample_task: Task):
 def test_csv_empty_data_export_raises(tmp_path):
     path = tmp_path / "empty.csv"
     with pytest.raises(ValueError, match="No data to export."):
-        FileIO.export(".csv", [], str(path))
\ No newline at end of file
+        FileIO.export(".csv", [], str(path))
+
+def test_csv_export_streams_tasks_and_generators(tmp_path, sample_task: Task, complete_sample_task: Task):
+    path = tmp_path / "tasks.csv"
+    FileIO.export(".csv", (task for task in (sample_task, complete_sample_task)), str(path))
+    loaded = FileIO.import_(".csv", str(path))
+    assert list(loaded[0]) == list(Task.FIELDS)
+    assert Task.from_dicts(loaded) == [sample_task, complete_sample_task]
+
+def test_csv_empty_generator_export_raises(tmp_path):
+    with pytest.raises(ValueError, match="No data to export."):
+        FileIO.export(".csv", iter([]), str(tmp_path / "empty.csv"))
+
+def test_csv_parallel_import_matches_serial(tmp_path, task_list: list[dict]):
+    rows = []
+    for i in range(200):
+        row = dict(task_list[i % len(task_list)], title=f"Task {i} ✓")
+        if i % 3 == 0: # quoted newlines, quotes and commas must not split records
+            row["description"] = f'line one\nline "two", {i}\r\nthree ""'
+        rows.append(row)
+    path = str(tmp_path / "big.csv")
+    FileIO.export(".csv", rows, path)
+    serial = csv_io.import_csv(path, workers=1)
+    parallel = csv_io.import_csv(path, workers=3, min_bytes=0)
+    assert parallel == serial
+    assert [row["description"] for row in parallel] == [row["description"] for row in rows]
+
+def test_csv_split_starts_ranges_on_record_boundaries(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_bytes(b'title,description\r\na,"x\ny\nz"\r\nb,plain\r\nc,"q""\n"\r\n')
+    with open(path, "rb") as file:
+        header_end = csv_io._record_end(file, 0, 0)
+        ranges = csv_io._split(file, header_end, path.stat().st_size, 8)
+    data = path.read_bytes()
+    starts = [data[start:start + 2] for start, _ in ranges]
+    assert set(starts) <= {b"a,", b"b,", b"c,"}
+    assert ranges[0][0] == header_end and ranges[-1][1] == len(data)
+    assert csv_io.import_csv(str(path), workers=2, min_bytes=0) == csv_io.import_csv(str(path), workers=1)
+
+def test_csv_parallel_header_only(tmp_path):
+    path = tmp_path / "header.csv"
+    path.write_text("title,description\r\n", encoding="utf-8")
+    assert csv_io.import_csv(str(path), workers=2, min_bytes=0) == []
+
+def test_csv_export_uses_task_schema(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.csv"
+    row = sample_task.to_dict()
+    shuffled = {key: row[key] for key in reversed(Task.FIELDS) if key != "description"}
+    FileIO.export(".csv", [dict(shuffled, id=7), dict(row, id=8)], str(path))
+    loaded = FileIO.import_(".csv", str(path))
+    assert list(loaded[0]) == ["id", *Task.FIELDS]
+    assert loaded[0]["description"] == "" and loaded[1]["id"] == "8"
+    with pytest.raises(ValueError):
+        FileIO.export(".csv", [dict(row, owner="me")], str(path))
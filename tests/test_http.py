@@ -0,0 +1,112 @@
+"""
+
+Test HTTP service.
+
+Unit tests for ui.http.server against a live server on a free port.
+"""
+
+import http.client
+import json
+import threading
+import pytest
+from task_manager import Task, TaskManager
+from ui.http.server import make_server
+
+@pytest.fixture
+def server(task_list: list[dict]):
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    server = make_server(m1, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def request(server, method: str, path: str, body: dict | None = None) -> tuple[int, object]:
+    conn = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        conn.request(method, path, None if body is None else json.dumps(body))
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+def test_pages_tasks(server, task_list: list[dict]):
+    status, page = request(server, "GET", "/tasks?offset=1&limit=2")
+    assert status == 200
+    assert page["total"] == len(task_list)
+    assert [task["id"] for task in page["tasks"]] == [2, 3]
+    assert {k: v for k, v in page["tasks"][0].items() if k != "id"} == task_list[1]
+    assert request(server, "GET", "/tasks?limit=0")[0] == 400
+
+def test_crud(server):
+    status, added = request(server, "POST", "/tasks", {"title": "New", "period_end_date": "2999-01-01", "priority": 1})
+    assert status == 201
+    status, task = request(server, "GET", f"/tasks/{added['id']}")
+    assert status == 200 and task["title"] == "New" and task["priority"] == 1
+    status, _ = request(server, "PUT", f"/tasks/{added['id']}", {"status": "c"})
+    assert status == 200
+    task = request(server, "GET", f"/tasks/{added['id']}")[1]
+    assert task["status"] == "c" and task["title"] == "New" # other fields kept
+    assert request(server, "DELETE", f"/tasks/{added['id']}")[0] == 200
+    assert request(server, "GET", f"/tasks/{added['id']}")[0] == 404
+
+def test_rejects_bad_input(server):
+    status, body = request(server, "POST", "/tasks", {"title": "No end date"})
+    assert status == 400 and "period_end_date" in body["error"]
+    assert request(server, "POST", "/tasks", {"title": "x", "period_end_date": "2999-01-01", "priority": 9})[0] == 400
+    assert request(server, "PUT", "/tasks/1", {"period_end_date": "not a date"})[0] == 400
+    assert request(server, "GET", "/tasks/abc")[0] == 400
+    assert request(server, "GET", "/nothing")[0] == 404
+
+def test_reports(server):
+    status, rows = request(server, "GET", "/reports/overdue")
+    assert status == 200
+    assert [row["title"] for row in rows] == ["overdue_2", "overdue_1"]
+    status, rows = request(server, "GET", "/reports/priority")
+    assert status == 200 and rows[0]["title"] == "Test"
+
+def test_concurrent_clients(server):
+    def client(n: int):
+        for i in range(20):
+            request(server, "POST", "/tasks", {"title": f"c{n}-{i}", "period_end_date": "2999-01-01"})
+            request(server, "GET", "/tasks?limit=10")
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    manager = server.manager
+    assert len(manager.tasks) == 5 + 8 * 20
+    assert len({task.title for task in manager.tasks}) == len(manager.tasks)
+    assert all(isinstance(task, Task) for task in manager.tasks)
+
+def test_wrong_json_types_are_bad_requests(server):
+    for body in ({"title": 5, "period_end_date": "2999-01-01"}, {"title": "x", "period_end_date": 20990101},
+                 {"title": "x", "period_end_date": "2999-01-01", "priority": True}):
+        status, reply = request(server, "POST", "/tasks", body)
+        assert status == 400 and "Invalid type" in reply["error"]
+    assert request(server, "PUT", "/tasks/1", {"status": ["c"]})[0] == 400
+    assert request(server, "GET", "/tasks")[0] == 200 # the server is still up
+
+def test_unexpected_errors_answer_500(server, monkeypatch):
+    def broken(*args):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(server.manager, "delete_task_by_id", broken)
+    status, reply = request(server, "DELETE", "/tasks/1")
+    assert status == 500 and reply["error"] == "Internal error: RuntimeError"
+
+def test_main_saves_loaded_file_on_shutdown(tmp_path, task_list: list[dict], monkeypatch):
+    from task_manager.fileio import FileIO
+    from ui.http import server as http_server
+    path = tmp_path / "tasks.json"
+    FileIO.export(".json", task_list, path)
+    def serve_forever(self):
+        self.manager.delete_task_by_id(1) # a change made through the API
+        raise KeyboardInterrupt
+    monkeypatch.setattr(http_server.TaskServer, "serve_forever", serve_forever)
+    assert http_server.main([str(path), "--port", "0"]) == 0
+    rows = FileIO.import_(".json", path)
+    assert [row.pop("id") for row in rows] == list(range(2, len(task_list) + 1)) # ids kept
+    assert rows == task_list[1:]
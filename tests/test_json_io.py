@@ -6,6 +6,8 @@ Unit tests for FileIO: json section.
 """
 import pytest
 import json
+import os
+import stat
 from task_manager.fileio import FileIO, json_io
 from task_manager import Task
 
@@ -27,8 +29,46 @@ def test_json_export_none_data_raises(tmp_path):
     with pytest.raises(ValueError, match="No data to export"):
         FileIO.export(".json", None, str(path))
 
+def test_json_streamed_export_matches_json_dump(tmp_path, task_list: list[dict]):
+    for rows in (task_list, task_list[:1], []):
+        path = tmp_path / "tasks.json"
+        FileIO.export(".json", iter(rows), str(path))
+        assert path.read_text(encoding="utf-8") == json.dumps(rows, ensure_ascii=False, indent=2)
+
 def test_json_import_bad_json_raises(tmp_path):
     path = tmp_path / "bad.json"
     path.write_text("{bad json", encoding="utf-8")
     with pytest.raises(json.JSONDecodeError):
-        FileIO.import_(".json", str(path))
\ No newline at end of file
+        FileIO.import_(".json", str(path))
+
+@pytest.mark.parametrize("block_size", [1, 7, 64, 1 << 16])
+def test_iter_json_matches_json_load(tmp_path, task_list: list[dict], block_size: int):
+    path = tmp_path / "tasks.json"
+    task_list[0]["description"] = 'tricky "quotes", [brackets] and {braces}'
+    FileIO.export(".json", task_list, str(path))
+    assert list(json_io.iter_json(str(path), block_size=block_size)) == task_list
+
+def test_iter_json_empty_array(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] ", encoding="utf-8")
+    assert list(json_io.iter_json(str(path))) == []
+
+@pytest.mark.parametrize("text", ["{bad json", '[{"a": 1} {"b": 2}]', '[{"a": 1},'])
+def test_iter_json_bad_json_raises(tmp_path, text: str):
+    path = tmp_path / "bad.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(json_io.iter_json(str(path), block_size=4))
+
+def test_export_file_mode_follows_umask_or_target(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.json"
+    old = os.umask(0o027)
+    try:
+        FileIO.export(".json", task_list, str(path))
+    finally:
+        os.umask(old)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    path.chmod(0o600)
+    FileIO.export(".json", task_list, str(path)) # replacing keeps the mode
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["tasks.json"] # no temp file left
@@ -0,0 +1,41 @@
+"""
+
+Test JSON Lines handler.
+
+Unit tests for FileIO: jsonl section.
+"""
+import pytest
+import json
+from task_manager.fileio import FileIO, jsonl_io
+from task_manager import Task
+
+def test_jsonl_round_trip(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.jsonl"
+    massage = FileIO.export(".jsonl", task_list, str(path))
+    assert "Exported" in massage
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(task_list)
+    assert FileIO.import_(".jsonl", str(path)) == task_list
+    assert [row for batch in FileIO.iter_import(".jsonl", str(path), chunk_size=2) for row in batch] == task_list
+
+def test_jsonl_append_adds_lines(tmp_path, task_list: list[dict], sample_task: Task):
+    path = tmp_path / "tasks.jsonl"
+    FileIO.export(".jsonl", task_list, str(path))
+    massage = FileIO.append(".jsonl", [sample_task], str(path))
+    assert "Appended" in massage
+    assert FileIO.import_(".jsonl", str(path)) == [*task_list, sample_task.to_dict()]
+
+def test_jsonl_skips_blank_lines(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text("\n" + json.dumps(sample_task.to_dict()) + "\n\n", encoding="utf-8")
+    assert Task.from_dicts(jsonl_io.import_jsonl(str(path))) == [sample_task]
+
+def test_jsonl_bad_line_raises(tmp_path):
+    path = tmp_path / "bad.jsonl"
+    path.write_text('{"title": "ok"}\n{bad json\n', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        FileIO.import_(".jsonl", str(path))
+
+def test_append_unknown_extension_raises(tmp_path):
+    assert not FileIO.can_append(".csv")
+    with pytest.raises(ValueError, match="No appender registered"):
+        FileIO.append(".csv", [{"k": "v"}], str(tmp_path / "x.csv"))
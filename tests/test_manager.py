@@ -7,6 +7,8 @@ Unit tests for TaskManager: validation, behavior.
 
 from task_manager import TaskManager, Task
 import pytest
+import sys
+import threading
 from datetime import date, timedelta
 
 # ---- Success ----
@@ -83,6 +85,20 @@ def test_view_tasks(sample_task: Task):
     assert rows[0].startswith("1.")
     assert "Sample Task" in rows[0]
 
+def test_view_tasks_pages(task_list: list[dict]):
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    m1.delete_task(1) # tombstone: pages still follow task numbers
+    rows = list(m1.view_tasks(offset=1, limit=2))
+    assert [row.split(".")[0] for row in rows] == ["2", "3"]
+    assert rows == list(m1.view_tasks())[1:3]
+    assert list(m1.view_tasks(offset=3, limit=10)) == list(m1.view_tasks())[3:]
+    assert list(m1.view_tasks(offset=10, limit=5)) == []
+    with pytest.raises(ValueError):
+        list(m1.view_tasks(offset=-1))
+    with pytest.raises(ValueError):
+        list(m1.view_tasks(limit=0))
+
 def test_to_dict_list(sample_task: Task, complete_sample_task: Task):
     m1 = TaskManager()
     today = date.today()
@@ -108,11 +124,74 @@ def test_to_dict_list(sample_task: Task, complete_sample_task: Task):
         }
     ] 
 
+def test_iter_dicts_is_lazy_and_matches_to_dict_list(sample_task: Task, complete_sample_task: Task):
+    m1 = TaskManager()
+    m1.add_task(sample_task)
+    m1.add_task(complete_sample_task)
+    rows = m1.iter_dicts(include_id=True)
+    assert not isinstance(rows, list)
+    assert list(rows) == m1.to_dict_list(include_id=True)
+    assert list(m1.to_dict_list(include_id=True)[0]) == ["id", *Task.FIELDS]
+
 def test_empty_tasklist_to_dict_list():
     m1 = TaskManager()
     data = m1.to_dict_list()
     assert data == []
 
+def test_indexed_queries_match_scans(task_list: list[dict]):
+    indexed, plain = TaskManager(indexed=True), TaskManager()
+    for manager in (indexed, plain):
+        for task in Task.from_dicts(task_list):
+            manager.add_task(task)
+        manager.tasks[1].mark_in_progress()
+        manager.update_task(3, Task(title="Moved", period_end_date=date.today(), priority=1))
+        manager.delete_task(1)
+    today = date.today()
+    for manager in (indexed, plain):
+        assert manager.find_tasks(priority=1) == [2, 4]
+        assert manager.find_tasks(status="in-progress") == [1]
+        assert manager.find_tasks(status="ns", priority=1) == [2, 4]
+        assert manager.tasks_ending_between(today - timedelta(days=10), today) == [3, 2]
+        for number in manager.find_tasks(status="ns"):
+            assert manager.validate_index(number) == number
+
+def test_ids_survive_deletes_and_file_round_trip(tmp_path, sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    from task_manager.fileio import FileIO
+    m1 = TaskManager()
+    for task in (sample_task, complete_sample_task, overdue_task):
+        m1.add_task(task)
+    third = m1.task_id(3)
+    assert m1.delete_task_by_id(m1.task_id(1)) == f"Task '{sample_task.title}' has been deleted successfully."
+    assert m1.get_task(third) == overdue_task
+    assert m1.update_task_by_id(third, sample_task) == f"Task '{sample_task.title}' updated successfully."
+    assert m1.tasks[1] == sample_task
+    for ext in (".csv", ".json"):
+        path = tmp_path / f"tasks{ext}"
+        FileIO.export(ext, m1.to_dict_list(include_id=True), str(path))
+        m2 = TaskManager()
+        for item, task in zip(FileIO.import_(ext, str(path)), Task.from_dicts(FileIO.import_(ext, str(path)))):
+            m2.add_task(task, task_id=item.get("id"))
+        assert m2.get_task(third) == sample_task
+        assert m2.to_dict_list(include_id=True) == m1.to_dict_list(include_id=True)
+
+def test_ingest_batches(task_list: list[dict]):
+    m1 = TaskManager(indexed=True)
+    rows = [dict(row, priority=str(row["priority"])) for row in task_list] # as read from CSV
+    assert m1.ingest([rows[:2], rows[2:]]) == 5
+    assert m1.to_dict_list() == task_list
+    assert m1.find_tasks(priority=1) == [5]
+    assert m1.ingest([[dict(task_list[0], id=9)]]) == 1
+    assert m1.task_id(6) == 9
+
+def test_ingest_bad_batch_is_all_or_nothing(task_list: list[dict]):
+    m1 = TaskManager()
+    bad = [task_list[0], dict(task_list[1], status="done")]
+    with pytest.raises(ValueError):
+        m1.ingest([bad])
+    assert len(m1.tasks) == 0
+    with pytest.raises(ValueError, match="Duplicate task id"):
+        m1.ingest([[dict(task_list[0], id=1), dict(task_list[1], id=1)]])
+
 # ---- Error ----
 
 def test_add_task_none():
@@ -145,4 +224,107 @@ def test_empty_tasklist_view():
     m1 = TaskManager()
     with pytest.raises(ValueError):
         list(m1.view_tasks())
-    
+
+def test_invalid_task_id(sample_task: Task):
+    m1 = TaskManager()
+    m1.add_task(sample_task)
+    with pytest.raises(ValueError, match="No task with id 2"):
+        m1.get_task(2)
+    with pytest.raises(ValueError):
+        m1.delete_task_by_id("one")
+    with pytest.raises(ValueError):
+        m1.update_task_by_id(1, None)
+    with pytest.raises(ValueError, match="Duplicate task id"):
+        m1.add_task(sample_task, task_id=1)
+
+def test_concurrent_readers_and_writers(task_list: list[dict]):
+    m1 = TaskManager()
+    m1.ingest([task_list * 20])
+    stop = threading.Event()
+    errors = []
+    def reader():
+        while not stop.is_set():
+            rows = m1.to_dict_list(include_id=True)
+            if len({row["id"] for row in rows}) != len(rows):
+                errors.append("torn read")
+            list(m1.view_tasks())
+    def writer(n: int):
+        for i in range(200):
+            with m1.tasks.lock: # the added task's id, before another writer adds one
+                m1.add_task(Task(f"w{n}-{i}", "2999-01-01"))
+                task_id = m1.task_id(len(m1.tasks))
+            m1.update_task(1, Task(f"w{n}", "2999-01-01"))
+            m1.delete_task_by_id(task_id)
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(3)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    assert not errors
+    assert len(m1.tasks) == len(task_list) * 20
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_queries_during_writes(task_list: list[dict], indexed: bool):
+    m1 = TaskManager(indexed=indexed)
+    m1.ingest([task_list * 1000])
+    stop = threading.Event()
+    errors = []
+    def reader():
+        while not stop.is_set():
+            try:
+                found = m1.find_tasks(status="ns") + m1.tasks_ending_between("2000-01-01", "2999-12-31")
+            except (KeyError, RuntimeError) as error: # a tombstoned slot, or "Set changed size during iteration"
+                errors.append(error)
+                continue
+            if any(not 0 < number <= len(task_list) * 1000 + 1 for number in found):
+                errors.append(found)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # switch threads often enough to land inside a lookup
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    try:
+        for thread in readers:
+            thread.start()
+        for i in range(300):
+            m1.add_task(Task(f"w{i}", "2999-01-01"))
+            m1.delete_task(len(m1.tasks))
+    finally:
+        stop.set()
+        for thread in readers:
+            thread.join()
+        sys.setswitchinterval(interval)
+    assert not errors
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_batch_changes(task_list: list[dict], indexed: bool):
+    m1 = TaskManager(indexed=indexed)
+    assert m1.add_tasks(Task.from_dicts(task_list * 4)) == "20 task(s) have been added successfully."
+    titles = [task.title for task in m1.tasks]
+    assert m1.delete_tasks([3, 4, 5, 5, 12]) == "4 task(s) have been deleted successfully."
+    assert [task.title for task in m1.tasks] == [t for i, t in enumerate(titles, 1) if i not in (3, 4, 5, 12)]
+    assert m1.set_status(range(1, 4), "c") == "3 task(s) marked completed."
+    assert m1.find_tasks(status="c") == [1, 2, 3]
+    new = Task("Replaced", "2999-01-01", priority=1)
+    assert m1.update_tasks({2: new, 16: new}) == "2 task(s) updated successfully."
+    assert m1.tasks[1] == new and m1.tasks[15] == new
+    assert {2, 16} <= set(m1.find_tasks(priority=1))
+    assert m1.tasks_ending_between("2999-01-01", "2999-01-01") == [2, 16]
+
+def test_batch_changes_are_all_or_nothing(task_list: list[dict]):
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    before, version = m1.to_dict_list(), m1.version
+    with pytest.raises(ValueError, match="between 1 and 5"):
+        m1.delete_tasks([1, 2, 6])
+    with pytest.raises(ValueError):
+        m1.set_status([1, 2], "done")
+    with pytest.raises(ValueError):
+        m1.update_tasks({1: Task("x", "2999-01-01"), 9: Task("y", "2999-01-01")})
+    with pytest.raises(ValueError):
+        m1.add_tasks([Task("x", "2999-01-01"), None])
+    with pytest.raises(ValueError, match="at least one"):
+        m1.delete_tasks([])
+    assert m1.to_dict_list() == before and m1.version == version
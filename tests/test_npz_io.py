@@ -0,0 +1,75 @@
+"""
+
+Test NumPy snapshot handler.
+
+Unit tests for FileIO: npz section, and loading columns into a TaskManager.
+"""
+import pytest
+import numpy as np
+from task_manager.fileio import FileIO, npz_io
+from task_manager import Task, TaskManager, reports
+
+def test_npz_round_trip(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.npz"
+    massage = FileIO.export(".npz", task_list, str(path))
+    assert "Exported" in massage
+    assert FileIO.import_(".npz", str(path)) == task_list
+    assert [row for batch in FileIO.iter_import(".npz", str(path), chunk_size=2) for row in batch] == task_list
+
+def test_npz_columns_are_typed(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.npz"
+    FileIO.export(".npz", task_list, str(path))
+    with np.load(path) as file:
+        assert file["period_end_date"].dtype == np.int32
+        assert file["priority"].dtype == np.int8
+        assert file["status"].dtype == np.int8
+
+def test_npz_ingest_columns_keeps_ids(tmp_path, sample_task: Task, overdue_task: Task):
+    m1 = TaskManager()
+    m1.add_task(sample_task)
+    m1.add_task(overdue_task)
+    m1.delete_task(1)
+    path = tmp_path / "tasks.npz"
+    FileIO.export(".npz", m1.iter_dicts(include_id=True), str(path))
+    m2 = TaskManager()
+    assert m2.ingest_columns(npz_io.load_columns(str(path))) == 1
+    assert m2.to_dict_list(include_id=True) == m1.to_dict_list(include_id=True)
+    assert reports.get_overdue_report(m2).iloc[0]["title"] == overdue_task.title
+
+def test_npz_missing_column_raises(tmp_path):
+    path = tmp_path / "bad.npz"
+    with open(path, "wb") as file:
+        np.savez(file, title=np.array(["x"]))
+    with pytest.raises(ValueError, match="Not a task .npz file"):
+        FileIO.import_(".npz", str(path))
+
+def test_npz_long_string_does_not_widen_every_row(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.npz"
+    rows = task_list * 200
+    rows[0] = dict(rows[0], description="ü" * 5000)
+    FileIO.export(".npz", rows, str(path))
+    assert path.stat().st_size < 100_000 # fixed-width columns would take about 20 kB per row
+    assert FileIO.import_(".npz", str(path)) == rows
+
+def test_npz_reads_fixed_width_string_columns(tmp_path, task_list: list[dict]):
+    path = tmp_path / "old.npz"
+    FileIO.export(".npz", task_list, str(path))
+    columns = npz_io.load_columns(str(path))
+    with open(path, "wb") as file: # the layout before string heaps
+        np.savez(file, status_codes=np.array(npz_io.STATUS_CODES), **{
+            name: np.array(column) for name, column in columns.items()
+        })
+    assert FileIO.import_(".npz", str(path)) == task_list
+
+def test_npz_bad_files_raise_value_error(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.npz"
+    FileIO.export(".npz", task_list, str(path))
+    good = path.read_bytes()
+    for data in (b"", good[:len(good) // 2]):
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            npz_io.load_columns(str(path))
+    columns = {"id": [0], "title": [""], "period_start_date": [1], "period_end_date": [2],
+               "priority": [3], "status": [0], "description": [""]}
+    with pytest.raises(ValueError, match="Title"):
+        TaskManager().ingest_columns(columns)
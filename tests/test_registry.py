@@ -22,6 +22,20 @@ def test_register_importer():
     FileIO.register_importer(".csv", json_io.import_json)
     assert FileIO.importers[".csv"] is json_io.import_json
 
+def test_iter_import_batches(tmp_path, task_list: list[dict]):
+    for ext in (".csv", ".json"):
+        path = tmp_path / f"tasks{ext}"
+        FileIO.export(ext, task_list, str(path))
+        batches = list(FileIO.iter_import(ext, str(path), chunk_size=2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row["title"] for batch in batches for row in batch] == [row["title"] for row in task_list]
+
+def test_iter_import_falls_back_to_importer(tmp_path):
+    FileIO.register_importer(".txt", lambda path: [{"n": i} for i in range(5)])
+    assert list(FileIO.iter_import(".txt", str(tmp_path / "x.txt"), chunk_size=3)) == [
+        [{"n": 0}, {"n": 1}, {"n": 2}], [{"n": 3}, {"n": 4}]
+    ]
+
 # ---- Behavior (wrong) ----
 
 def test_no_extension():
@@ -51,4 +65,31 @@ def test_unknown_extension_errors(tmp_path):
         FileIO.export(ext, [{"k": "v"}], str(tmp_path / "x.yaml"))
     # unknown importer
     with pytest.raises(ValueError, match=f"No importer registered"):
-        FileIO.import_(ext, str(tmp_path / "x.yaml"))
\ No newline at end of file
+        FileIO.import_(ext, str(tmp_path / "x.yaml"))
+    with pytest.raises(ValueError, match=f"No importer registered"):
+        FileIO.iter_import(ext, str(tmp_path / "x.yaml"))
+
+# ---- import_many ----
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_many_merges_in_order_and_reports_errors(tmp_path, task_list: list[dict], workers: int):
+    from task_manager import TaskManager
+    team_a, team_b = tmp_path / "a.csv", tmp_path / "b.json"
+    FileIO.export(".csv", task_list[:2], str(team_a))
+    FileIO.export(".json", [dict(row, id=7) for row in task_list[2:]], str(team_b))
+    broken = tmp_path / "broken.json"
+    broken.write_text("[{bad", encoding="utf-8")
+    invalid = tmp_path / "invalid.json"
+    FileIO.export(".json", [dict(task_list[0], priority=9)], str(invalid))
+    paths = [team_b, tmp_path / "missing.csv", broken, team_a, invalid, tmp_path / "notes.txt"]
+    records, errors = FileIO.import_many(paths, workers=workers)
+    assert records == task_list[2:] + task_list[:2] # order of paths, ids dropped, CSV strings typed
+    assert list(errors) == [str(p) for p in paths if p not in (team_a, team_b)]
+    assert errors[str(tmp_path / "missing.csv")] == "No such file exists."
+    assert "Invalid task #1" in errors[str(invalid)]
+    assert "No importer registered for .txt" in errors[str(tmp_path / "notes.txt")]
+    m1 = TaskManager()
+    assert m1.ingest([records]) == len(task_list)
+
+def test_import_many_with_no_paths():
+    assert FileIO.import_many([]) == ([], {})
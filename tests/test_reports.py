@@ -70,3 +70,43 @@ def test_reports_drop_description_column(task_list: list[dict]):
     for df in (df1, df2, df3):
         assert "description" not in df.columns
 
+
+@pytest.mark.parametrize("report", ["get_overdue_report", "get_priority_report", "get_remaining_report"])
+def test_reports_from_manager_columns_match_records(task_list: list[dict], report: str):
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    expected = getattr(reports, report)(task_list)
+    actual = getattr(reports, report)(m1)
+    assert actual.to_dict("records") == expected.to_dict("records")
+    assert list(actual.columns) == list(expected.columns)
+
+def test_reports_from_empty_manager_raise():
+    with pytest.raises(ValueError, match=TaskManager.EMPTY_MESSAGE):
+        reports.get_priority_report(TaskManager())
+
+def test_base_frame_is_cached_until_version_or_date_changes(task_list: list[dict], sample_task: Task):
+    from datetime import timedelta
+    from tests.conftest import TODAY
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    base = reports.base_frame(m1)
+    assert reports.base_frame(m1) is base
+    reports.get_overdue_report(m1)
+    reports.get_priority_report(m1)
+    assert reports.base_frame(m1) is base and len(base.columns) == 7 # reports don't touch it
+    assert reports.base_frame(m1, as_of=TODAY + timedelta(days=1)) is not base
+    base = reports.base_frame(m1)
+    m1.tasks[0].marked_complete() # write-back through a built Task moves the version too
+    assert reports.base_frame(m1) is not base
+    assert reports.get_priority_report(m1).iloc[-1]["status"] == "c"
+
+def test_reports_as_of(task_list: list[dict]):
+    from datetime import timedelta
+    from tests.conftest import TODAY
+    m1 = TaskManager()
+    m1.ingest([task_list])
+    later = TODAY + timedelta(days=3)
+    assert len(reports.get_overdue_report(m1, as_of=later)) == 5
+    assert len(reports.get_overdue_report(task_list, as_of=later)) == 5
+    with pytest.raises(ValueError, match="Not enough data"):
+        reports.get_remaining_report(m1, as_of=later)
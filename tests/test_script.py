@@ -0,0 +1,62 @@
+"""
+
+Test CLI script runner.
+
+Unit tests for ScriptRunner: commands, errors and the single save at the end.
+"""
+
+import json
+from pathlib import Path
+from task_manager import TaskManager
+from task_manager.fileio import FileIO
+from ui.cli.script import ScriptRunner
+
+def load(manager: TaskManager, path: str) -> int:
+    return manager.ingest(FileIO.iter_import(Path(path).suffix, path))
+
+def runner(manager: TaskManager, saves: list[str], out: list[str]) -> ScriptRunner:
+    def save(manager: TaskManager, path: str) -> str:
+        saves.append(path)
+        return FileIO.export(Path(path).suffix, manager.iter_dicts(include_id=True), path)
+    return ScriptRunner(manager, load, save, out.append)
+
+def test_script_applies_commands_and_saves_once(tmp_path, task_list: list[dict]):
+    path = str(tmp_path / "tasks.json")
+    FileIO.export(".json", task_list, path)
+    m1, saves, out = TaskManager(), [], []
+    script = f"""
+        open {path}
+        add "New task" 2999-01-01 priority=1 description='with "quotes"'  # comment
+        edit 1 title=Renamed end=2999-02-02
+        status 2-3,6 inp
+        delete 4-5
+        save
+        view
+    """
+    assert runner(m1, saves, out).run(script.splitlines()) == 0
+    assert saves == [path]
+    rows = json.loads(Path(path).read_text(encoding="utf-8"))
+    assert [row["title"] for row in rows] == ["Renamed", task_list[1]["title"], task_list[2]["title"], "New task"]
+    assert rows[0]["period_end_date"] == "2999-02-02"
+    assert [row["status"] for row in rows] == ["ns", "inp", "inp", "inp"]
+    assert rows[3]["description"] == 'with "quotes"' and rows[3]["priority"] == 1
+    assert "4. New task" in "\n".join(str(line) for line in out)
+
+def test_script_stops_at_first_error_without_saving(tmp_path, task_list: list[dict]):
+    path = str(tmp_path / "tasks.json")
+    FileIO.export(".json", task_list, path)
+    m1, saves, out = TaskManager(), [], []
+    script = [f"open {path}", "delete 1", "save", "status 1 done", "add never 2999-01-01"]
+    assert runner(m1, saves, out).run(script) == 1
+    assert saves == [] and len(m1.tasks) == 4
+    assert out[-2].startswith("line 4:")
+    assert json.loads(Path(path).read_text(encoding="utf-8")) == json.loads(json.dumps(task_list))
+
+def test_script_rejects_bad_commands():
+    for line in ("frobnicate", "add only-title", "edit 1", "edit 1 colour=red", "save", "report weekly"):
+        m1, out = TaskManager(), []
+        m1.ingest([[{"title": "t", "period_start_date": "2020-01-01", "period_end_date": "2999-01-01",
+                     "priority": 3, "status": "ns", "description": ""}]])
+        assert runner(m1, [], out).run([line]) == 1, line
+        assert out[0].startswith("line 1:")
+    assert runner(TaskManager(), [], []).run(["add a 2999-01-01", "open x.json"]) == 1
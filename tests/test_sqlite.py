@@ -0,0 +1,145 @@
+"""
+
+Test SQLite backend.
+
+Unit tests for the .sqlite/.db FileIO handlers, SQLiteTaskStore and the
+SQL-backed reports.
+"""
+
+import pytest
+from datetime import timedelta
+from task_manager import TaskManager, Task, reports
+from task_manager.fileio import FileIO
+from task_manager.sqlite_store import SQLiteTaskStore
+from tests.conftest import TODAY
+
+
+def sqlite_manager(path, tasks: list[Task]) -> TaskManager:
+    m = TaskManager(store=SQLiteTaskStore(str(path)))
+    for task in tasks:
+        m.add_task(task)
+    return m
+
+@pytest.mark.parametrize("ext", [".sqlite", ".db"])
+def test_sqlite_round_trip(tmp_path, ext: str, task_list: list[dict]):
+    path = str(tmp_path / f"tasks{ext}")
+    assert FileIO.export(ext, task_list, path) == "Exported Successfully."
+    rows = FileIO.import_(ext, path)
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [{k: v for k, v in row.items() if k != "id"} for row in rows] == task_list
+
+def test_sqlite_import_missing_or_invalid(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FileIO.import_(".sqlite", str(tmp_path / "missing.sqlite"))
+    bad = tmp_path / "bad.db"
+    bad.write_text("not a database " * 100)
+    with pytest.raises(ValueError):
+        FileIO.import_(".db", str(bad))
+
+def test_sqlite_store_crud(tmp_path, sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    path = tmp_path / "tasks.sqlite"
+    m = sqlite_manager(path, [sample_task, complete_sample_task, overdue_task])
+    memory = TaskManager()
+    for task in (sample_task, complete_sample_task, overdue_task):
+        memory.add_task(task)
+    assert m.to_dict_list(include_id=True) == memory.to_dict_list(include_id=True)
+
+    m.tasks[0].marked_complete() # write-back through a built Task
+    assert m.get_task(1).status == "c"
+    m.delete_task(2)
+    assert m.task_id(2) == 3
+    m.update_task_by_id(3, sample_task)
+    assert m.tasks[1] == sample_task
+    with pytest.raises(ValueError):
+        m.get_task(2)
+
+    # Changes are committed as they happen
+    m.tasks.close()
+    reopened = TaskManager(store=SQLiteTaskStore(str(path)))
+    assert [task.title for task in reopened.tasks] == ["Sample Task", "Sample Task"]
+    assert reopened.tasks[0].status == "c"
+
+def test_sqlite_store_queries(tmp_path, sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    m = sqlite_manager(tmp_path / "tasks.db", [sample_task, complete_sample_task, overdue_task])
+    m.delete_task(1)
+    assert m.find_tasks(status="ns") == [1, 2]
+    assert m.find_tasks(priority=2) == [1]
+    assert m.tasks_ending_between(TODAY - timedelta(days=5), TODAY) == [2]
+    assert list(m.view_tasks(offset=1, limit=5)) == [f"2. {overdue_task}"]
+    assert [row["id"] for row in m.tasks.iter_records(include_id=True, start=0, stop=1)] == [2]
+
+def test_sqlite_store_batch_changes(tmp_path, sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    m = sqlite_manager(tmp_path / "tasks.db", [])
+    m.add_tasks([sample_task, complete_sample_task, overdue_task, sample_task])
+    assert m.delete_tasks([1, 3]) == "2 task(s) have been deleted successfully."
+    assert list(m.tasks) == [complete_sample_task, sample_task]
+    m.set_status([1, 2], "c")
+    assert m.find_tasks(status="c") == [1, 2]
+    m.update_tasks({2: overdue_task})
+    assert m.tasks[1] == overdue_task
+    with pytest.raises(ValueError):
+        m.delete_tasks([1, 3])
+    assert len(m.tasks) == 2
+
+def test_sqlite_store_listeners_and_dirty(tmp_path, sample_task: Task):
+    m = sqlite_manager(tmp_path / "tasks.db", [])
+    seen = []
+    m.subscribe(lambda op, task_id, row: seen.append((op, task_id)))
+    m.add_task(sample_task)
+    m.tasks[0].marked_complete()
+    m.delete_task(1)
+    assert seen == [("add", 1), ("update", 1), ("delete", 1)]
+    assert m.dirty
+
+@pytest.mark.parametrize("report", ["get_overdue_report", "get_priority_report", "get_remaining_report"])
+def test_sqlite_reports_match_pandas(tmp_path, task_list: list[dict], report: str):
+    m = TaskManager(store=SQLiteTaskStore(str(tmp_path / "tasks.sqlite")))
+    m.ingest([task_list])
+    expected = getattr(reports, report)(task_list)
+    actual = getattr(reports, report)(m)
+    assert actual.to_dict("records") == expected.to_dict("records")
+
+def test_sqlite_reports_errors(tmp_path, sample_task: Task):
+    m = TaskManager(store=SQLiteTaskStore(str(tmp_path / "tasks.sqlite")))
+    with pytest.raises(ValueError, match=TaskManager.EMPTY_MESSAGE):
+        reports.get_priority_report(m)
+    m.add_task(sample_task)
+    with pytest.raises(ValueError, match="Not enough data"):
+        reports.get_overdue_report(m)
+
+def test_sqlite_store_extend_records_validates(tmp_path, sample_task: Task):
+    m = sqlite_manager(tmp_path / "tasks.db", [])
+    row = dict(sample_task.to_dict(), status="In-Progress")
+    assert m.tasks.extend_records([row]) == 1 and m.tasks[0].status == "inp"
+    for bad in ({"priority": 9}, {"period_end_date": "2000-01-01"}, {"title": ""}):
+        with pytest.raises(ValueError):
+            m.tasks.extend_records([row, dict(row, **bad)])
+    assert len(m.tasks) == 1
+
+def test_sqlite_store_reads_and_writes_from_many_threads(tmp_path, sample_task: Task):
+    import threading
+    m = sqlite_manager(tmp_path / "tasks.db", [sample_task] * 50)
+    errors = []
+    def writer():
+        try:
+            for _ in range(500):
+                task_id = m.tasks.id_at(-1)
+                m.add_task(sample_task)
+                m.delete_task_by_id(task_id)
+        except Exception as e:
+            errors.append(e)
+    def reader():
+        try:
+            for _ in range(200):
+                assert len(m.tasks) in (50, 51)
+                assert len(list(m.tasks.snapshot().iter_records())) in (50, 51)
+                m.tasks.find(status="ns")
+                m.tasks[-1] # the count and the row it offsets into must agree
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
@@ -0,0 +1,83 @@
+"""
+
+Test hot-path instrumentation.
+
+Unit tests for stats: recording, percentiles, and the instrumented calls.
+"""
+
+import time
+import pytest
+from task_manager import Task, TaskManager, stats
+from task_manager.fileio import FileIO
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    stats.reset()
+    yield
+    stats.reset()
+
+def test_record_and_percentiles():
+    for ms in range(1, 101):
+        stats.record("op", ms / 1000, rows=2)
+    figures = stats.snapshot()["op"]
+    assert figures["calls"] == 100
+    assert figures["rows"] == 200
+    assert figures["total_ms"] == pytest.approx(5050)
+    assert figures["p50_ms"] == pytest.approx(51)
+    assert figures["p99_ms"] == pytest.approx(100)
+
+def test_samples_are_bounded():
+    for _ in range(stats.SAMPLES + 10):
+        stats.record("op", 0.001)
+    assert len(stats.metrics["op"].samples) == stats.SAMPLES
+    assert stats.snapshot()["op"]["calls"] == stats.SAMPLES + 10
+
+def test_measure_records_even_on_error():
+    with pytest.raises(ValueError):
+        with stats.measure("failing") as m:
+            m.rows = 3
+            raise ValueError
+    assert stats.snapshot()["failing"]["rows"] == 3
+
+def test_instrumented_hot_paths(tmp_path, sample_task: Task, task_list: list[dict]):
+    stats.reset() # task_list is built with add_task
+    m1 = TaskManager()
+    m1.add_task(sample_task)
+    m1.add_task(sample_task)
+    m1.delete_task(1)
+    assert len(list(m1.view_tasks())) == 1
+    Task.from_dict(task_list[0])
+    path = str(tmp_path / "tasks.json")
+    FileIO.export(".json", task_list, path)
+    FileIO.import_(".json", path)
+    figures = stats.snapshot()
+    assert figures["TaskManager.add_task"]["calls"] == 2
+    assert figures["TaskManager.delete_task"]["calls"] == 1
+    assert figures["TaskManager.view_tasks"]["rows"] == 1
+    assert figures["Task.from_dict"]["calls"] == 1
+    assert figures["FileIO.export"]["rows"] == len(task_list)
+    assert figures["FileIO.import_"]["rows"] == len(task_list)
+    assert "TaskManager.add_task" in stats.format_table()
+
+def test_format_table_when_empty():
+    assert stats.format_table() == "No operations recorded yet."
+
+def test_timed_records_even_on_error():
+    @stats.timed("failing_call")
+    def fail():
+        raise ValueError
+    with pytest.raises(ValueError):
+        fail()
+    assert stats.snapshot()["failing_call"]["calls"] == 1
+    assert stats.snapshot()["failing_call"]["rows"] == 0
+
+def test_view_tasks_times_rendering_not_the_caller(sample_task: Task):
+    m1 = TaskManager()
+    m1.add_tasks([sample_task] * 3)
+    for _ in m1.view_tasks():
+        time.sleep(0.05) # e.g. waiting at a paging prompt
+    figures = stats.snapshot()["TaskManager.view_tasks"]
+    assert figures["calls"] == 1 and figures["rows"] == 3
+    assert figures["total_ms"] < 50
+    next(m1.view_tasks()) # abandoned after one line: still one call
+    assert stats.snapshot()["TaskManager.view_tasks"]["calls"] == 2
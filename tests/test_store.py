@@ -0,0 +1,229 @@
+"""
+
+Test columnar task store.
+
+Unit tests for TaskStore: row round trip, deletes, serialization.
+"""
+
+import pytest
+from task_manager import Task
+from task_manager.store import TaskStore
+
+
+def test_store_round_trip(complete_sample_task: Task, sample_task: Task):
+    store = TaskStore([complete_sample_task, sample_task])
+    assert len(store) == 2
+    assert store[0] == complete_sample_task
+    assert store[-1] == sample_task
+    assert store == [complete_sample_task, sample_task]
+
+def test_store_built_task_writes_back_until_row_is_replaced(sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, overdue_task])
+    task = store[1]
+    task.marked_complete()
+    assert store[1].status == "c"
+    assert sample_task.status == "ns" # added Tasks are copied, not bound
+    del store[0]
+    task.mark_in_progress() # bound by id, so moving rows doesn't detach it
+    assert store[0].status == "inp"
+    store[0] = overdue_task
+    task.marked_complete() # row replaced, so the built Task is detached
+    assert store[0].status == "ns"
+
+def test_store_pop_shifts_rows(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task])
+    assert store.pop(1) == complete_sample_task
+    assert store == [sample_task, overdue_task]
+    store.clear()
+    assert store == []
+
+def test_store_to_dict_list_matches_task_to_dict(complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([complete_sample_task, overdue_task])
+    assert store.to_dict_list() == [complete_sample_task.to_dict(), overdue_task.to_dict()]
+
+def test_store_index_out_of_range_raises(sample_task: Task):
+    store = TaskStore([sample_task])
+    with pytest.raises(IndexError):
+        store[1]
+    with pytest.raises(IndexError):
+        del store[-2]
+
+def test_store_index_follows_writes(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task], indexed=True)
+    assert store.find(status="ns", priority=2) == [1]
+    store[1].marked_complete()
+    assert store.find(status="ns") == [0, 2]
+    assert store.find(status="c", priority=2) == [1]
+    del store[0]
+    assert store.find(status="c") == [0]
+    assert store.ending_between(overdue_task.period_end_date, complete_sample_task.period_end_date) == [1, 0]
+
+def test_store_ids_are_stable_across_deletes(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task])
+    assert list(store.ids) == [1, 2, 3]
+    assert store.remove(1) == sample_task
+    assert store.get(3) == overdue_task
+    assert store.id_at(0) == 2 # positions skip tombstones
+    assert store.position(3) == 1
+    with pytest.raises(ValueError, match="No task with id 1"):
+        store.get(1)
+    assert store.append(sample_task) == 4
+    with pytest.raises(ValueError, match="Duplicate task id"):
+        store.append(sample_task, 2)
+
+def test_store_compacts_tombstones(sample_task: Task):
+    store = TaskStore([sample_task] * (TaskStore.COMPACT_MIN * 3), indexed=True)
+    for task_id in range(1, TaskStore.COMPACT_MIN * 2 + 1):
+        store.remove(task_id)
+    assert len(store.ids) < TaskStore.COMPACT_MIN * 3 # compacted along the way
+    assert len(store) == TaskStore.COMPACT_MIN
+    assert store.find(status="ns") == list(range(len(store)))
+    assert store.to_dict_list(include_id=True)[0]["id"] == TaskStore.COMPACT_MIN * 2 + 1
+
+def test_store_columns_round_trip(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task])
+    store.remove(2)
+    copy = TaskStore(indexed=True)
+    assert copy.extend_columns(store.columns()) == 2
+    assert copy.to_dict_list(include_id=True) == store.to_dict_list(include_id=True)
+    assert copy.find(status="ns") == [0, 1]
+    columns = dict(store.columns(), id=[0, 0])
+    assert copy.extend_columns(columns) == 2 # 0 means "next free id"
+    assert list(copy.ids) == [1, 3, 4, 5]
+
+def test_store_extend_columns_rejects_bad_input(sample_task: Task):
+    store = TaskStore([sample_task])
+    columns = store.columns()
+    with pytest.raises(ValueError, match="Duplicate task id"):
+        store.extend_columns(columns)
+    with pytest.raises(ValueError, match="Invalid status"):
+        store.extend_columns(dict(columns, id=[0], status=[9]))
+    with pytest.raises(ValueError, match="Invalid value"):
+        store.extend_columns(dict(columns, id=[0], priority=[1000]))
+    with pytest.raises(ValueError, match="different lengths"):
+        store.extend_columns(dict(columns, id=[0, 0]))
+    assert len(store) == 1 and len(store.ids) == 1
+
+def test_store_snapshot_is_isolated_from_later_changes(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task])
+    del store[0]
+    snapshot = store.snapshot()
+    assert store.snapshot() is snapshot # cached until the next change
+    assert list(snapshot) == [complete_sample_task]
+    store.append(overdue_task) # appends don't copy the shared columns
+    store[0] = overdue_task # in-place changes do
+    store.pop(1)
+    assert list(snapshot) == [complete_sample_task]
+    assert snapshot.to_dict_list(include_id=True) == [{"id": 2, **complete_sample_task.to_dict()}]
+    assert snapshot.columns()["title"] == [complete_sample_task.title]
+    store.clear()
+    assert len(snapshot) == 1 and snapshot[0] == complete_sample_task
+    assert store.snapshot() is not snapshot and len(store.snapshot()) == 0
+    task = snapshot[0]
+    task.marked_complete() # detached copy
+    assert snapshot[0].status == "ns"
+
+def test_store_snapshot_pages(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task])
+    snapshot = store.snapshot()
+    assert snapshot.to_dict_list() == store.to_dict_list()
+    assert list(snapshot.iter_records(include_id=True, start=1, stop=2)) == [{"id": 2, **complete_sample_task.to_dict()}]
+    assert list(snapshot.iter_records(start=2, stop=10)) == [overdue_task.to_dict()]
+    assert snapshot[1:] == [complete_sample_task, overdue_task]
+
+def test_store_snapshot_skips_tombstones_without_compacting(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task, overdue_task, sample_task, complete_sample_task])
+    del store[3]
+    del store[0]
+    snapshot = store.snapshot()
+    assert len(store.ids) == 5 # still tombstoned: reading doesn't compact
+    live = [complete_sample_task, overdue_task, complete_sample_task]
+    assert list(snapshot) == live and len(snapshot) == 3
+    assert [snapshot[i] for i in range(-3, 3)] == live + live
+    assert snapshot[1:] == live[1:] and snapshot[::2] == live[::2]
+    assert list(snapshot.render(1)) == [str(overdue_task), str(complete_sample_task)]
+    assert [record["id"] for record in snapshot.iter_records(include_id=True, start=1)] == [3, 5]
+    assert snapshot.to_dict_list(include_id=True) == store.to_dict_list(include_id=True)
+    assert snapshot.columns() == store.columns()
+    del store[1] # the next tombstone doesn't reach the snapshot
+    assert list(snapshot) == live
+    assert [record["id"] for record in snapshot.iter_records(include_id=True)] == [2, 3, 5]
+
+def test_store_reuses_rendered_rows_until_they_change(sample_task: Task, complete_sample_task: Task):
+    store = TaskStore([sample_task, complete_sample_task])
+    first = list(store.snapshot().render())
+    assert first == [str(sample_task), str(complete_sample_task)]
+    assert store.rendered == first # memoized in the store
+    task = store[0]
+    task.marked_complete() # written back: only that row is rendered again
+    assert store.rendered[0] is None and store.rendered[1] is first[1]
+    assert list(store.snapshot().render()) == [str(task), first[1]]
+    del store[0]
+    assert list(store.snapshot().render()) == [first[1]]
+
+def test_store_batch_changes_leave_snapshots_alone(sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    store = TaskStore([sample_task, complete_sample_task], indexed=True)
+    assert store.extend([overdue_task, sample_task]) == [3, 4]
+    snapshot = store.snapshot()
+    assert [task.title for task in store.delete_positions([0, 2])] == [sample_task.title, overdue_task.title]
+    store.set_status([0], "inp")
+    store.replace_positions({1: overdue_task})
+    assert list(snapshot) == [sample_task, complete_sample_task, overdue_task, sample_task]
+    assert [store.id_at(i) for i in range(len(store))] == [2, 4]
+    assert store[0].status == "inp" and store[1] == overdue_task
+    assert store.find(status="inp") == [0]
+    with pytest.raises(IndexError):
+        store.delete_positions([0, 5])
+    assert len(store) == 2
+
+@pytest.mark.parametrize("bad", [
+    {"priority": 300}, {"priority": 9}, {"priority": "x"}, {"title": "  "}, {"title": None},
+    {"period_start_date": "2999-02-01", "period_end_date": "2999-01-01"}, {"id": -1}, {"status": "done"},
+])
+def test_store_extend_records_rejects_bad_rows_atomically(sample_task: Task, bad: dict):
+    store = TaskStore([sample_task])
+    good = {"title": "ok", "period_start_date": "2999-01-01", "period_end_date": "2999-01-02",
+            "priority": 3, "status": "ns", "description": ""}
+    before = (store.to_dict_list(include_id=True), store.version, store.slots)
+    with pytest.raises(ValueError):
+        store.extend_records([good, {**good, **bad}])
+    assert (store.to_dict_list(include_id=True), store.version, store.slots) == before
+    assert len(store.titles) == len(store.priorities) == len(store.ids)
+
+def test_store_extend_records_validates_untrusted_rows():
+    row = {"title": " Report ", "period_start_date": "2999-01-01", "period_end_date": "2999-01-02",
+           "priority": "2", "status": "completed", "description": None}
+    store = TaskStore()
+    assert store.extend_records([row]) == 1
+    assert store[0].title == "Report" and store[0].status == "c" and store[0].description == ""
+    with pytest.raises(ValueError, match="record #1"):
+        store.extend_records([dict(row, title=5)])
+    # Store-written rows skip the normalization, not the range checks
+    with pytest.raises(ValueError, match="Priority"):
+        store.extend_records([dict(row, status="c", priority=9)], trusted=True)
+    assert len(store) == 1
+
+def test_store_positions_skip_tombstones_without_compacting(sample_task: Task):
+    store = TaskStore([sample_task] * 40)
+    expected = list(range(1, 41)) # ids in position order
+    for position in (0, 5, 5, -1, 17, 3, 30, 0):
+        assert store.id_at(position) == expected[position]
+        store.pop(position)
+        del expected[position]
+    assert len(store.ids) == 40 # all tombstoned, nothing compacted yet
+    assert [store.id_at(i) for i in range(len(store))] == expected
+    assert [store.position(task_id) for task_id in expected] == list(range(len(expected)))
+    assert store[-1] == sample_task and store.id_at(-len(store)) == expected[0]
+    with pytest.raises(IndexError):
+        store.id_at(len(store))
+
+@pytest.mark.parametrize("bad", [
+    {"priority": [0]}, {"priority": [9]}, {"title": [" "]}, {"title": [5]}, {"description": [5]},
+    {"period_start_date": [0]}, {"period_end_date": [1]},
+])
+def test_store_extend_columns_validates(sample_task: Task, bad: dict):
+    store = TaskStore([sample_task])
+    columns = dict(store.columns(), id=[0])
+    with pytest.raises(ValueError):
+        store.extend_columns(dict(columns, **bad))
+    assert len(store) == 1 and len(store.ids) == 1
@@ -121,6 +121,19 @@ def test_str_includes_title_dates_priority_status_description_placeholder(sample
     assert "Not Started" in s
     assert "(No Description)" in s
 
+def test_str_is_cached_until_a_setter_runs(sample_task: Task):
+    first = str(sample_task)
+    assert str(sample_task) is first
+    for field, value in [
+        ("title", "Renamed"), ("description", "details"), ("priority", 1), ("status", "c"),
+        ("period_end_date", TODAY + timedelta(days=9)), ("period_start_date", TODAY - timedelta(days=1)),
+    ]:
+        before = str(sample_task)
+        setattr(sample_task, field, value)
+        assert str(sample_task) != before, field
+    expected = Task("Renamed", TODAY + timedelta(days=9), TODAY - timedelta(days=1), 1, "c", "details")
+    assert str(sample_task) == str(expected)
+
 # ---- Validation (title)----
 
 def test_str_contains_title():
@@ -224,3 +237,45 @@ def test_eq_special_method_results_notimplemented(sample_task: Task):
 def test_eq_operator_with_non_task_is_false(sample_task: Task):
     assert (sample_task == 123) is False
     assert (123 == sample_task) is False
+
+# ---- Slots and trusted construction ----
+
+def test_task_has_no_instance_dict(sample_task: Task):
+    assert not hasattr(sample_task, "__dict__")
+    with pytest.raises(AttributeError):
+        sample_task.unknown = 1
+
+def test_default_start_date_is_evaluated_per_call(monkeypatch):
+    import task_manager.task as task_module
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return date(2030, 1, 1)
+    monkeypatch.setattr(task_module, "date", FakeDate)
+    t = Task(title="Test", period_end_date=date(2030, 1, 2))
+    assert t.period_start_date == date(2030, 1, 1)
+
+def test_from_trusted_skips_validation_but_setters_still_validate():
+    t = Task.from_trusted("Test", TODAY + timedelta(days=1), TODAY, 2, "inp", None)
+    assert t == Task(title="Test", period_end_date=TODAY + timedelta(days=1), priority=2, status="inp")
+    assert t.description == ""
+    with pytest.raises(ValueError):
+        t.priority = 9
+    with pytest.raises(ValueError):
+        t.period_end_date = TODAY - timedelta(days=1)
+
+def test_from_dicts_matches_from_dict(complete_sample_task: Task, sample_task: Task):
+    records = [complete_sample_task.to_dict(), sample_task.to_dict()]
+    records[1]["priority"] = str(records[1]["priority"]) # as read from CSV
+    assert Task.from_dicts(records) == [Task.from_dict(r) for r in records]
+
+def test_validate_record_matches_from_dict(complete_sample_task: Task):
+    record = dict(complete_sample_task.to_dict(), title="  Padded  ", status="Completed", priority="2")
+    title, start, end, priority, status, description = Task.validate_record(record)
+    task = Task.from_dict(record)
+    assert (title, start, end, priority, status, description) == (
+        task.title, task.period_start_date, task.period_end_date, task.priority, task.status, task.description
+    )
+    for bad in ({"priority": 9}, {"period_end_date": "2000-01-01"}, {"period_start_date": "2025-13-01"}, {"title": " "}):
+        with pytest.raises(ValueError):
+            Task.validate_record(dict(record, **bad))
@@ -0,0 +1,83 @@
+"""
+
+Test task binary handler.
+
+Unit tests for FileIO: tmb section, and random access through TmbFile.
+"""
+import pytest
+from datetime import timedelta
+from task_manager.fileio import FileIO, tmb_io
+from task_manager import Task, TaskManager
+from tests.conftest import TODAY
+
+def test_tmb_round_trip(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.tmb"
+    massage = FileIO.export(".tmb", task_list, str(path))
+    assert "Exported" in massage
+    assert FileIO.import_(".tmb", str(path)) == task_list
+    assert [row for batch in FileIO.iter_import(".tmb", str(path), chunk_size=2) for row in batch] == task_list
+
+def test_tmb_keeps_ids_and_unicode(tmp_path, sample_task: Task):
+    m1 = TaskManager()
+    m1.add_task(Task(title="Zürich ✓", period_end_date=TODAY, description="日本語"))
+    m1.add_task(sample_task)
+    m1.delete_task(1)
+    m1.add_task(sample_task)
+    path = tmp_path / "tasks.tmb"
+    FileIO.export(".tmb", m1.iter_dicts(include_id=True), str(path))
+    m2 = TaskManager()
+    m2.ingest(FileIO.iter_import(".tmb", str(path)))
+    assert m2.to_dict_list(include_id=True) == m1.to_dict_list(include_id=True)
+
+    m3 = TaskManager()
+    m3.add_task(Task(title="Zürich ✓", period_end_date=TODAY, description="日本語"))
+    FileIO.export(".tmb", m3.iter_dicts(), str(path))
+    assert FileIO.import_(".tmb", str(path)) == m3.to_dict_list()
+
+def test_tmb_random_access_and_date_range(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.tmb"
+    FileIO.export(".tmb", task_list, str(path))
+    with tmb_io.TmbFile(str(path)) as file:
+        assert len(file) == len(task_list)
+        assert file[2] == task_list[2]
+        assert file[-1] == task_list[-1]
+        assert file[1:3] == task_list[1:3]
+        with pytest.raises(IndexError):
+            file[len(task_list)]
+        titles = [row["title"] for row in file.ending_between(TODAY - timedelta(days=3), TODAY + timedelta(days=1))]
+        assert titles == ["overdue_2", "overdue_1", "Test"]
+        assert list(file.ending_between(TODAY + timedelta(days=10), TODAY + timedelta(days=20))) == []
+
+def test_tmb_empty_export(tmp_path):
+    path = tmp_path / "empty.tmb"
+    FileIO.export(".tmb", [], str(path))
+    assert FileIO.import_(".tmb", str(path)) == []
+
+def test_tmb_bad_file_raises(tmp_path):
+    path = tmp_path / "bad.tmb"
+    path.write_bytes(b"not a task file at all, sorry")
+    with pytest.raises(ValueError, match="Not a task binary file"):
+        FileIO.import_(".tmb", str(path))
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="Not a task binary file"):
+        FileIO.import_(".tmb", str(path))
+    with pytest.raises(FileNotFoundError):
+        FileIO.import_(".tmb", str(tmp_path / "missing.tmb"))
+
+def test_tmb_corrupt_file_raises(tmp_path, task_list: list[dict]):
+    path = tmp_path / "tasks.tmb"
+    FileIO.export(".tmb", task_list, str(path))
+    good = path.read_bytes()
+    header = tmb_io.HEADER.unpack_from(good)
+    first = tmb_io.RECORD.unpack_from(good, tmb_io.HEADER.size)
+    def corrupt(data: bytes) -> None:
+        path.write_bytes(data)
+        with pytest.raises(ValueError, match="Corrupt .tmb file"):
+            FileIO.import_(".tmb", str(path))
+    corrupt(tmb_io.HEADER.pack(header[0], header[1] + 1000, *header[2:]) + good[tmb_io.HEADER.size:]) # count
+    corrupt(good[:header[3]]) # heap cut off: truncated file
+    for record in (
+        (*first[:6], 10**9, *first[7:]), # title runs past the end of the file
+        (*first[:2], 99, *first[3:]), # no such status
+    ):
+        corrupt(good[:tmb_io.HEADER.size] + tmb_io.RECORD.pack(*record) + good[tmb_io.HEADER.size + tmb_io.RECORD.size:])
@@ -0,0 +1,107 @@
+"""
+
+Test write-ahead log.
+
+Unit tests for WriteAheadLog: journaling, replay, compaction, crash recovery.
+"""
+
+import pytest
+from task_manager import TaskManager, Task
+from task_manager.wal import WriteAheadLog
+
+
+def reopen(path) -> TaskManager:
+    m = TaskManager()
+    WriteAheadLog.open(m, str(path), create=True).close()
+    return m
+
+@pytest.mark.parametrize("ext", [".csv", ".json", ".jsonl"])
+def test_wal_replays_changes_without_snapshot(tmp_path, ext: str, sample_task: Task, complete_sample_task: Task, overdue_task: Task):
+    path = tmp_path / f"tasks{ext}"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), create=True)
+    for task in (sample_task, complete_sample_task, overdue_task):
+        m1.add_task(task)
+    m1.tasks[0].marked_complete() # write-back through a built Task is journaled too
+    m1.delete_task(2)
+    assert wal.pending == 5
+    assert "journaled" in wal.sync()
+    # Simulate a crash: the snapshot was never rewritten, only the log has the changes
+    m2 = reopen(path)
+    assert m2.to_dict_list(include_id=True) == m1.to_dict_list(include_id=True)
+    assert m2.tasks[0].status == "c"
+
+def test_wal_compacts_every_n_entries(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.json"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), compact_every=3, create=True)
+    for _ in range(7):
+        m1.add_task(sample_task)
+    assert wal.pending == 1
+    assert len((tmp_path / "tasks.json.wal").read_text().splitlines()) == 1
+    assert len(reopen(path).tasks) == 7
+
+def test_wal_replay_is_idempotent_and_ignores_torn_tail(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.jsonl"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), create=True)
+    m1.add_task(sample_task)
+    m1.add_task(sample_task)
+    m1.delete_task(1)
+    wal.compact()
+    # Crash after the snapshot was replaced but before the log was emptied
+    wal_file = tmp_path / "tasks.jsonl.wal"
+    wal_file.write_text(
+        '{"op": "add", "id": 1, "task": null}\n'.replace("null", '{"title": "x", "period_start_date": "2030-01-01", "period_end_date": "2030-01-02", "priority": 3, "status": "ns", "description": ""}')
+        + '{"op": "delete", "id": 1, "task": null}\n'
+        + '{"op": "add", "id": 2, "task": {"title": "Sample Task", "period_start_date": "2030-01-01", "period_end_date": "2030-01-02", "priority": 1, "status": "ns", "description": ""}}\n'
+        + '{"op": "upd'
+    )
+    m2 = reopen(path)
+    assert m2.to_dict_list(include_id=True)[0]["id"] == 2
+    assert m2.tasks[0].priority == 1
+    assert len(m2.tasks) == 1
+
+@pytest.mark.parametrize("ext", [".json", ".jsonl"])
+def test_wal_empty_list_writes_empty_snapshot(tmp_path, ext: str, sample_task: Task):
+    path = tmp_path / f"tasks{ext}"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), create=True)
+    m1.add_task(sample_task)
+    m1.delete_task(1)
+    wal.close()
+    assert path.exists() and (tmp_path / f"tasks{ext}.wal").read_text() == ""
+    assert len(reopen(path).tasks) == 0
+
+def test_wal_empty_csv_keeps_snapshot_and_log(tmp_path, sample_task: Task):
+    path = tmp_path / "tasks.csv"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), create=True)
+    m1.add_task(sample_task)
+    wal.compact()
+    m1.delete_task(1)
+    with pytest.raises(ValueError, match="CSV"):
+        wal.compact()
+    assert "kept in the log" in wal.close()
+    assert path.exists() # never deleted
+    assert len(reopen(path).tasks) == 0 # the log still holds the delete
+
+def test_wal_open_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        WriteAheadLog.open(TaskManager(), str(tmp_path / "missing.json"))
+    assert not (tmp_path / "missing.json").exists()
+
+def test_wal_batch_crossing_compact_every(tmp_path):
+    path = tmp_path / "tasks.json"
+    m1 = TaskManager()
+    wal = WriteAheadLog.open(m1, str(path), compact_every=2, create=True)
+    m1.add_tasks(Task(f"T{i}", "2999-01-01") for i in range(1, 11))
+    m1.delete_tasks([1, 3, 5, 7]) # four journal entries in one store operation
+    titles = [task.title for task in m1.tasks]
+    assert titles == ["T2", "T4", "T6", "T8", "T9", "T10"]
+    assert wal.pending == 0 # compacted once the batch was over
+    m1.set_status([1, 2, 3], "c")
+    wal.close()
+    m2 = reopen(path)
+    assert [task.title for task in m2.tasks] == titles
+    assert [task.status for task in m2.tasks][:4] == ["c", "c", "c", "ns"]
@@ -0,0 +1,32 @@
+"""
+
+CLI task numbers.
+
+Parses the task numbers typed at a prompt or in a script: single numbers
+and inclusive ranges, comma separated ("3-40,55").
+"""
+
+def parse_numbers(text: str, maximum: int | None = None) -> list[int]:
+    """Task numbers from input like "3", "3-40" or "3-40,55" (ranges include both ends).
+
+    Ranges are checked against maximum before they're expanded.
+    """
+    numbers = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        try:
+            first = int(first)
+            last = int(last) if dash else first
+        except ValueError:
+            raise ValueError(f"Invalid number or range {part!r}: use e.g. 3 or 3-40,55.")
+        if first > last:
+            raise ValueError(f"Invalid range {part!r}: the first number must not be larger than the last.")
+        if maximum is not None and not (1 <= first and last <= maximum):
+            raise ValueError(f"Please enter numbers between 1 and {maximum}.")
+        numbers.extend(range(first, last + 1))
+    if not numbers:
+        raise ValueError("Please enter a valid number.")
+    return numbers
@@ -0,0 +1,149 @@
+"""
+
+CLI script runner.
+
+Runs Task Manager commands without prompts, one per line, for automation:
+python main.py run script.txt (or "-"/no file to read stdin). Arguments are
+inline and shell-quoted; task numbers are the numbers at the time the line
+runs and may be ranges like 3-40,55. The file is loaded once, every command
+is applied in memory (a .db/.sqlite file too: its rows are read into memory
+rather than edited in place), and the file is saved once at the end, only if
+every line succeeded.
+
+    open tasks.json
+    add "Write report" 2025-10-01 priority=1 description="Q3 numbers"
+    edit 3 title="New title" end=2025-11-01
+    status 3-40,55 c
+    delete 7
+    view
+    report overdue
+    save                  # or: save other.json
+"""
+
+import argparse
+import shlex
+import sys
+from collections.abc import Callable, Iterable
+from task_manager import Task, TaskManager, stats
+from .numbers import parse_numbers
+
+# key=value names for add/edit, mapped to Task fields
+FIELDS = {
+    "title": "title", "description": "description", "priority": "priority", "status": "status",
+    "start": "period_start_date", "end": "period_end_date",
+    "period_start_date": "period_start_date", "period_end_date": "period_end_date",
+}
+REPORTS = {"overdue": "get_overdue_report", "priority": "get_priority_report", "remaining": "get_remaining_report"}
+
+class ScriptRunner:
+    """Applies script commands to a TaskManager; load(manager, path) and save(manager, path) do the file I/O."""
+
+    def __init__(
+            self,
+            manager: TaskManager,
+            load: Callable[[TaskManager, str], int],
+            save: Callable[[TaskManager, str], str],
+            out: Callable[[str], None] = print,
+        ):
+        self.manager = manager
+        self.load = load
+        self.save = save
+        self.out = out
+        self.path = "" # the opened file
+        self.save_path: str | None = None # set by save, written once at the end
+
+    def run(self, lines: Iterable[str]) -> int:
+        """Run every line, then save if asked. Returns 0, or 1 after the first failing line (nothing saved)."""
+        for number, line in enumerate(lines, start=1):
+            try:
+                words = shlex.split(line, comments=True)
+                if words:
+                    self.execute(words)
+            except (ValueError, FileNotFoundError) as e:
+                self.out(f"line {number}: {e}")
+                self.out("Stopped; nothing was saved.")
+                return 1
+        if self.save_path is not None:
+            try:
+                self.out(self.save(self.manager, self.save_path))
+            except (FileNotFoundError, ValueError) as e:
+                self.out(f"Error: could not save to {self.save_path}: {e}")
+                return 1
+        return 0
+
+    def execute(self, words: list[str]) -> None:
+        """Run one command (already split into words)."""
+        command, args = words[0].lower(), words[1:]
+        manager = self.manager
+        match command, args:
+            case "open", [path]:
+                if self.path or manager.tasks or manager.version:
+                    raise ValueError("open must be the first command.")
+                self.out(f"{self.load(manager, path)} task(s) loaded.")
+                self.path = path
+            case "add", [title, end, *options]:
+                fields = {"title": title, "period_end_date": end, **self._fields(options)}
+                self.out(manager.add_task(Task(**fields)))
+            case "edit", [number, *options] if options:
+                number = manager.validate_index(number)
+                fields = manager.tasks[number - 1].to_dict()
+                fields.update(self._fields(options))
+                self.out(manager.update_task(number, Task(**fields)))
+            case "delete", [numbers]:
+                self.out(manager.delete_tasks(parse_numbers(numbers, len(manager.tasks))))
+            case "status", [numbers, status]:
+                self.out(manager.set_status(parse_numbers(numbers, len(manager.tasks)), status))
+            case "view", []:
+                try:
+                    for task in manager.view_tasks():
+                        self.out(task)
+                except ValueError as e: # an empty list is not a script error
+                    self.out(str(e))
+            case "report", [name] if name in REPORTS:
+                from task_manager import reports # pandas only loads for scripts that report
+                try:
+                    self.out(getattr(reports, REPORTS[name])(manager).to_string(index=False))
+                except ValueError as e:
+                    self.out(str(e))
+            case "stats", []:
+                self.out(stats.format_table())
+            case "save", [] | [_]:
+                path = args[0] if args else self.path
+                if not path:
+                    raise ValueError("save needs a file path (no file was opened).")
+                self.save_path = path
+            case _:
+                raise ValueError(f"Unknown command or wrong arguments: {shlex.join(words)}")
+
+    @staticmethod
+    def _fields(options: list[str]) -> dict:
+        """Task fields from key=value options."""
+        fields = {}
+        for option in options:
+            key, equals, value = option.partition("=")
+            if not equals or key.lower() not in FIELDS:
+                raise ValueError(f"Expected key=value with key one of {', '.join(FIELDS)}; got {option!r}.")
+            fields[FIELDS[key.lower()]] = value
+        return fields
+
+def main(
+        argv: list[str],
+        manager: TaskManager,
+        load: Callable[[TaskManager, str], int],
+        save: Callable[[TaskManager, str], str],
+    ) -> int:
+    """python main.py run [script|-] [--file PATH]"""
+    parser = argparse.ArgumentParser(prog="main.py run", description="Run Task Manager commands from a script.")
+    parser.add_argument("script", nargs="?", default="-", help="script file (default: stdin)")
+    parser.add_argument("--file", help="task file to open first (same as an 'open' line)")
+    args = parser.parse_args(argv)
+    runner = ScriptRunner(manager, load, save)
+    lines: Iterable[str] = [f"open {shlex.quote(args.file)}"] if args.file else []
+    if args.script == "-":
+        return runner.run([*lines, *sys.stdin])
+    try:
+        with open(args.script, encoding="utf-8") as file:
+            return runner.run([*lines, *file])
+    except FileNotFoundError:
+        print(f"Error: No such script {args.script}.")
+        return 1
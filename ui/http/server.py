@@ -0,0 +1,213 @@
+"""
+
+HTTP/JSON service.
+
+Serves one in-memory TaskManager to many concurrent clients with the
+stdlib ThreadingHTTPServer (a thread per connection, keep-alive on).
+Every change goes through the store's lock and listings read a store
+snapshot, so clients never see a half written row.
+
+    GET    /tasks?offset=0&limit=50   page of tasks (with ids) and the total
+    POST   /tasks                     add a task from a JSON object
+    GET    /tasks/<id>                one task
+    PUT    /tasks/<id>                change some or all fields of a task
+    DELETE /tasks/<id>                delete a task
+    GET    /reports/<name>            overdue, priority or remaining report rows
+    GET    /stats                     hot-path instrumentation figures
+
+A file loaded at startup is saved back on shutdown (Ctrl+C) if the API
+changed anything.
+"""
+
+import argparse
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from task_manager import Task, TaskManager, stats
+from task_manager.fileio import FileIO
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+REPORTS = {
+    "overdue": "get_overdue_report",
+    "priority": "get_priority_report",
+    "remaining": "get_remaining_report",
+}
+# JSON types each task field may have
+FIELD_TYPES = {
+    "title": str, "period_start_date": str, "period_end_date": str,
+    "priority": (int, str), "status": str, "description": str,
+}
+
+class TaskServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that carries the TaskManager its handlers work on."""
+    daemon_threads = True
+    request_queue_size = 128 # the default 5 drops SYNs when many clients connect at once
+
+    def __init__(self, address: tuple[str, int], manager: TaskManager):
+        super().__init__(address, TaskHandler)
+        self.manager = manager
+
+class TaskHandler(BaseHTTPRequestHandler):
+    """Routes one request to the server's TaskManager and answers in JSON."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True # headers and body are separate writes; don't wait on delayed ACKs
+    server: TaskServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass # one line per request would dominate the cost under load
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        try:
+            body = self._body() if method in ("POST", "PUT") else None
+            match (method, parts):
+                case ("GET", ["tasks"]):
+                    self._send(HTTPStatus.OK, self._page(parse_qs(url.query)))
+                case ("POST", ["tasks"]):
+                    self._send(HTTPStatus.CREATED, self._add(body))
+                case ("GET", ["tasks", task_id]):
+                    self._send(HTTPStatus.OK, self._get(task_id))
+                case ("PUT", ["tasks", task_id]):
+                    self._send(HTTPStatus.OK, self._update(task_id, body))
+                case ("DELETE", ["tasks", task_id]):
+                    self._send(HTTPStatus.OK, {"message": self.server.manager.delete_task_by_id(task_id)})
+                case ("GET", ["reports", name]) if name in REPORTS:
+                    self._send(HTTPStatus.OK, self._report(name))
+                case ("GET", ["stats"]):
+                    self._send(HTTPStatus.OK, stats.snapshot())
+                case _:
+                    self._send(HTTPStatus.NOT_FOUND, {"error": "No such endpoint."})
+        except ValueError as e:
+            status = HTTPStatus.NOT_FOUND if str(e).startswith("No task with id") else HTTPStatus.BAD_REQUEST
+            self._send(status, {"error": str(e)})
+        except (TypeError, AttributeError) as e: # a JSON value of the wrong type
+            self._send(HTTPStatus.BAD_REQUEST, {"error": f"Invalid value: {e}"})
+        except ConnectionError:
+            raise # the client is gone; nothing to answer
+        except Exception as e: # answer rather than drop the connection
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Internal error: {type(e).__name__}"})
+
+# ---- Endpoints ----
+
+    def _page(self, query: dict[str, list[str]]) -> dict:
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(DEFAULT_LIMIT)])[0])
+        except ValueError:
+            raise ValueError("offset and limit must be numbers.")
+        if offset < 0 or not (1 <= limit <= MAX_LIMIT):
+            raise ValueError(f"offset must be >= 0 and limit between 1 and {MAX_LIMIT}.")
+        tasks = self.server.manager.tasks.snapshot() # consistent, and writers don't wait for it
+        rows = list(tasks.iter_records(include_id=True, start=offset, stop=offset + limit))
+        return {"total": len(tasks), "offset": offset, "limit": limit, "tasks": rows}
+
+    def _get(self, task_id: str) -> dict:
+        manager = self.server.manager
+        with manager.tasks.lock:
+            task_id = manager.validate_id(task_id)
+            return {"id": task_id, **manager.get_task(task_id).to_dict()}
+
+    def _add(self, body: dict) -> dict:
+        task = _task(body)
+        manager = self.server.manager
+        with manager.tasks.lock: # the new id is the one just added
+            message = manager.add_task(task, body.get("id"))
+            task_id = body.get("id") or manager.tasks.id_at(-1)
+        return {"id": int(task_id), "message": message}
+
+    def _update(self, task_id: str, body: dict) -> dict:
+        manager = self.server.manager
+        with manager.tasks.lock: # read-modify-write of one task
+            task_id = manager.validate_id(task_id)
+            fields = manager.get_task(task_id).to_dict()
+            fields.update((key, value) for key, value in body.items() if key in Task.FIELDS)
+            message = manager.update_task_by_id(task_id, _task(fields))
+        return {"id": task_id, "message": message}
+
+    def _report(self, name: str) -> list[dict]:
+        from task_manager import reports # pandas only loads for the first report
+        df = getattr(reports, REPORTS[name])(self.server.manager)
+        return json.loads(df.to_json(orient="records"))
+
+# ---- Helpers ----
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ValueError("Expected a JSON object.")
+        return body
+
+    def _send(self, status: HTTPStatus, payload: object) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def _task(fields: dict) -> Task:
+    """Validated Task from a request's JSON fields."""
+    if "title" not in fields or "period_end_date" not in fields:
+        raise ValueError("title and period_end_date are required.")
+    values = {key: fields[key] for key in Task.FIELDS if fields.get(key) is not None}
+    for key, value in values.items():
+        if not isinstance(value, FIELD_TYPES[key]) or isinstance(value, bool):
+            raise ValueError(f"Invalid type for {key}: {type(value).__name__}.")
+    try:
+        return Task(**values)
+    except (TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid field: {e}")
+
+def make_server(manager: TaskManager, host: str = "127.0.0.1", port: int = 8000) -> TaskServer:
+    """A server bound to host:port (port 0 picks a free one); call serve_forever() to run it."""
+    return TaskServer((host, port), manager)
+
+def main(argv: list[str] | None = None, manager: TaskManager | None = None) -> int:
+    """python main.py serve [file] [--host H] [--port P]"""
+    parser = argparse.ArgumentParser(prog="main.py serve", description="Serve a task list over HTTP/JSON.")
+    parser.add_argument("path", nargs="?", help="task file to load first")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    manager = TaskManager() if manager is None else manager
+    if args.path:
+        print(f"{manager.ingest(FileIO.iter_import(Path(args.path).suffix, args.path))} task(s) loaded.")
+        manager.mark_saved(args.path)
+    server = make_server(manager, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    if args.path and manager.dirty:
+        print(save(manager, args.path))
+    return 0
+
+def save(manager: TaskManager, path: str) -> str:
+    """Write the manager's tasks (with ids) back to path."""
+    rows, point = manager.snapshot(include_id=True)
+    message = FileIO.export(Path(path).suffix, rows, path)
+    manager.mark_saved(path, point)
+    return message